@@ -17,6 +17,8 @@ Compare against the baseline (fail on slowdown >20%%)::
 
 from __future__ import annotations
 
+import tracemalloc
+
 import cellpy
 from cellpy.readers import cellreader
 
@@ -75,6 +77,36 @@ def test_benchmark_v8_cellpy_file_load(benchmark):
     benchmark.pedantic(run, iterations=1, warmup_rounds=1)
 
 
+@pytest.mark.parametrize("workers", [1, None], ids=["serial", "threaded"])
+def test_benchmark_v9_cellpy_file_save(benchmark, pipeline_cell, tmp_path, workers):
+    """Write a pre-built cell as a v9 cellpy-file (tables encoded serially / in threads)."""
+    from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
+
+    outfile = tmp_path / "bench.cellpy"
+
+    def run():
+        cellpy_file_v9.save(pipeline_cell.data, outfile, workers=workers)
+        assert outfile.is_file()
+
+    benchmark.pedantic(run, iterations=1, rounds=3, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("profile", ["fast", "balanced", "archive"])
+def test_benchmark_v9_cellpy_file_save_profiles(benchmark, pipeline_cell, tmp_path, profile):
+    """Write a pre-built cell with each compression profile; file size in ``extra_info``."""
+    from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
+
+    outfile = tmp_path / f"bench_{profile}.cellpy"
+
+    def run():
+        cellpy_file_v9.save(pipeline_cell.data, outfile, compression=profile)
+        assert outfile.is_file()
+
+    benchmark.pedantic(run, iterations=1, rounds=3, warmup_rounds=1)
+    benchmark.extra_info["file_size_bytes"] = outfile.stat().st_size
+    benchmark.extra_info["raw_rows"] = len(pipeline_cell.data.raw)
+
+
 def test_benchmark_get_cap_all_cycles(benchmark, pipeline_cell):
     """``get_cap`` over all cycles on a pre-built cell."""
 
@@ -85,8 +117,14 @@ def test_benchmark_get_cap_all_cycles(benchmark, pipeline_cell):
     benchmark.pedantic(run, iterations=1, warmup_rounds=0)
 
 
-def test_benchmark_peak_rss_kib(benchmark):
-    """Record peak RSS (Linux only); informational — not gated by the slowdown compare."""
+def test_benchmark_peak_rss_kib(benchmark, pipeline_cell):
+    """Record peak RSS (Linux only); informational — not gated by the slowdown compare.
+
+    Also records the traced peak of ``make_summary(create_copy=True)`` on a
+    pre-built cell (``summary_copy_peak_kib``) next to the size of its raw
+    frame: the summary copy shares raw instead of duplicating it, so the peak
+    should stay well below ``raw_kib``.
+    """
     if peak_rss_kib() is None:
         pytest.skip("peak RSS sampling is only recorded on Linux")
 
@@ -97,3 +135,14 @@ def test_benchmark_peak_rss_kib(benchmark):
     rss = benchmark.pedantic(run, iterations=1, warmup_rounds=0)
     benchmark.extra_info["peak_rss_kib"] = rss
     assert rss is not None and rss > 0
+
+    tracemalloc.start()
+    try:
+        pipeline_cell.make_summary(create_copy=True)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["summary_copy_peak_kib"] = peak // 1024
+    benchmark.extra_info["raw_kib"] = (
+        int(pipeline_cell.data.raw.memory_usage(deep=True).sum()) // 1024
+    )
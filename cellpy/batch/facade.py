@@ -300,6 +300,42 @@ class Batch:
         )
         return _persist_cells(self, target, force_rewrite=True)
 
+    def export_dataset(self, destination: Path | str) -> Path:
+        """Save the loaded cells into one partitioned parquet dataset store.
+
+        Each cell is written under its journal label (see
+        ``cellpy.readers.cellpy_file.dataset``); cells already in the store are
+        replaced. The store is then queried across cells with
+        ``dataset.scan(destination, "summary")`` (a polars lazy frame with a
+        ``cell`` column), and single cells are loaded back with
+        ``cellpy.get(destination, label=...)``. Unloaded cells raise
+        ``ValueError`` — call :meth:`update` first.
+
+        Args:
+            destination: root directory of the store (created if needed).
+
+        Returns:
+            Path of the store.
+        """
+        unloaded = [
+            label for label in self.cell_names if not self.cells.is_loaded(label)
+        ]
+        if unloaded:
+            raise ValueError(
+                "export_dataset requires loaded cells; not loaded: "
+                f"{unloaded}. Call Batch.update() first."
+            )
+        root = Path(destination)
+        root.mkdir(parents=True, exist_ok=True)
+        for label in self.cell_names:
+            _log.info("saving %s -> dataset %s", label, root)
+            emit("save", label=label)
+            self.cells[label].save(
+                root, overwrite=True, cellpy_file_format="dataset", label=label
+            )
+            emit("save", label=label, n=1, total_n=1)
+        return root
+
     def create_journal(self, **kwargs) -> Journal:
         """Populate the journal from the configured database (if any).
 
@@ -587,7 +623,9 @@ def _persist_cells(
 
     Cells already loaded from an on-disk ``.cellpy`` are not rewritten unless
     ``policy.source`` is ``NEWEST`` or ``policy.recalc`` is set, or
-    ``force_rewrite`` is True (used by :meth:`Batch.export_project`).
+    ``force_rewrite`` is True (used by :meth:`Batch.export_project`). Unless
+    ``force_rewrite`` is set, a ``.cellpy`` file whose stored content digests
+    match the cell is not rewritten either.
     """
     if _CELLPY_FILE_COL not in batch.pages.columns:
         defaults = [_default_cellpy_path(lbl).as_posix() for lbl in batch.cell_names]
@@ -611,7 +649,10 @@ def _persist_cells(
         if do_save:
             _log.info("saving %s -> %s", label, dest)
             emit("save", label=label)
-            batch.cells[label].save(dest, overwrite=True)
+            # a recalc often reproduces the file exactly - leave it alone then
+            batch.cells[label].save(
+                dest, overwrite=True, skip_unchanged=not force_rewrite
+            )
             emit("save", label=label, n=1, total_n=1)
         else:
             _log.debug("skip save (already from cellpy or not loaded): %s", label)
@@ -158,7 +158,7 @@ def _dispatch_lite(spec: CellSpec, policy: LoadPolicy, bad: frozenset) -> CellRe
     if result.ok and result.cell is not None and result.source == "raw":
         dest = _cellpy_dest(spec)
         dest.parent.mkdir(parents=True, exist_ok=True)
-        result.cell.save(dest, overwrite=True)
+        result.cell.save(dest, overwrite=True, skip_unchanged=True)
         emit("save", label=spec.label, n=1, total_n=1)
     return _strip_cell(result)
 
@@ -0,0 +1,27 @@
+"""cellpy.catalog -- one index over a whole tree of cellpy-files.
+
+A catalog is a directory with three parquet tables gathered from every
+cellpy-file (v9 and HDF5) under a root directory: the cell metadata, the
+summaries and the raw-file ids. Fleet-wide questions ("which cells have more
+than 500 cycles and a coulombic efficiency below 99 %?") are answered with
+polars on the index, without opening the cell files. Refreshing the catalog
+only re-reads files whose size or modification time changed.
+"""
+
+from __future__ import annotations
+
+from cellpy.catalog.index import (
+    CELLS_TABLE,
+    FIDS_TABLE,
+    SUMMARY_TABLE,
+    Catalog,
+    RefreshReport,
+)
+
+__all__ = [
+    "CELLS_TABLE",
+    "FIDS_TABLE",
+    "SUMMARY_TABLE",
+    "Catalog",
+    "RefreshReport",
+]
@@ -0,0 +1,287 @@
+"""Build, refresh and query a catalog of cellpy-files.
+
+The catalog directory holds one parquet file per table:
+
+- ``cells.parquet``: one row per cellpy-file with its path, size and
+  modification time, the number of cycles, the scalar cell and test metadata
+  (``material``, ``mass``, ``cell_name``, ``cycle_mode``, ...) and the full
+  metadata document as JSON (``meta_json``).
+- ``summary.parquet``: the summary rows of every file (native column names)
+  with a ``path`` column.
+- ``fids.parquet``: the raw-file ids of every file with a ``path`` column.
+
+Example:
+    >>> import polars as pl
+    >>> from cellpy.catalog import Catalog
+    >>> catalog = Catalog("my_catalog")
+    >>> catalog.refresh("data/cellpyfiles")
+    >>> last_ce = catalog.summary.group_by("path").agg(
+    ...     pl.col("coulombic_efficiency").sort_by("cycle_num").last()
+    ... )
+    >>> (
+    ...     catalog.cells.filter(pl.col("cycles") > 500)
+    ...     .join(last_ce, on="path")
+    ...     .filter(pl.col("coulombic_efficiency") < 99.0)
+    ...     .select("path", "cell_name", "cycles", "coulombic_efficiency")
+    ...     .collect()
+    ... )
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Union
+
+import polars as pl
+from cellpycore.config import default_schema
+
+from cellpy.readers.cellpy_file import fids as cellpy_file_fids
+from cellpy.readers.cellpy_file import meta_archive
+from cellpy.readers.cellpy_file import read as cellpy_file_read
+from cellpy.readers.cellpy_file import translate as cellpy_file_translate
+from cellpy.readers.cellpy_file.atomic import atomic_write
+
+_module_logger = logging.getLogger(__name__)
+
+PathLike = Union[str, os.PathLike]
+
+CELLS_TABLE = "cells"
+SUMMARY_TABLE = "summary"
+FIDS_TABLE = "fids"
+_TABLES = (CELLS_TABLE, SUMMARY_TABLE, FIDS_TABLE)
+
+PATH_COLUMN = "path"
+SIZE_COLUMN = "file_size"
+MTIME_COLUMN = "file_mtime_ns"
+
+DEFAULT_PATTERNS = ("*.cellpy", "*.h5", "*.hdf5")
+
+
+@dataclass
+class RefreshReport:
+    """What a ``Catalog.refresh`` did (lists of cellpy-file paths)."""
+
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+class Catalog:
+    """Parquet index over the cellpy-files in a directory tree.
+
+    Args:
+        location: directory holding the catalog tables (created on the first
+            ``refresh``).
+    """
+
+    def __init__(self, location: PathLike):
+        self.location = Path(location)
+
+    def __repr__(self):
+        return f"Catalog({str(self.location)!r})"
+
+    def table_path(self, table: str) -> Path:
+        if table not in _TABLES:
+            raise ValueError(
+                f"Unknown catalog table {table!r}; choose from {_TABLES}"
+            )
+        return self.location / f"{table}.parquet"
+
+    def scan(self, table: str = CELLS_TABLE) -> pl.LazyFrame:
+        """Lazy polars frame over one of the catalog tables."""
+        path = self.table_path(table)
+        if not path.is_file():
+            raise FileNotFoundError(
+                f"{self} has no {table} table yet - run Catalog.refresh first"
+            )
+        return pl.scan_parquet(path)
+
+    @property
+    def cells(self) -> pl.LazyFrame:
+        return self.scan(CELLS_TABLE)
+
+    @property
+    def summary(self) -> pl.LazyFrame:
+        return self.scan(SUMMARY_TABLE)
+
+    @property
+    def fids(self) -> pl.LazyFrame:
+        return self.scan(FIDS_TABLE)
+
+    def refresh(
+        self,
+        root: PathLike,
+        patterns: Iterable[str] = DEFAULT_PATTERNS,
+        recursive: bool = True,
+    ) -> RefreshReport:
+        """Bring the catalog up to date with the cellpy-files under ``root``.
+
+        Files already in the catalog with the same size and modification time
+        are not opened. New and changed files are read (metadata, fid table and
+        summary only), and files that are gone are dropped. Files that can not
+        be read as cellpy-files (e.g. raw ``.h5`` exports) are skipped and
+        listed in ``RefreshReport.failed``; a file already in the catalog keeps
+        its previous rows until it can be read again.
+
+        Args:
+            root: directory to scan.
+            patterns: glob patterns of the files to index.
+            recursive: also scan sub-directories.
+
+        Returns:
+            RefreshReport
+        """
+        report = RefreshReport()
+        found = _find_files(Path(root), patterns, recursive)
+        known = self._known_files()
+
+        fresh_cells, fresh_summaries, fresh_fids = [], [], []
+        for path, (size, mtime_ns) in found.items():
+            if known.get(path) == (size, mtime_ns):
+                report.unchanged.append(path)
+                continue
+            try:
+                cell, summary, fids = _index_file(Path(path))
+            except Exception as e:
+                _module_logger.warning(f"could not index {path}: {e}")
+                report.failed.append(path)
+                continue
+            cell = {
+                PATH_COLUMN: path,
+                SIZE_COLUMN: size,
+                MTIME_COLUMN: mtime_ns,
+                **cell,
+            }
+            fresh_cells.append(pl.DataFrame([cell]))
+            fresh_summaries.append(_with_path(summary, path))
+            fresh_fids.append(_with_path(fids, path))
+            (report.updated if path in known else report.added).append(path)
+        report.removed = sorted(set(known) - set(found))
+
+        if not report.changed and all(self.table_path(t).is_file() for t in _TABLES):
+            return report
+
+        # a known file that fails to index keeps its previous rows (and its
+        # old size and mtime, so the next refresh tries it again)
+        keep = report.unchanged + [path for path in report.failed if path in known]
+        for table, fresh in (
+            (CELLS_TABLE, fresh_cells),
+            (SUMMARY_TABLE, fresh_summaries),
+            (FIDS_TABLE, fresh_fids),
+        ):
+            frames = [self._kept_rows(table, keep)] if known else []
+            frames.extend(fresh)
+            self._write(table, _concat(frames))
+        _module_logger.info(
+            f"catalog {self.location}: {len(report.added)} added, "
+            f"{len(report.updated)} updated, {len(report.removed)} removed"
+        )
+        return report
+
+    def _known_files(self) -> dict[str, tuple[int, int]]:
+        path = self.table_path(CELLS_TABLE)
+        if not path.is_file():
+            return {}
+        known = pl.read_parquet(
+            path, columns=[PATH_COLUMN, SIZE_COLUMN, MTIME_COLUMN]
+        )
+        return {row[0]: (row[1], row[2]) for row in known.iter_rows()}
+
+    def _kept_rows(self, table: str, paths: list[str]) -> pl.DataFrame:
+        path = self.table_path(table)
+        if not path.is_file():
+            return pl.DataFrame()
+        return (
+            pl.scan_parquet(path).filter(pl.col(PATH_COLUMN).is_in(paths)).collect()
+        )
+
+    def _write(self, table: str, frame: pl.DataFrame) -> None:
+        with atomic_write(self.table_path(table)) as staged:
+            frame.write_parquet(staged)
+
+
+def _find_files(
+    root: Path, patterns: Iterable[str], recursive: bool
+) -> dict[str, tuple[int, int]]:
+    """Absolute posix path -> (size, mtime in ns) of the files to index."""
+    if not root.is_dir():
+        raise NotADirectoryError(f"Not a directory: {root}")
+    found = {}
+    for pattern in patterns:
+        candidates = root.rglob(pattern) if recursive else root.glob(pattern)
+        for candidate in candidates:
+            if not candidate.is_file():
+                continue
+            stat = candidate.stat()
+            found[candidate.resolve().as_posix()] = (
+                stat.st_size,
+                stat.st_mtime_ns,
+            )
+    return dict(sorted(found.items()))
+
+
+def _index_file(path: Path) -> tuple[dict[str, Any], pl.DataFrame, pl.DataFrame]:
+    """Catalog row, summary and fid table of one cellpy-file."""
+    meta = meta_archive.read_meta(path)
+    data = cellpy_file_read.load(path, tables=(SUMMARY_TABLE,)).data
+    cellpy_file_translate.to_native(data)
+    summary = data.summary
+    cycle_col = default_schema().cycle.cycle_num
+
+    cell: dict[str, Any] = {
+        "cellpy_file_version": int(meta.get("cellpy_file_version") or 0),
+        "cycles": len(summary),
+        "last_cycle": (
+            int(summary[cycle_col].max())
+            if cycle_col in summary.columns and len(summary)
+            else None
+        ),
+    }
+    tests = meta.get("tests") or {}
+    test = tests.get("0") or next(iter(tests.values()), {})
+    for source in (meta.get("cell") or {}, test):
+        for key, value in source.items():
+            if key not in cell and key != PATH_COLUMN and _is_scalar(value):
+                cell[key] = value
+    cell["meta_json"] = json.dumps(meta, default=str)
+
+    fids = pl.DataFrame()
+    if data.raw_data_files:
+        fids = pl.DataFrame(cellpy_file_fids.convert2fid_table(data), strict=False)
+    return cell, _to_polars(summary), fids
+
+
+def _is_scalar(value) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _to_polars(frame) -> pl.DataFrame:
+    if frame is None or not len(frame.columns):
+        return pl.DataFrame()
+    objects = frame.select_dtypes(include="object").columns
+    if len(objects):
+        frame = frame.astype({c: "string" for c in objects})
+    return pl.from_pandas(frame.reset_index(drop=True))
+
+
+def _with_path(frame: pl.DataFrame, path: str) -> pl.DataFrame:
+    if not frame.width:
+        return frame
+    return frame.select(pl.lit(path).alias(PATH_COLUMN), pl.all())
+
+
+def _concat(frames: list[pl.DataFrame]) -> pl.DataFrame:
+    frames = [f for f in frames if f.width]
+    if not frames:
+        return pl.DataFrame({PATH_COLUMN: []}, schema={PATH_COLUMN: pl.String})
+    return pl.concat(frames, how="diagonal_relaxed")
@@ -649,8 +649,8 @@ cli.add_typer(setup_app, name="setup")
 
 @cli.command()
 def convert(
-    old_h5: Annotated[Path, typer.Argument(exists=True, dir_okay=False)],
-    new_h5: Annotated[Optional[Path], typer.Argument(dir_okay=False)] = None,
+    old_h5: Annotated[Path, typer.Argument(exists=True)],
+    new_h5: Annotated[Optional[Path], typer.Argument()] = None,
     to: Annotated[
         Optional[str],
         typer.Option(
@@ -659,8 +659,44 @@ def convert(
             "HDF5). Inferred from NEW_H5's suffix when not given, else v9.",
         ),
     ] = None,
+    recursive: Annotated[
+        bool,
+        typer.Option(
+            "--recursive",
+            "-r",
+            help="OLD_H5 is a directory: convert every .h5/.hdf5 file below it "
+            "(NEW_H5, if given, is the directory to write the converted tree to).",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Worker processes for --recursive (0: one per CPU).",
+        ),
+    ] = 1,
+    report: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--report",
+            help="Where --recursive writes its JSON report "
+            f"(default: {cli_api.CONVERT_REPORT_NAME} in OLD_H5).",
+        ),
+    ] = None,
 ):
-    """Upgrade a legacy cellpy-file to a current on-disk format."""
+    """Upgrade legacy cellpy-files to a current on-disk format."""
+    if old_h5.is_dir() != recursive:
+        kind = "a directory" if old_h5.is_dir() else "not a directory"
+        cli_ui.current().fail(
+            "convert",
+            f"{old_h5} is {kind}",
+            hint="use --recursive (-r) with a directory, and only then",
+        )
+        raise typer.Exit(code=2)
+    if recursive:
+        _convert_tree(old_h5, new_h5, to=to, jobs=jobs, report=report)
+        return
     try:
         cli_api.convert(old_h5, new_h5, to=to, echo=_echo())
     except ValueError as exc:
@@ -669,5 +705,24 @@ def convert(
         raise typer.Exit(code=2)
 
 
+def _convert_tree(root, destination, *, to, jobs, report) -> None:
+    try:
+        result = cli_api.convert_tree(
+            root,
+            destination,
+            to=to or "v9",
+            jobs=jobs,
+            report=report or root / cli_api.CONVERT_REPORT_NAME,
+            echo=_echo(),
+        )
+    except ValueError as exc:
+        cli_ui.current().fail("convert", str(exc))
+        raise typer.Exit(code=2)
+    for record in result.failed:
+        cli_ui.current().fail(record.source, record.message)
+    if result.failed:
+        raise typer.Exit(code=1)
+
+
 if __name__ == "__main__":
     cli_api.show_info(check=True, echo=_echo())
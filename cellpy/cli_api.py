@@ -191,11 +191,6 @@ def convert(
         destination) for the old format.
     """
     say = _resolve_echo(echo)
-
-    from cellpy.readers.cellpy_file import load as cellpy_file_load
-    from cellpy.readers.cellpy_file import save as cellpy_file_save
-    from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
-
     old_path = pathlib.Path(source)
 
     if to is None:
@@ -207,20 +202,39 @@ def convert(
         else:
             target = "v9"
     else:
-        target = to.lower().strip()
+        target = _check_target(to)
+
+    if destination is None:
+        new_path = _converted_name(old_path, target)
+    else:
+        new_path = pathlib.Path(destination)
+
+    _convert_file(old_path, new_path, target, say)
+    say(f"[cellpy] (convert) done: {new_path}")
+    return new_path
 
+
+def _check_target(to: str) -> str:
+    target = to.lower().strip()
     if target not in CONVERT_TARGETS:
         raise ValueError(
             f"unknown conversion target {to!r}; expected one of "
             f"{', '.join(CONVERT_TARGETS)}"
         )
+    return target
 
-    if destination is None:
-        new_path = old_path.with_name(
-            f"{old_path.stem}_{target}{_TARGET_SUFFIX[target]}"
-        )
-    else:
-        new_path = pathlib.Path(destination)
+
+def _converted_name(old_path: pathlib.Path, target: str) -> pathlib.Path:
+    return old_path.with_name(f"{old_path.stem}_{target}{_TARGET_SUFFIX[target]}")
+
+
+def _convert_file(
+    old_path: pathlib.Path, new_path: pathlib.Path, target: str, say: Echo
+) -> Any:
+    """Load ``old_path`` (any vintage) and write it as ``target``."""
+    from cellpy.readers.cellpy_file import load as cellpy_file_load
+    from cellpy.readers.cellpy_file import save as cellpy_file_save
+    from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
 
     say(f"[cellpy] (convert) loading {old_path}")
     result = cellpy_file_load(old_path, accept_old=True)
@@ -232,8 +246,263 @@ def convert(
         cellpy_file_v9.save(result.data, new_path)
     else:
         cellpy_file_save(result.data, new_path)
-    say(f"[cellpy] (convert) done: {new_path}")
-    return new_path
+    return result
+
+
+# -- bulk convert ---------------------------------------------------------------
+
+
+#: Files ``convert_tree`` picks up: the HDF5 cellpy-files of cellpy 1.x.
+CONVERT_PATTERNS = ("*.h5", "*.hdf5")
+
+#: File name of the report ``cellpy convert --recursive`` writes by default.
+CONVERT_REPORT_NAME = "cellpy_convert_report.json"
+
+
+@dataclass
+class ConversionRecord:
+    """What happened to one file in a bulk conversion.
+
+    ``status`` is ``"converted"``, ``"skipped"`` (the destination already holds
+    the same raw-file ids and is newer than the source) or ``"failed"``
+    (``message`` says why).
+    """
+
+    source: str
+    destination: str
+    status: str
+    file_version: Optional[int] = None
+    seconds: float = 0.0
+    message: str = ""
+
+
+@dataclass
+class ConvertReport:
+    """The outcome of :func:`convert_tree`, one record per source file."""
+
+    target: str
+    records: list = field(default_factory=list)
+
+    def _with_status(self, status: str) -> list:
+        return [r for r in self.records if r.status == status]
+
+    @property
+    def converted(self) -> list:
+        return self._with_status("converted")
+
+    @property
+    def skipped(self) -> list:
+        return self._with_status("skipped")
+
+    @property
+    def failed(self) -> list:
+        return self._with_status("failed")
+
+    def to_dict(self) -> dict[str, Any]:
+        from dataclasses import asdict
+
+        return {
+            "cellpy_version": VERSION,
+            "target": self.target,
+            "converted": len(self.converted),
+            "skipped": len(self.skipped),
+            "failed": len(self.failed),
+            "records": [asdict(r) for r in self.records],
+        }
+
+    def write(self, path: PathLike) -> pathlib.Path:
+        """Write the report as JSON (atomically) and return the path."""
+        import json
+
+        from cellpy.readers.cellpy_file.atomic import atomic_write
+
+        path = pathlib.Path(path)
+        with atomic_write(path) as staged:
+            staged.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+
+
+def convert_tree(
+    root: PathLike,
+    destination: Optional[PathLike] = None,
+    *,
+    to: str = "v9",
+    jobs: Optional[int] = 1,
+    recursive: bool = True,
+    patterns: tuple = CONVERT_PATTERNS,
+    report: Optional[PathLike] = None,
+    echo: Optional[Echo] = None,
+) -> ConvertReport:
+    """Upgrade every legacy cellpy-file under a directory.
+
+    Each file is converted as :func:`convert` would (``<name>_<target>``
+    beside the source, or at the same relative place under *destination*).
+    A file whose destination already exists, holds the same raw-file ids
+    (fid table) as the source and was written after the source was last
+    modified is skipped, so an interrupted run can simply be started again.
+    Every written file is read back and checked against the source: the row
+    counts of its tables, its data point, cycle and step columns, and the
+    number of raw-file ids. A file that fails the check is removed and
+    reported as failed.
+
+    Args:
+        root: directory to search.
+        destination: directory to write the converted tree to (default: beside
+            each source).
+        to: ``"v9"`` (default) or ``"v8"``.
+        jobs: number of worker processes (``None`` or ``0``: one per CPU,
+            ``1``: convert in this process).
+        recursive: also search sub-directories.
+        patterns: glob patterns of the files to convert.
+        report: write the report as JSON to this path.
+        echo: progress reporter; quiet by default.
+
+    Returns:
+        ConvertReport
+    """
+    say = _resolve_echo(echo)
+    target = _check_target(to)
+    root = pathlib.Path(root)
+    if not root.is_dir():
+        raise NotADirectoryError(f"Not a directory: {root}")
+
+    jobs_list = _conversion_jobs(root, destination, target, recursive, patterns)
+    say(f"[cellpy] (convert) {len(jobs_list)} file(s) to convert to {target}")
+    records: list = []
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1 or len(jobs_list) < 2:
+        for job in jobs_list:
+            records.append(_convert_one(*job))
+            _say_record(say, records[-1], len(records), len(jobs_list))
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_convert_one, *job) for job in jobs_list]
+            for future in as_completed(futures):
+                records.append(future.result())
+                _say_record(say, records[-1], len(records), len(jobs_list))
+        order = {str(job[0]): i for i, job in enumerate(jobs_list)}
+        records.sort(key=lambda r: order[r.source])
+
+    result = ConvertReport(target=target, records=records)
+    say(
+        f"[cellpy] (convert) {len(result.converted)} converted, "
+        f"{len(result.skipped)} skipped, {len(result.failed)} failed"
+    )
+    if report is not None:
+        say(f"[cellpy] (convert) report: {result.write(report)}")
+    return result
+
+
+def _conversion_jobs(root, destination, target, recursive, patterns) -> list:
+    """(source, destination, target) for every file to convert, sorted."""
+    sources = set()
+    for pattern in patterns:
+        found = root.rglob(pattern) if recursive else root.glob(pattern)
+        sources.update(p for p in found if p.is_file())
+    jobs = []
+    for source in sorted(sources):
+        new_path = _converted_name(source, target)
+        if destination is not None:
+            new_path = pathlib.Path(destination) / new_path.relative_to(root)
+        jobs.append((source, new_path, target))
+    # do not pick up the output of an earlier run (``x_v8.h5`` from ``x.h5``)
+    written = {new_path for _, new_path, _ in jobs}
+    return [job for job in jobs if job[0] not in written]
+
+
+def _say_record(say: Echo, record: ConversionRecord, n: int, total: int) -> None:
+    detail = f": {record.message}" if record.message else ""
+    say(f"[cellpy] (convert) [{n}/{total}] {record.status} {record.source}{detail}")
+
+
+def _fid_signature(path: pathlib.Path) -> Optional[list]:
+    """Comparable raw-file ids of a cellpy-file (``None`` if unreadable)."""
+    from cellpy.readers.cellpy_file.fids import read_fid_table
+
+    fids = read_fid_table(path)
+    if fids is None:
+        return None
+    return [
+        (fid.name, fid.size, fid.last_modified, length)
+        for fid, length in zip(*fids)
+    ]
+
+
+def _is_converted(source: pathlib.Path, destination: pathlib.Path) -> bool:
+    """Whether ``destination`` already holds the current content of ``source``.
+
+    Same raw-file ids are not enough: a source re-processed and saved again
+    after the conversion keeps its fids, so the destination must also be
+    newer than the source.
+    """
+    if not destination.is_file():
+        return False
+    if destination.stat().st_mtime_ns < source.stat().st_mtime_ns:
+        return False
+    fids = _fid_signature(source)
+    return fids is not None and fids == _fid_signature(destination)
+
+
+def _convert_one(
+    source: pathlib.Path, destination: pathlib.Path, target: str
+) -> ConversionRecord:
+    """Convert one file for :func:`convert_tree` (runs in a worker process)."""
+    record = ConversionRecord(str(source), str(destination), "converted")
+    start = time.perf_counter()
+    try:
+        if _is_converted(source, destination):
+            record.status = "skipped"
+            record.message = "already converted"
+            return record
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        result = _convert_file(source, destination, target, _silent)
+        record.file_version = result.file_version
+        problem = _verify_conversion(result.data, destination)
+        if problem:
+            destination.unlink(missing_ok=True)
+            record.status = "failed"
+            record.message = f"verification failed: {problem}"
+    except Exception as e:
+        logging.debug(f"could not convert {source}", exc_info=True)
+        record.status = "failed"
+        record.message = f"{type(e).__name__}: {e}"
+    finally:
+        record.seconds = round(time.perf_counter() - start, 3)
+    return record
+
+
+def _verify_conversion(data: Any, path: pathlib.Path) -> str:
+    """Read ``path`` back and compare it with the ``data`` written to it.
+
+    Checks the row counts of the tables, the data point, cycle and step
+    columns of raw and the number of raw-file ids (not the other columns).
+    """
+    from cellpy.parameters.internal_settings import get_headers_normal
+    from cellpy.readers.cellpy_file import load as cellpy_file_load
+
+    # only the key raw columns
+    written = cellpy_file_load(path, columns=()).data
+    for table in ("raw", "steps", "summary"):
+        expected, found = len(getattr(data, table)), len(getattr(written, table))
+        if expected != found:
+            return f"{table} has {found} rows, expected {expected}"
+    headers = get_headers_normal()
+    for column in (
+        headers.data_point_txt,
+        headers.cycle_index_txt,
+        headers.step_index_txt,
+    ):
+        if column not in data.raw.columns:
+            continue
+        if column not in written.raw.columns or not (
+            data.raw[column].to_numpy() == written.raw[column].to_numpy()
+        ).all():
+            return f"raw column {column} differs"
+    if len(written.raw_data_files) != len(data.raw_data_files):
+        return "fid table differs"
+    return ""
 
 
 # -- run ------------------------------------------------------------------------
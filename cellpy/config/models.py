@@ -106,6 +106,16 @@ class ReaderConfig(BaseModel):
     auto_dirs: bool = True
     max_raw_files_to_merge: int = 20
     jupyter_executable: str = "jupyter"
+    # threads encoding the v9 cellpy-file tables on save (None: one per table)
+    save_workers: int | None = None
+    # compression profile of v9 cellpy-files: fast, balanced, archive or none
+    # (None: balanced)
+    compression_profile: str | None = None
+    # directory of the on-disk cache of harmonized raw frames (None: no cache)
+    parse_cache_dir: str | None = None
+    # upper bound of the parse cache in bytes (least recently used entries go
+    # first; None: no bound)
+    parse_cache_max_size: int | None = 2_000_000_000
     # Phase B / #560 flag day: opt-in to producing the native raw from the
     # two-stage harmonize(parse()) pipeline rather than the legacy
     # loader()+to_native rename. Default OFF: the flip currently drops aux
@@ -432,6 +432,13 @@ def cap_mod_summary(cell: "CellpyCell", summary, capacity_modifier="reset"):
     return summary
 
 
+def _reset_columns(raw, rows, columns):
+    """Subtract the first selected value from each column over the selected rows."""
+    positions = [raw.columns.get_loc(col) for col in columns]
+    selected = raw.iloc[rows, positions]
+    raw.iloc[rows, positions] = selected - selected.iloc[0]
+
+
 # TODO (#520): near-dead, test-pinned only - decide removal in the DI pass
 def cap_mod_normal(cell: "CellpyCell", capacity_modifier="reset", allctypes=True):
     """Modify the raw capacities in place (legacy helper)."""
@@ -441,13 +448,13 @@ def cap_mod_normal(cell: "CellpyCell", capacity_modifier="reset", allctypes=True
     logging.debug("Not properly checked yet! Use with caution!")
 
     cycle_index_header = cell.schema.raw.cycle_num
-    step_index_header = cell.schema.raw.step_num
     discharge_index_header = cell.schema.raw.cumulative_discharge_capacity
     discharge_energy_index_header = cell.schema.raw.cumulative_discharge_energy
     charge_index_header = cell.schema.raw.cumulative_charge_capacity
     charge_energy_index_header = cell.schema.raw.cumulative_charge_energy
 
     raw = cell.data.raw
+    raw_index = cell._raw_index()
 
     if capacity_modifier == "reset":
         # discharge cycles
@@ -463,15 +470,8 @@ def cap_mod_normal(cell: "CellpyCell", capacity_modifier="reset", allctypes=True
             steps = discharge_cycles[j]
             txt = "Cycle  %i (discharge):  " % j
             logging.debug(txt)
-            # TODO: @jepe - use externals.pandas.loc[row,column] e.g. externals.pandas.loc[:,"charge_cap"]
-            # for col or externals.pandas.loc[(externals.pandas.["step"]==1),"x"]
-            selection = (raw[cycle_index_header] == j) & (
-                raw[step_index_header].isin(steps)
-            )
-            c0 = raw[selection].iloc[0][cap_header]
-            e0 = raw[selection].iloc[0][e_header]
-            raw.loc[selection, cap_header] = raw.loc[selection, cap_header] - c0
-            raw.loc[selection, e_header] = raw.loc[selection, e_header] - e0
+            selection = raw_index.rows(j, steps)
+            _reset_columns(raw, selection, [cap_header, e_header])
 
             cap_type = "charge"
             e_header = charge_energy_index_header
@@ -483,13 +483,7 @@ def cap_mod_normal(cell: "CellpyCell", capacity_modifier="reset", allctypes=True
             txt = "Cycle  %i (charge):  " % j
             logging.debug(txt)
 
-            selection = (raw[cycle_index_header] == j) & (
-                raw[step_index_header].isin(steps)
-            )
-
-            if any(selection):
-                c0 = raw[selection].iloc[0][cap_header]
-                e0 = raw[selection].iloc[0][e_header]
-                raw.loc[selection, cap_header] = raw.loc[selection, cap_header] - c0
-                raw.loc[selection, e_header] = raw.loc[selection, e_header] - e0
+            selection = raw_index.rows(j, steps)
+            if len(raw.iloc[selection]):
+                _reset_columns(raw, selection, [cap_header, e_header])
     logging.debug(f"(dt: {(time.time() - time_00):4.2f}s)")
@@ -146,6 +146,16 @@ class ReaderClass(CellPyConfig):
     )
     max_raw_files_to_merge: int = 20  # guard against accidentally passing too many files
     jupyter_executable: str = "jupyter"
+    # threads encoding the v9 cellpy-file tables on save (None: one per table)
+    save_workers: Optional[int] = None
+    # compression profile of v9 cellpy-files: fast, balanced, archive or none
+    # (None: balanced)
+    compression_profile: Optional[str] = None
+    # directory of the on-disk cache of harmonized raw frames (None: no cache)
+    parse_cache_dir: Optional[str] = None
+    # upper bound of the parse cache in bytes (least recently used entries go
+    # first; None: no bound)
+    parse_cache_max_size: Optional[int] = 2_000_000_000
     # Phase B / #560 flag day: opt-in to producing the native raw from the
     # two-stage harmonize(parse()) pipeline instead of the legacy
     # loader()+to_native rename. Default OFF — see cellpy.config.models for why
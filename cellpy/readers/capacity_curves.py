@@ -60,9 +60,10 @@ def get_dcap(
     if converter is None:
         converter = cell.get_converter_to_specific(mode=mode)
 
-    dc, v = cell._get_cap(
-        cycle, "discharge", converter=converter, usteps=usteps, **kwargs
-    )
+    with cell.data.cycle_window(cycle):
+        dc, v = cell._get_cap(
+            cycle, "discharge", converter=converter, usteps=usteps, **kwargs
+        )
     if as_frame:
         cycle_df = externals.pandas.concat([v, dc], axis=1)
         return cycle_df
@@ -97,9 +98,10 @@ def get_ccap(
 
     if converter is None:
         converter = cell.get_converter_to_specific(mode=mode)
-    cc, v = cell._get_cap(
-        cycle, "charge", converter=converter, usteps=usteps, **kwargs
-    )
+    with cell.data.cycle_window(cycle):
+        cc, v = cell._get_cap(
+            cycle, "charge", converter=converter, usteps=usteps, **kwargs
+        )
 
     if as_frame:
         cycle_df = externals.pandas.concat([v, cc], axis=1)
@@ -130,7 +132,7 @@ def get_cap(
     volume=None,
     cycle_mode=None,
     usteps=None,
-    dynamic=False,
+    dynamic=None,
     **kwargs,
 ):
     """Gets the capacity for the run.
@@ -179,8 +181,10 @@ def get_cap(
         volume (float): volume of electrode (in set cellpy units, typically cm3).
         cycle_mode (str): if 'anode' the first step is assumed to be the discharge,
             else charge (defaults to ``CellpyCell.cycle_mode``).
-        dynamic: for dynamic retrieving data from cellpy-file.
-            [NOT IMPLEMENTED YET]
+        dynamic (bool): read only the requested cycles from the cellpy-file
+            when the raw table is not loaded (``tables=`` in ``CellpyCell.load``)
+            instead of loading all of it. Defaults to True in that case;
+            set to False to load (and keep) the full raw table.
         **kwargs: sent to ``get_ccap`` and ``get_dcap``.
 
     Returns:
@@ -207,6 +211,37 @@ def get_cap(
         except TypeError:
             return 0.0
 
+    if dynamic is None:
+        dynamic = "raw" in cell.data.deferred_tables
+    if dynamic:
+        with cell.data.cycle_window(cycles if cycles is not None else cycle):
+            return get_cap(
+                cell,
+                cycle=cycle,
+                cycles=cycles,
+                method=method,
+                insert_nan=insert_nan,
+                shift=shift,
+                categorical_column=categorical_column,
+                label_cycle_number=label_cycle_number,
+                split=split,
+                interpolated=interpolated,
+                dx=dx,
+                number_of_points=number_of_points,
+                ignore_errors=ignore_errors,
+                inter_cycle_shift=inter_cycle_shift,
+                interpolate_along_cap=interpolate_along_cap,
+                capacity_then_voltage=capacity_then_voltage,
+                mode=mode,
+                mass=mass,
+                area=area,
+                volume=volume,
+                cycle_mode=cycle_mode,
+                usteps=usteps,
+                dynamic=False,
+                **kwargs,
+            )
+
     if usteps is None:
         usteps = cell._using_usteps()
         logging.debug(
@@ -285,6 +320,30 @@ def get_cap(
     specific_converter = cell.get_converter_to_specific(
         mode=mode, **converter_kwargs
     )
+
+    if return_dataframe and not usteps and not kwargs:
+        cycle_df = _get_cap_all_cycles(
+            cell,
+            cycle,
+            converter=specific_converter,
+            method=method,
+            insert_nan=insert_nan,
+            shift=shift,
+            categorical_column=categorical_column,
+            label_cycle_number=label_cycle_number,
+            interpolated=interpolated,
+            dx=dx,
+            number_of_points=number_of_points,
+            ignore_errors=ignore_errors,
+            inter_cycle_shift=inter_cycle_shift,
+            interpolate_along_cap=interpolate_along_cap,
+            capacity_then_voltage=capacity_then_voltage,
+            cycle_mode=cycle_mode,
+        )
+        if cycle_df is not None:
+            return cycle_df
+        logging.debug("get_cap: falling back to the cycle-by-cycle extraction")
+
     cycle_df = externals.pandas.DataFrame()
 
     initial = True
@@ -504,6 +563,288 @@ def get_cap(
     else:
         return capacity, voltage
 
+
+def _gather_cap_rows(cell, cycles, cap_type, converter):
+    """Raw rows of all ``cap_type`` steps of the given cycles, in one gather.
+
+    Rows come out ordered as the cycle-by-cycle extraction concatenates them:
+    by position of the cycle in ``cycles``, then by step number, then by data
+    point. Returns None if a cycle lists the same step twice (which
+    ``_get_cap`` refuses with a ``ValueError``).
+    """
+    np = externals.numpy
+    pd = externals.pandas
+
+    raw = cell.data.raw
+    steps = cell.data.steps
+    s_hdr = cell.schema.steps
+    r_hdr = cell.schema.raw
+    if cap_type == "charge":
+        cap_col = r_hdr.cumulative_charge_capacity
+    else:
+        cap_col = r_hdr.cumulative_discharge_capacity
+
+    rank_of = {c: i for i, c in enumerate(cycles)}
+    picked = steps.loc[steps[s_hdr.step_type] == cap_type, [s_hdr.cycle_num, s_hdr.step_num]]
+    rank = picked[s_hdr.cycle_num].map(rank_of)
+    picked = picked.loc[rank.notna()]
+    if picked.duplicated().any():
+        return None
+    pairs = pd.DataFrame(
+        {
+            "cycle": picked[s_hdr.cycle_num].to_numpy(dtype=float),
+            "step": picked[s_hdr.step_num].to_numpy().astype(int).astype(float),
+            "rank": rank.loc[picked.index].to_numpy(dtype=np.int64),
+        }
+    )
+
+    index = cell._raw_index()
+    runs = pd.DataFrame(
+        {
+            "cycle": index.run_cycles.astype(float),
+            "step": index.run_steps.astype(float),
+            "start": index.starts,
+            "stop": index.stops,
+        }
+    )
+    hits = pairs.merge(runs, on=["cycle", "step"], how="inner")
+    order = np.lexsort((hits["start"].to_numpy(), hits["step"].to_numpy(), hits["rank"].to_numpy()))
+    hits = hits.iloc[order]
+
+    starts = hits["start"].to_numpy()
+    lengths = hits["stop"].to_numpy() - starts
+    total = int(lengths.sum())
+    run_offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    positions = np.repeat(starts, lengths) + (np.arange(total) - run_offsets)
+    row_rank = np.repeat(hits["rank"].to_numpy(), lengths)
+
+    counts = np.bincount(row_rank, minlength=len(cycles))
+    return {
+        "counts": counts,
+        "capacity": raw[cap_col].to_numpy()[positions] * converter,
+        "potential": raw[r_hdr.potential].to_numpy()[positions],
+        "labels": raw.index.to_numpy()[positions],
+    }
+
+
+def _get_cap_all_cycles(
+    cell,
+    cycles,
+    converter,
+    method,
+    insert_nan,
+    shift,
+    categorical_column,
+    label_cycle_number,
+    interpolated,
+    dx,
+    number_of_points,
+    ignore_errors,
+    inter_cycle_shift,
+    interpolate_along_cap,
+    capacity_then_voltage,
+    cycle_mode,
+):
+    """All-cycles engine behind ``get_cap`` (the tidy-frame output).
+
+    Produces the same frame as the cycle-by-cycle loop in ``get_cap``, but
+    gathers the charge and discharge rows of every cycle at once (through the
+    raw cycle/step index), resolves the per-cycle shifts as one scalar pass
+    over the cycles and lays out the result (NaN separators, direction and
+    cycle columns, reversals) with array operations instead of concatenating
+    small frames. Interpolated curves go through
+    ``ds._interpolate_monotonic_segments`` all at once, the routine the loop
+    runs per curve (through ``interpolate_y_on_x_per_monotonic_segments``), so
+    both give the same values.
+
+    Returns None when the loop is needed instead (missing step table,
+    duplicate step numbers, non-integer raw index, ``ignore_errors=False``
+    with incomplete cycles, interpolating data that is not float64 or has
+    NaN on the x axis, or nothing to return).
+    """
+    np = externals.numpy
+    pd = externals.pandas
+
+    if not len(cycles) or not cell.data.has_steps:
+        return None
+    if not pd.api.types.is_integer_dtype(cell.data.raw.index.dtype):
+        return None
+
+    charge = _gather_cap_rows(cell, cycles, "charge", converter)
+    discharge = _gather_cap_rows(cell, cycles, "discharge", converter)
+    if charge is None or discharge is None:
+        return None
+
+    if cycle_mode == "anode":
+        first, last = discharge, charge
+        first_interpolation_direction, last_interpolation_direction = -1, 1
+    else:
+        first, last = charge, discharge
+        first_interpolation_direction, last_interpolation_direction = 1, -1
+
+    n_cycles = len(cycles)
+    f_counts, l_counts = first["counts"], last["counts"]
+    if not (f_counts.sum() + l_counts.sum()):
+        return None
+    if not ignore_errors and (not f_counts.all() or not l_counts.all()):
+        return None
+
+    f_ends = np.cumsum(f_counts)
+    l_ends = np.cumsum(l_counts)
+    f_starts = f_ends - f_counts
+    l_starts = l_ends - l_counts
+
+    # per-cycle shifts; the scalar recurrence mirrors the loop in get_cap
+    # (a missing curve counts as 0.0 when looking up its last value)
+    f_offset = np.zeros(n_cycles)
+    l_base = np.zeros(n_cycles)
+    l_offset = np.zeros(n_cycles)
+    prev_end = shift
+    for k in range(n_cycles):
+        _last = first["capacity"][f_ends[k] - 1] if f_counts[k] else 0.0
+        l_end_value = last["capacity"][l_ends[k] - 1] if l_counts[k] else None
+        if method == "back-and-forth":
+            if not inter_cycle_shift:
+                prev_end = 0.0
+            f_offset[k] = prev_end
+            l_base[k] = _last
+            l_offset[k] = prev_end
+            prev_end = (_last - l_end_value) + prev_end if l_end_value is not None else 0.0
+        elif method == "forth":
+            f_offset[k] = prev_end
+            l_offset[k] = _last + prev_end
+            if inter_cycle_shift and l_end_value is not None:
+                prev_end = l_end_value + (_last + prev_end)
+            else:
+                prev_end = 0.0
+        else:
+            f_offset[k] = shift
+            l_offset[k] = shift
+
+    f_rank = np.repeat(np.arange(n_cycles), f_counts)
+    l_rank = np.repeat(np.arange(n_cycles), l_counts)
+    f_cap = first["capacity"] + f_offset[f_rank]
+    if method == "back-and-forth":
+        l_cap = (l_base[l_rank] - last["capacity"]) + l_offset[l_rank]
+    else:
+        l_cap = last["capacity"] + l_offset[l_rank]
+    f_volt = first["potential"]
+    l_volt = last["potential"]
+
+    reverse_first = interpolate_along_cap and method in ("forth", "back-and-forth")
+    reverse_last = interpolate_along_cap and method == "back-and-forth"
+    cycle_values = np.asarray(cycles)
+
+    present = (f_counts + l_counts) > 0
+    f_labels = first["labels"]
+    columns_order = [_CCOLS.potential, _CCOLS.capacity]
+    if interpolated:
+        # interpolated frames come out as (x, y) with a fresh index; the
+        # curves left unchanged keep their columns and (first block) labels
+        curves = []
+        for counts, volt, cap, direction in (
+            (f_counts, f_volt, f_cap, first_interpolation_direction),
+            (l_counts, l_volt, l_cap, last_interpolation_direction),
+        ):
+            x, y = (cap, volt) if interpolate_along_cap else (volt, cap)
+            curve = ds._interpolate_monotonic_segments(x, y, counts, direction, dx, number_of_points)
+            if curve is None:
+                return None
+            x, y, new_counts, unchanged = curve
+            curves.append((new_counts, unchanged, *((y, x) if interpolate_along_cap else (x, y))))
+        (f_counts, f_unchanged, f_volt, f_cap), (l_counts, l_unchanged, l_volt, l_cap) = curves
+        f_rank = np.repeat(np.arange(n_cycles), f_counts)
+        l_rank = np.repeat(np.arange(n_cycles), l_counts)
+        f_local = np.arange(len(f_rank)) - np.repeat(np.cumsum(f_counts) - f_counts, f_counts)
+        kept = f_unchanged[f_rank]
+        f_labels = f_local.copy()
+        f_labels[kept] = first["labels"][f_starts[f_rank[kept]] + f_local[kept]]
+        if interpolate_along_cap:
+            # pandas keeps the column order of the first frame it concatenates
+            leading = np.empty(2 * n_cycles, dtype=bool)
+            leading[0::2], leading[1::2] = f_unchanged, l_unchanged
+            non_empty = np.empty(2 * n_cycles, dtype=bool)
+            non_empty[0::2], non_empty[1::2] = f_counts > 0, l_counts > 0
+            if not leading[np.flatnonzero(non_empty)[0]]:
+                columns_order.reverse()
+
+    # block layout: first(cycle 0), last(cycle 0), first(cycle 1), ...
+    n_data = np.empty(2 * n_cycles, dtype=np.int64)
+    n_data[0::2] = f_counts
+    n_data[1::2] = l_counts
+    has_nan = (n_data > 0) if insert_nan else np.zeros_like(n_data, dtype=bool)
+    sizes = n_data + has_nan
+    out_starts = np.cumsum(sizes) - sizes
+    total = int(sizes.sum())
+
+    value_dtype = np.result_type(f_cap.dtype, l_cap.dtype)
+    volt_dtype = np.result_type(f_volt.dtype, l_volt.dtype)
+    if insert_nan:
+        value_dtype = np.result_type(value_dtype, np.float64)
+        volt_dtype = np.result_type(volt_dtype, np.float64)
+    capacity = np.full(total, np.nan, dtype=value_dtype)
+    potential = np.full(total, np.nan, dtype=volt_dtype)
+    labels = np.zeros(total, dtype=np.int64)
+    direction = np.empty(total, dtype=np.int64)
+    cycle_column = np.empty(total, dtype=cycle_values.dtype)
+
+    for block_offset, counts, ranks, cap, volt, data_labels, category, reverse in (
+        (0, f_counts, f_rank, f_cap, f_volt, f_labels, -1, reverse_first),
+        (1, l_counts, l_rank, l_cap, l_volt, None, 1, reverse_last),
+    ):
+        block = 2 * np.arange(n_cycles) + block_offset
+        starts = out_starts[block]
+        block_sizes = sizes[block]
+        local = np.arange(len(ranks)) - np.repeat(np.cumsum(counts) - counts, counts)
+        if reverse:
+            local = block_sizes[ranks] - 1 - local
+            labels[starts[ranks] + local] = local
+        elif data_labels is None:
+            labels[starts[ranks] + local] = local
+        else:
+            labels[starts[ranks] + local] = data_labels
+        pos = starts[ranks] + local
+        capacity[pos] = cap
+        potential[pos] = volt
+
+        # every row of the block (data and NaN separator)
+        block_rows = np.repeat(np.arange(n_cycles), block_sizes)
+        row_pos = np.repeat(starts, block_sizes) + (
+            np.arange(len(block_rows)) - np.repeat(np.cumsum(block_sizes) - block_sizes, block_sizes)
+        )
+        direction[row_pos] = category
+        cycle_column[row_pos] = cycle_values[block_rows]
+        if insert_nan:
+            with_nan = np.flatnonzero(has_nan[block])
+            nan_pos = starts[with_nan] + np.where(reverse, 0, n_data[block][with_nan])
+            labels[nan_pos] = 0
+
+    columns = {}
+    if label_cycle_number:
+        columns[_CCOLS.cycle_num] = cycle_column
+    for column in columns_order:
+        columns[column] = potential if column == _CCOLS.potential else capacity
+    if categorical_column:
+        columns[_CCOLS.direction] = direction
+    cycle_df = pd.DataFrame(columns, index=pd.Index(labels))
+
+    if label_cycle_number and categorical_column:
+        # the loop appends an empty, cycle-labelled frame for a cycle without
+        # any curve; once something precedes it, that upcasts the direction
+        if not present[int(np.argmax(present)) :].all():
+            cycle_df[_CCOLS.direction] = cycle_df[_CCOLS.direction].astype(float)
+
+    if capacity_then_voltage:
+        cols = cycle_df.columns.to_list()
+        new_cols = [
+            cols.pop(cols.index(_CCOLS.capacity)),
+            cols.pop(cols.index(_CCOLS.potential)),
+        ]
+        new_cols.extend(cols)
+        cycle_df = cycle_df[new_cols]
+    return cycle_df
+
+
 def _get_cap(
     cell,
     cycle=None,
@@ -623,6 +964,7 @@ def get_ocv(
 
     """
     # TODO: use proper column header pickers
+    window = cycles
     if cycles is None:
         cycles = cell.get_cycle_numbers()
     else:
@@ -638,7 +980,6 @@ def get_ocv(
         ocv_rlx_id += "_down"
 
     steps = cell.data.steps
-    raw = cell.data.raw
 
     step_hdr = cell.schema.steps
     steps_cycle = step_hdr.cycle_num
@@ -659,13 +1000,13 @@ def get_ocv(
     cycle_label = cell.schema.raw.cycle_num
     step_label = cell.schema.raw.step_num
 
-    selected_df = raw.loc[
-        (
-            raw[cycle_label].isin(ocv_steps[steps_cycle])
-            & raw[step_label].isin(ocv_steps[steps_step])
-        ),
-        [cycle_label, step_label, step_time_label, voltage_label],
-    ]
+    with cell.data.cycle_window(window):
+        rows = cell._raw_index().rows_for_cycles(
+            ocv_steps[steps_cycle].unique(), ocv_steps[steps_step].unique()
+        )
+        selected_df = cell.data.raw[
+            [cycle_label, step_label, step_time_label, voltage_label]
+        ].iloc[rows]
 
     if interpolated:
         if dx is None and number_of_points is None:
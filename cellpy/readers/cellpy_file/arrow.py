@@ -0,0 +1,231 @@
+"""Arrow interchange for cells (the ``arrow`` layout).
+
+``to_tables`` turns a ``Data`` object into pyarrow tables (``raw``, ``steps``,
+``summary`` and, when there is one, ``fid``) with native column names, as in
+v9 files. The ``meta.json`` document of the cell travels in the schema
+metadata of every table (key ``cellpy.meta``), so each table is
+self-describing; ``from_tables`` turns such tables back into ``Data``.
+
+``save`` writes the tables as uncompressed Arrow IPC files (Feather v2) into
+a directory::
+
+    <path>/
+        raw.arrow
+        steps.arrow
+        summary.arrow
+        fid.arrow
+
+Uncompressed IPC files can be memory-mapped, so other processes (polars,
+``pyarrow``, the Rust ``arrow`` crate, ...) read the columns straight from the
+page cache without parsing or copying them, and ``load`` does the same.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Mapping, Optional, Union
+
+from cellpycore.config import default_schema
+
+from cellpy.exceptions import CorruptCellpyFile
+from cellpy.readers import data_structures as ds
+from cellpy.readers import externals
+from cellpy.readers.cellpy_file import fids as cellpy_file_fids
+from cellpy.readers.cellpy_file import meta_archive
+from cellpy.readers.cellpy_file import translate as cellpy_file_translate
+from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
+from cellpy.readers.cellpy_file.atomic import atomic_write
+from cellpy.readers.cellpy_file.selectors import (
+    LoadResult,
+    LoadSelector,
+    check_complete_raw,
+    check_tables,
+    loaded_columns,
+)
+
+_module_logger = logging.getLogger(__name__)
+
+PathLike = Union[str, os.PathLike]
+
+ARROW_TABLES = ("raw", "steps", "summary", "fid")
+ARROW_SUFFIX = ".arrow"
+META_KEY = b"cellpy.meta"
+TABLE_KEY = b"cellpy.table"
+
+
+def table_path(path: PathLike, table: str) -> Path:
+    """IPC file holding ``table`` in the arrow directory at ``path``."""
+    if table not in ARROW_TABLES:
+        raise ValueError(f"Unknown arrow table {table!r}; choose from {ARROW_TABLES}")
+    return Path(path) / f"{table}{ARROW_SUFFIX}"
+
+
+def is_arrow(path: PathLike) -> bool:
+    """True if ``path`` is a directory written by ``save``."""
+    path = Path(path)
+    return path.is_dir() and table_path(path, "summary").is_file()
+
+
+def to_tables(
+    data: "ds.Data", *, cellpy_units: Optional[Mapping[str, Any]] = None
+) -> dict:
+    """The tables of ``data`` as pyarrow tables with the meta document attached."""
+    import pyarrow as pa
+
+    scratch = cellpy_file_v9._native_scratch(data)
+    meta_doc = cellpy_file_v9._meta_document(data, cellpy_units)
+    meta_json = json.dumps(meta_doc, default=meta_archive._json_default).encode("utf-8")
+    fid_frame = externals.pandas.DataFrame(cellpy_file_fids.convert2fid_table(data))
+
+    frames = {
+        "raw": scratch.raw,
+        "steps": scratch.steps,
+        "summary": scratch.summary,
+        "fid": fid_frame,
+    }
+    tables = {}
+    for table, frame in frames.items():
+        if table == "fid" and (frame is None or frame.empty):
+            continue
+        arrow_table = pa.Table.from_pandas(cellpy_file_v9._frame_for_parquet(frame), preserve_index=False)
+        metadata = dict(arrow_table.schema.metadata or {})
+        metadata.update({META_KEY: meta_json, TABLE_KEY: table.encode("utf-8")})
+        tables[table] = arrow_table.replace_schema_metadata(metadata)
+    return tables
+
+
+def from_tables(tables: Mapping[str, Any], *, selector=None, columns=None, loaded_from=None) -> LoadResult:
+    """Build a legacy-named ``Data`` from tables made by ``to_tables``.
+
+    ``tables`` needs a ``summary`` table; the others may be left out (their
+    frames are then empty). Polars frames are accepted too, but they do not
+    carry the schema metadata, so the summary must be a pyarrow table.
+    ``selector`` and ``columns`` work as for ``load``.
+    """
+    if "summary" not in tables:
+        raise ValueError("from_tables needs at least the summary table")
+    tables = {name: _as_arrow(table) for name, table in tables.items()}
+    meta_doc = _meta_document(tables["summary"])
+    selection = LoadSelector.from_dict(selector)
+    schema = default_schema()
+    cycle_columns = {
+        "raw": schema.raw.cycle_num,
+        "steps": schema.step.cycle_num,
+        "summary": schema.cycle.cycle_num,
+    }
+
+    data = ds.Data()
+    data.loaded_columns = loaded_columns(columns)
+    for name in ("raw", "steps", "summary"):
+        if name not in tables:
+            continue
+        table = tables[name]
+        if name == "raw" and columns is not None:
+            table = table.select(cellpy_file_translate.raw_projection(columns, table.column_names))
+        setattr(data, name, _to_frame(table, cellpy_file_v9._cycle_filters(selection, cycle_columns[name])))
+    if "fid" in tables:
+        data.raw_data_files, data.raw_data_files_length = cellpy_file_fids.convert2fid_list(_to_frame(tables["fid"]))
+
+    if loaded_from is None:
+        loaded_from = meta_doc.get("loaded_from")
+    result = cellpy_file_v9._finish_load(data, meta_doc, selection, loaded_from)
+    if loaded_from is None:
+        result.data.loaded_from = None
+    return result
+
+
+def save(
+    data: "ds.Data",
+    path: PathLike,
+    *,
+    cellpy_units: Optional[Mapping[str, Any]] = None,
+    partial: bool = False,
+) -> None:
+    """Write ``data`` as uncompressed Arrow IPC files into the directory ``path``.
+
+    Each file is staged and replaced atomically. The summary is written last,
+    so ``is_arrow`` only recognises the directory once the other tables are
+    in place; a stale ``fid.arrow`` is removed when the cell has no fid table.
+    ``partial`` allows a cell loaded with a raw column projection, as for v9
+    files.
+    """
+    import pyarrow as pa
+
+    check_complete_raw(data, partial)
+    tables = to_tables(data, cellpy_units=cellpy_units)
+    Path(path).mkdir(parents=True, exist_ok=True)
+    for name in ("raw", "steps", "fid", "summary"):
+        target = table_path(path, name)
+        if name not in tables:
+            target.unlink(missing_ok=True)
+            continue
+        table = tables[name]
+        with atomic_write(target) as staged:
+            with pa.OSFile(str(staged), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+    _module_logger.debug("wrote arrow tables to %s", path)
+
+
+def read_tables(path: PathLike, *, tables=None, memory_map: bool = True) -> dict:
+    """Read the tables in the arrow directory at ``path`` as pyarrow tables.
+
+    With ``memory_map`` (the default) the tables are backed by memory maps
+    of the files; nothing is copied until a column is converted.
+    """
+    import pyarrow as pa
+
+    tables = check_tables(tables)
+    read = {}
+    for name in (*tables, "fid"):
+        file = table_path(path, name)
+        if not file.is_file():
+            continue
+        source = pa.memory_map(str(file), "r") if memory_map else pa.OSFile(str(file), "rb")
+        with source:
+            read[name] = pa.ipc.open_file(source).read_all()
+    return read
+
+
+def load(
+    path: PathLike,
+    *,
+    selector=None,
+    columns=None,
+    tables=None,
+    memory_map: bool = True,
+) -> LoadResult:
+    """Load the arrow directory at ``path`` into a legacy-named ``Data``.
+
+    Takes the same ``selector``, ``columns`` and ``tables`` arguments as the
+    v9 reader.
+    """
+    if not is_arrow(path):
+        raise IOError(f"No arrow tables in {path}")
+    read = read_tables(path, tables=tables, memory_map=memory_map)
+    return from_tables(read, selector=selector, columns=columns, loaded_from=Path(path))
+
+
+def _as_arrow(table):
+    if hasattr(table, "to_arrow"):  # polars
+        return table.to_arrow()
+    return table
+
+
+def _meta_document(table) -> dict:
+    metadata = table.schema.metadata or {}
+    if META_KEY not in metadata:
+        raise CorruptCellpyFile("The summary table has no cellpy meta document in its schema metadata")
+    return json.loads(metadata[META_KEY].decode("utf-8"))
+
+
+def _to_frame(table, filters=None):
+    if filters is not None:
+        if all(column in table.column_names for column, _, _ in filters):
+            import pyarrow.parquet as pq
+
+            table = table.filter(pq.filters_to_expression(filters))
+    return cellpy_file_v9._normalize_frame_nulls(table.to_pandas())
@@ -0,0 +1,86 @@
+"""Named compression profiles for the parquet tables of cellpy-files.
+
+A profile bundles the parquet codec, its level and the column encodings used
+when writing v9 files (and dataset stores):
+
+- ``"fast"``: lz4, for scratch and intermediate files that are written often
+  and kept briefly.
+- ``"balanced"`` (default): zstd level 3.
+- ``"archive"``: zstd level 19 with dictionary encoding for the integer and
+  text columns and byte-stream-split encoding for the float columns (which
+  makes measured values compress much better), for files that are written
+  once and kept.
+- ``"none"``: no compression.
+
+The profile used when none is given is ``config.reader.compression_profile``
+(``"balanced"`` when unset). Readers do not need to know the profile - the
+codec and encodings are recorded in the parquet files themselves.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import cellpy.config as config
+
+
+@dataclass(frozen=True)
+class CompressionProfile:
+    """Parquet codec and encodings for writing cellpy-file tables."""
+
+    name: str
+    compression: str
+    compression_level: Optional[int] = None
+    float_byte_stream_split: bool = False
+
+    def parquet_options(self, schema) -> dict:
+        """Keyword arguments for the pyarrow parquet writers for ``schema``."""
+        options = {"compression": self.compression}
+        if self.compression_level is not None:
+            options["compression_level"] = self.compression_level
+        if self.float_byte_stream_split:
+            import pyarrow as pa
+
+            floats = [f.name for f in schema if pa.types.is_floating(f.type)]
+            if floats:
+                # pyarrow prefers dictionary encoding when a column has both
+                options["use_dictionary"] = [
+                    f.name for f in schema if f.name not in floats
+                ]
+                options["use_byte_stream_split"] = floats
+        return options
+
+
+COMPRESSION_PROFILES = {
+    "fast": CompressionProfile("fast", "lz4"),
+    # zstd:3 matches the old zip-DEFLATE size without a second zip compressor
+    # (#912); readers still accept snappy (#898)
+    "balanced": CompressionProfile("balanced", "zstd", 3),
+    "archive": CompressionProfile(
+        "archive", "zstd", 19, float_byte_stream_split=True
+    ),
+    "none": CompressionProfile("none", "none"),
+}
+
+DEFAULT_COMPRESSION_PROFILE = "balanced"
+
+
+def get_profile(
+    profile: Union[str, CompressionProfile, None] = None,
+) -> CompressionProfile:
+    """Resolve a profile name (``None``: the configured default)."""
+    if isinstance(profile, CompressionProfile):
+        return profile
+    if profile is None:
+        profile = (
+            getattr(config.reader, "compression_profile", None)
+            or DEFAULT_COMPRESSION_PROFILE
+        )
+    try:
+        return COMPRESSION_PROFILES[str(profile).lower().strip()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown compression profile {profile!r}; choose from "
+            f"{', '.join(COMPRESSION_PROFILES)}"
+        ) from None
@@ -0,0 +1,268 @@
+"""Partitioned parquet store holding many cells (the ``dataset`` layout).
+
+Instead of one zip per cell, every table of every cell is a parquet file in a
+hive-partitioned directory::
+
+    <root>/
+        table=raw/cell=<label>/part-0.parquet
+        table=steps/cell=<label>/part-0.parquet
+        table=summary/cell=<label>/part-0.parquet
+        table=fid/cell=<label>/part-0.parquet
+        meta/<label>.meta.json
+
+The table comes first in the path since each table has its own columns: one
+table of all cells is then a single hive dataset with ``cell`` as partition
+column, and ``scan`` gives a polars lazy frame over it, so filters on ``cell``
+only touch the partitions of those cells and filters on other columns are
+pushed down to the parquet row groups. The frames are stored with native
+column names (as in v9 files), and the ``meta.json`` document of the cell is
+stored next to the tables.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Union
+
+from cellpycore.config import default_schema
+
+from cellpy.readers import data_structures as ds
+from cellpy.readers import externals
+from cellpy.readers.cellpy_file import fids as cellpy_file_fids
+from cellpy.readers.cellpy_file import meta_archive
+from cellpy.readers.cellpy_file import translate as cellpy_file_translate
+from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
+from cellpy.readers.cellpy_file.atomic import atomic_write
+from cellpy.readers.cellpy_file.compression import get_profile as get_compression_profile
+from cellpy.readers.cellpy_file.selectors import (
+    LoadResult,
+    LoadSelector,
+    check_complete_raw,
+    check_tables,
+    loaded_columns,
+)
+
+_module_logger = logging.getLogger(__name__)
+
+PathLike = Union[str, os.PathLike]
+
+DATASET_TABLES = ("raw", "steps", "summary", "fid")
+PARTITION_FILE = "part-0.parquet"
+META_DIR = "meta"
+META_SUFFIX = ".meta.json"
+
+
+def table_dir(root: PathLike, table: str) -> Path:
+    """Directory holding ``table`` of all cells in the store at ``root``."""
+    if table not in DATASET_TABLES:
+        raise ValueError(f"Unknown dataset table {table!r}; choose from {DATASET_TABLES}")
+    return Path(root) / f"table={table}"
+
+
+def partition_path(root: PathLike, table: str, label: str) -> Path:
+    return table_dir(root, table) / f"cell={_check_label(label)}" / PARTITION_FILE
+
+
+def meta_path(root: PathLike, label: str) -> Path:
+    return Path(root) / META_DIR / f"{_check_label(label)}{META_SUFFIX}"
+
+
+def is_dataset(path: PathLike) -> bool:
+    """True if ``path`` is the root directory of a dataset store."""
+    path = Path(path)
+    return path.is_dir() and (path / META_DIR).is_dir()
+
+
+def labels(root: PathLike) -> list[str]:
+    """Labels of the cells in the store at ``root``."""
+    meta_dir = Path(root) / META_DIR
+    if not meta_dir.is_dir():
+        return []
+    return sorted(p.name[: -len(META_SUFFIX)] for p in meta_dir.iterdir() if p.name.endswith(META_SUFFIX))
+
+
+def contains(root: PathLike, label: str) -> bool:
+    return meta_path(root, label).is_file()
+
+
+def _check_label(label: str) -> str:
+    label = str(label)
+    if not label or label in {".", ".."} or any(c in label for c in '/\\=:*?"<>|'):
+        raise ValueError(f"Not a valid dataset cell label: {label!r}")
+    return label
+
+
+def save(
+    data: "ds.Data",
+    root: PathLike,
+    label: str,
+    *,
+    cellpy_units: Optional[Mapping[str, Any]] = None,
+    raw_row_group_rows: Optional[int] = cellpy_file_v9.RAW_ROW_GROUP_ROWS,
+    compression=None,
+    partial: bool = False,
+) -> None:
+    """Write ``data`` as cell ``label`` of the dataset store at ``root``.
+
+    Replaces the partitions of ``label`` if the cell is already in the store.
+    Raw is written in row groups of ``raw_row_group_rows`` rows so cycle
+    filters can skip most of it. The meta document is written last, so a cell
+    only shows up in ``labels`` once all of its tables are in place.
+    ``compression`` selects the compression profile, and ``partial`` allows a
+    cell loaded with a raw column projection, as for v9 files.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    check_complete_raw(data, partial)
+    label = _check_label(label)
+    compression = get_compression_profile(compression)
+    scratch = cellpy_file_v9._native_scratch(data)
+    meta_doc = cellpy_file_v9._meta_document(data, cellpy_units)
+    fid_frame = externals.pandas.DataFrame(cellpy_file_fids.convert2fid_table(data))
+
+    frames = {
+        "raw": scratch.raw,
+        "steps": scratch.steps,
+        "summary": scratch.summary,
+        "fid": fid_frame,
+    }
+    for table, frame in frames.items():
+        path = partition_path(root, table, label)
+        if frame is None or not len(frame.columns):
+            path.unlink(missing_ok=True)
+            continue
+        arrow_table = pa.Table.from_pandas(cellpy_file_v9._frame_for_parquet(frame), preserve_index=False)
+        row_group_size = raw_row_group_rows if table == "raw" else None
+        with atomic_write(path) as staged:
+            pq.write_table(
+                arrow_table,
+                staged,
+                row_group_size=row_group_size,
+                **compression.parquet_options(arrow_table.schema),
+            )
+
+    with atomic_write(meta_path(root, label)) as staged:
+        staged.write_text(
+            json.dumps(meta_doc, indent=2, default=meta_archive._json_default),
+            encoding="utf-8",
+        )
+    _module_logger.debug("wrote cell %s to dataset %s", label, root)
+
+
+def remove(root: PathLike, label: str) -> None:
+    """Drop cell ``label`` from the store at ``root``."""
+    meta_path(root, label).unlink(missing_ok=True)
+    for table in DATASET_TABLES:
+        path = partition_path(root, table, label)
+        path.unlink(missing_ok=True)
+        if path.parent.is_dir() and not any(path.parent.iterdir()):
+            path.parent.rmdir()
+
+
+def scan(root: PathLike, table: str = "summary", cells: Optional[Iterable[str]] = None):
+    """Polars lazy frame over ``table`` of the cells in the store at ``root``.
+
+    The frame has a ``cell`` column (the partition key). Columns missing in
+    some cells are filled with nulls. Pass ``cells`` to restrict the scan to
+    those labels; ``cell`` filters in the query itself are pushed down too.
+
+    Example:
+        >>> import polars as pl
+        >>> from cellpy.readers.cellpy_file import dataset
+        >>> (
+        ...     dataset.scan("store", "summary")
+        ...     .filter(pl.col("cycle_num") > 500)
+        ...     .group_by("cell")
+        ...     .agg(pl.col("coulombic_efficiency").mean())
+        ...     .collect()
+        ... )
+    """
+    import polars as pl
+
+    directory = table_dir(root, table)
+    files = sorted(directory.glob(f"cell=*/{PARTITION_FILE}"))
+    if not files:
+        raise FileNotFoundError(f"No {table} table in the dataset store {root}")
+    schema: dict = {}
+    for file in files:
+        for name, dtype in pl.read_parquet_schema(file).items():
+            schema.setdefault(name, dtype)
+    frame = pl.scan_parquet(
+        directory,
+        hive_partitioning=True,
+        hive_schema={"cell": pl.String},
+        schema=schema,
+        missing_columns="insert",
+        cast_options=pl.ScanCastOptions(integer_cast="upcast", float_cast="upcast"),
+    )
+    if cells is not None:
+        frame = frame.filter(pl.col("cell").is_in([str(c) for c in cells]))
+    return frame
+
+
+def load(
+    root: PathLike,
+    label: str,
+    *,
+    selector=None,
+    columns=None,
+    tables=None,
+) -> LoadResult:
+    """Load cell ``label`` from the dataset store into a legacy-named ``Data``.
+
+    Takes the same ``selector``, ``columns`` and ``tables`` arguments as the
+    v9 reader (the cycle filters are pushed down to the parquet files).
+    """
+    tables = check_tables(tables)
+    selection = LoadSelector.from_dict(selector)
+    schema = default_schema()
+    path = meta_path(root, label)
+    if not path.is_file():
+        raise IOError(f"No cell {label!r} in the dataset store {root}")
+    meta_doc = json.loads(path.read_text(encoding="utf-8"))
+
+    data = ds.Data()
+    data.loaded_columns = loaded_columns(columns)
+    if "raw" in tables:
+        raw_path = partition_path(root, "raw", label)
+        raw_columns = None
+        if columns is not None:
+            import pyarrow.parquet as pq
+
+            raw_columns = cellpy_file_translate.raw_projection(columns, pq.read_schema(raw_path).names)
+        data.raw = _read_partition(
+            raw_path,
+            filters=cellpy_file_v9._cycle_filters(selection, schema.raw.cycle_num),
+            columns=raw_columns,
+        )
+    if "steps" in tables:
+        data.steps = _read_partition(
+            partition_path(root, "steps", label),
+            filters=cellpy_file_v9._cycle_filters(selection, schema.step.cycle_num),
+        )
+    data.summary = _read_partition(
+        partition_path(root, "summary", label),
+        filters=cellpy_file_v9._cycle_filters(selection, schema.cycle.cycle_num),
+    )
+    fid_path = partition_path(root, "fid", label)
+    if fid_path.is_file():
+        data.raw_data_files, data.raw_data_files_length = cellpy_file_fids.convert2fid_list(_read_partition(fid_path))
+
+    return cellpy_file_v9._finish_load(data, meta_doc, selection, Path(root) / label)
+
+
+def _read_partition(path: Path, *, filters=None, columns=None):
+    if not path.is_file():
+        return externals.pandas.DataFrame()
+    import pyarrow.parquet as pq
+
+    if filters is not None:
+        names = pq.read_schema(path).names
+        if not all(column in names for column, _, _ in filters):
+            filters = None
+    frame = externals.pandas.read_parquet(path, engine="pyarrow", filters=filters, columns=columns)
+    return cellpy_file_v9._normalize_frame_nulls(frame)
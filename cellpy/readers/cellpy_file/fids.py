@@ -96,8 +96,12 @@ def convert2fid_list(tbl):
 
 def read_fid_table(path) -> tuple[list["FileID"], list[int]] | None:
     """Read the fid table from a cellpy-file without a full load."""
+    from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
     from cellpy.readers.cellpy_file.read import resolve_hdf5_path
 
+    if cellpy_file_v9.is_zip_cellpy(path):
+        return cellpy_file_v9.read_fid_table(path)
+
     resolved = resolve_hdf5_path(path)
     try:
         version = cellpy_file_meta.get_cellpy_file_version(resolved)
@@ -108,7 +112,7 @@ def read_fid_table(path) -> tuple[list["FileID"], list[int]] | None:
 
     parent_level = fmt.root
     try:
-        with externals.pandas.HDFStore(resolved) as store:
+        with externals.pandas.HDFStore(resolved, mode="r") as store:
             fid_table = store.select(parent_level + fmt.fid_dir)
     except KeyError:
         logging.warning("no fidtable - you should update your hdf5-file")
@@ -71,7 +71,7 @@ def load_v7(filename, selector=None) -> tuple["Data", LoadLimits]:
     parent_level = fmt.root
     limits = LoadLimits()
 
-    with externals.pandas.HDFStore(filename) as store:
+    with externals.pandas.HDFStore(filename, mode="r") as store:
         data, meta_table = create_initial_data_set_from_cellpy_file(
             fmt.common_meta_dir, parent_level, store
         )
@@ -114,7 +114,7 @@ def load_v6(filename, selector=None) -> tuple["Data", LoadLimits]:
     limits = LoadLimits()
     upgrade = (6, HDF5_FILE_VERSION)
 
-    with externals.pandas.HDFStore(filename) as store:
+    with externals.pandas.HDFStore(filename, mode="r") as store:
         data, meta_table = create_initial_data_set_from_cellpy_file(
             fmt.common_meta_dir, parent_level, store
         )
@@ -164,7 +164,7 @@ def load_v5(filename, selector=None) -> tuple["Data", LoadLimits]:
     limits = LoadLimits()
     upgrade = (5, HDF5_FILE_VERSION)
 
-    with externals.pandas.HDFStore(filename) as store:
+    with externals.pandas.HDFStore(filename, mode="r") as store:
         data, meta_table = create_initial_data_set_from_cellpy_file(
             fmt.common_meta_dir, parent_level, store
         )
@@ -214,7 +214,7 @@ def load_v3_to_v4(filename, selector=None) -> tuple["Data", LoadLimits]:
     limits = LoadLimits()
     upgrade = (4, HDF5_FILE_VERSION)
 
-    with externals.pandas.HDFStore(filename) as store:
+    with externals.pandas.HDFStore(filename, mode="r") as store:
         data, meta_table = create_initial_data_set_from_cellpy_file(
             fmt.common_meta_dir, parent_level, store
         )
@@ -32,7 +32,7 @@ def get_cellpy_file_version(filename, meta_dir=None, parent_level=None):
     if parent_level is None:
         parent_level = prms._cellpyfile_root
 
-    with externals.pandas.HDFStore(filename) as store:
+    with externals.pandas.HDFStore(filename, mode="r") as store:
         try:
             meta_table = store.select(parent_level + meta_dir)
         except KeyError:
@@ -279,7 +279,7 @@ def _read_meta_hdf5(path: Path) -> dict:
     common_dir = prms._cellpyfile_common_meta
     test_dir = prms._cellpyfile_test_dependent_meta
 
-    with externals.pandas.HDFStore(path) as store:
+    with externals.pandas.HDFStore(path, mode="r") as store:
         try:
             meta_table = store.select(parent + common_dir)
         except KeyError as e:
@@ -5,8 +5,9 @@ from __future__ import annotations
 import logging
 import os
 import warnings
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from cellpy.exceptions import WrongFileVersion
 from cellpy.parameters import prms
@@ -31,7 +32,13 @@ from cellpy.readers.cellpy_file import fids as cellpy_file_fids
 from cellpy.readers.cellpy_file import keys as cellpy_file_keys
 from cellpy.readers.cellpy_file import meta as cellpy_file_meta
 from cellpy.readers.cellpy_file.format import CellpyFileFormat
-from cellpy.readers.cellpy_file.selectors import LoadLimits, LoadResult
+from cellpy.readers.cellpy_file.selectors import (
+    LoadLimits,
+    LoadResult,
+    LoadSelector,
+    check_tables,
+    loaded_columns,
+)
 
 if TYPE_CHECKING:
     from cellpy.readers.data_structures import Data
@@ -72,7 +79,7 @@ def read_table(path, table_name: str, *, max_cycle: int | None = None):
     store_key = parent_level + table_dir
 
     try:
-        with externals.pandas.HDFStore(resolved) as store:
+        with externals.pandas.HDFStore(resolved, mode="r") as store:
             if max_cycle is not None and table_dir == fmt.step_dir:
                 data = ds.Data()
                 limits = extract_summary_from_cellpy_file(
@@ -82,6 +89,8 @@ def read_table(path, table_name: str, *, max_cycle: int | None = None):
                     fmt.summary_dir,
                     selector={"max_cycle": max_cycle},
                 )
+                if limits.empty_window:
+                    return store.select(store_key, stop=0)
                 table = store.select(store_key)
                 if limits.limit_data_points:
                     table = table.loc[
@@ -101,19 +110,41 @@ def _headers_summary():
 
 
 def hdf5_cycle_filter(table=None, limits: LoadLimits | None = None):
+    """``HDFStore.select`` where-clause for the cycle window of ``limits``.
+
+    The stored index is the cycle number for the summary and the data point
+    for raw, so the clauses run on the indexed column of each table.
+    """
     if limits is None:
         limits = LoadLimits()
+    conditions = []
+    if table in ("raw", "steps") and limits.first_data_point:
+        logging.debug(f"starting at data_point {limits.first_data_point}")
+        conditions.append(f"index >= {int(limits.first_data_point)}")
     if max_cycle := limits.limit_loaded_cycles:
         if table == "summary":
             logging.debug(f"limited to cycle_number {max_cycle}")
-            return f"index <= {int(max_cycle)}"
-        if table == "raw":
+            conditions.append(f"index <= {int(max_cycle)}")
+        if table in ("raw", "steps"):
             logging.debug(f"limited to data_point {limits.limit_data_points}")
-            return f"index <= {int(limits.limit_data_points)}"
-        if table == "steps":
-            logging.debug(f"limited to data_point {limits.limit_data_points}")
-            return f"index <= {int(limits.limit_data_points)}"
-    return None
+            conditions.append(f"index <= {int(limits.limit_data_points)}")
+    return conditions or None
+
+
+def _first_data_point(
+    store, summary_key: str, min_cycle: int, upgrade_from_to: tuple | None = None
+) -> int | None:
+    """First data point of ``min_cycle``: one past the end of the cycles before it.
+
+    Only the summary rows before ``min_cycle`` are read (an indexed query on
+    the cycle number).
+    """
+    before = store.select(summary_key, where=f"index < {int(min_cycle)}")
+    if before.empty:
+        return None
+    if upgrade_from_to is not None:
+        before = rename_summary_columns(before, *upgrade_from_to)
+    return int(before[_headers_summary().data_point].max()) + 1
 
 
 def create_initial_data_set_from_cellpy_file(
@@ -156,16 +187,23 @@ def extract_summary_from_cellpy_file(
 ):
     if limits is None:
         limits = LoadLimits()
+    summary_key = parent_level + summary_dir
     if selector is not None:
+        selection = LoadSelector.from_dict(selector)
         cycle_filter = []
-        if max_cycle := selector.get("max_cycle", None):
+        if max_cycle := selection.max_cycle:
             cycle_filter.append(f"index <= {int(max_cycle)}")
             limits.limit_loaded_cycles = max_cycle
+        if min_cycle := selection.min_cycle:
+            cycle_filter.append(f"index >= {int(min_cycle)}")
+            limits.first_data_point = _first_data_point(
+                store, summary_key, min_cycle, upgrade_from_to
+            )
     else:
         limits.limit_loaded_cycles = None
         cycle_filter = hdf5_cycle_filter("summary", limits)
 
-    data.summary = store.select(parent_level + summary_dir, where=cycle_filter)
+    data.summary = store.select(summary_key, where=cycle_filter)
     if upgrade_from_to is not None:
         old, new = upgrade_from_to
         logging.debug(f"upgrading from {old} to {new}")
@@ -187,6 +225,13 @@ def extract_summary_from_cellpy_file(
             "You are most likely trying to open a too old cellpy file"
         ) from e
 
+    if data.summary.empty:
+        # a window outside the stored cycles: raw and steps come out empty
+        logging.debug("no cycles in the selected window")
+        limits.limit_data_points = None
+        limits.empty_window = True
+        return limits
+
     limits.limit_data_points = int(max_data_point)
     logging.debug(f"data-point max limit: {limits.limit_data_points}")
     return limits
@@ -199,11 +244,21 @@ def extract_raw_from_cellpy_file(
     store,
     limits: LoadLimits | None = None,
     upgrade_from_to: tuple | None = None,
+    columns=None,
 ):
     if limits is None:
         limits = LoadLimits()
-    cycle_filter = hdf5_cycle_filter(table="raw", limits=limits)
-    data.raw = store.select(parent_level + raw_dir, where=cycle_filter)
+    raw_key = parent_level + raw_dir
+    if columns is not None:
+        from cellpy.readers.cellpy_file import translate as cellpy_file_translate
+
+        stored = store.select(raw_key, stop=0).columns
+        columns = cellpy_file_translate.raw_projection(columns, stored, native=False)
+    if limits.empty_window:
+        data.raw = store.select(raw_key, stop=0, columns=columns)
+    else:
+        cycle_filter = hdf5_cycle_filter(table="raw", limits=limits)
+        data.raw = store.select(raw_key, where=cycle_filter, columns=columns)
     if upgrade_from_to is not None:
         old, new = upgrade_from_to
         logging.debug(f"upgrading from {old} to {new}")
@@ -232,12 +287,20 @@ def extract_steps_from_cellpy_file(
     if limits is None:
         limits = LoadLimits()
     try:
-        data.steps = store.select(parent_level + step_dir)
+        if limits.empty_window:
+            data.steps = store.select(parent_level + step_dir, stop=0)
+        else:
+            data.steps = store.select(parent_level + step_dir)
         if limits.limit_data_points:
             data.steps = data.steps.loc[
                 data.steps["point_last"] <= limits.limit_data_points
             ]
             logging.debug(f"limited to data_point {limits.limit_data_points}")
+        if limits.first_data_point:
+            data.steps = data.steps.loc[
+                data.steps["point_first"] >= limits.first_data_point
+            ]
+            logging.debug(f"starting at data_point {limits.first_data_point}")
         if upgrade_from_to is not None:
             old, new = upgrade_from_to
             logging.debug(f"upgrading from {old} to {new}")
@@ -329,14 +392,17 @@ def load_current_version(
     selector=None,
     parent_level: str | None = None,
     fmt: CellpyFileFormat = FORMAT_V8,
+    columns=None,
+    tables=None,
 ) -> tuple["Data", LoadLimits]:
     if parent_level is None:
         parent_level = fmt.root
+    tables = check_tables(tables)
 
     logging.debug(f"filename: {filename}")
     logging.debug(f"selector: {selector}")
     limits = LoadLimits()
-    with externals.pandas.HDFStore(filename) as store:
+    with externals.pandas.HDFStore(filename, mode="r") as store:
         (
             data,
             meta_table,
@@ -362,12 +428,14 @@ def load_current_version(
             selector=selector,
             limits=limits,
         )
-        extract_raw_from_cellpy_file(
-            data, parent_level, fmt.raw_dir, store, limits=limits
-        )
-        extract_steps_from_cellpy_file(
-            data, parent_level, fmt.step_dir, store, limits=limits
-        )
+        if "raw" in tables:
+            extract_raw_from_cellpy_file(
+                data, parent_level, fmt.raw_dir, store, limits=limits, columns=columns
+            )
+        if "steps" in tables:
+            extract_steps_from_cellpy_file(
+                data, parent_level, fmt.step_dir, store, limits=limits
+            )
         fid_table, fid_table_selected = extract_fids_from_cellpy_file(
             fmt.fid_dir, parent_level, store
         )
@@ -376,6 +444,7 @@ def load_current_version(
         data, meta_table, test_dependent_meta_table, filename
     )
     _assign_fids_from_table(data, fid_table, fid_table_selected)
+    data.loaded_columns = loaded_columns(columns)
     return data, limits
 
 
@@ -385,6 +454,9 @@ def load(
     accept_old: bool = False,
     selector=None,
     parent_level: str | None = None,
+    columns=None,
+    tables=None,
+    label: str | None = None,
 ) -> LoadResult:
     """Load a cellpy-file and return populated ``Data`` with explicit limits.
 
@@ -392,7 +464,31 @@ def load(
     Default ``accept_old=False`` freezes pre-v8: raises ``WrongFileVersion``
     naming ``cellpy convert`` on 1.x. Pass ``accept_old=True`` to load
     legacy vintages (escape hatch used by ``cli_api.convert``).
+
+    ``selector`` limits the cycles read: ``{"max_cycle": n}``, optionally
+    with ``"min_cycle"``, or ``{"cycles": range(100, 200)}`` for the window
+    spanning the given cycles. HDF5 files resolve the window to data points
+    from the summary and read it with where-queries on the indexed columns,
+    so only the rows of the window are read; v9 files push it down to
+    pyarrow.
+
+    ``columns`` limits the raw columns read (parquet column selection for v9,
+    ``HDFStore.select(columns=...)`` for v8); the key columns are always
+    kept. Pre-v8 files ignore it.
+
+    ``tables`` (e.g. ``("summary",)``) reads only the listed tables; the
+    others are left empty (see :class:`DeferredTable` for fetching them
+    later). The summary and the metadata are always read. Pre-v8 files
+    ignore it.
+
+    ``filename`` can also be the root directory of a dataset store (see
+    :mod:`cellpy.readers.cellpy_file.dataset`); ``label`` then names the
+    cell to load (it can be left out if the store holds only one cell). A
+    directory of Arrow IPC files (see :mod:`cellpy.readers.cellpy_file.arrow`)
+    is read through memory maps.
     """
+    from cellpy.readers.cellpy_file import arrow as cellpy_file_arrow
+    from cellpy.readers.cellpy_file import dataset as cellpy_file_dataset
     from cellpy.readers.cellpy_file import legacy_read
     from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
 
@@ -404,6 +500,26 @@ def load(
             f"Using non-default parent label for the hdf-store: {parent_level}"
         )
 
+    if cellpy_file_dataset.is_dataset(filename):
+        if label is None:
+            stored = cellpy_file_dataset.labels(filename)
+            if len(stored) != 1:
+                raise ValueError(
+                    f"{filename} is a dataset store with {len(stored)} cells; "
+                    f"give the label of the cell to load"
+                )
+            label = stored[0]
+        logging.debug(f"Loading cell {label} from the dataset store {filename}")
+        return cellpy_file_dataset.load(
+            filename, label, selector=selector, columns=columns, tables=tables
+        )
+
+    if cellpy_file_arrow.is_arrow(filename):
+        logging.debug(f"Loading arrow tables from {filename}")
+        return cellpy_file_arrow.load(
+            filename, selector=selector, columns=columns, tables=tables
+        )
+
     if not os.path.isfile(filename):
         logging.info(f"File does not exist: {filename}")
         raise IOError(f"File does not exist: {filename}")
@@ -411,7 +527,9 @@ def load(
     # v9 zip-of-parquet (sniff magic; extension is only a hint)
     if cellpy_file_v9.is_zip_cellpy(filename):
         logging.debug(f"Loading v9 zip cellpy-file: {filename}")
-        return cellpy_file_v9.load(filename, selector=selector)
+        return cellpy_file_v9.load(
+            filename, selector=selector, columns=columns, tables=tables
+        )
 
     # From here on the file is HDF5 (v4-v8), which needs PyTables (#570).
     require_hdf5_support(f"loading the HDF5 cellpy-file {filename}")
@@ -454,6 +572,110 @@ def load(
                 )
         else:
             logging.debug(f"Loading {filename} :: v{cellpy_file_version}")
-            data, limits = load_current_version(filename, selector=selector)
+            data, limits = load_current_version(
+                filename, selector=selector, columns=columns, tables=tables
+            )
 
     return LoadResult.from_limits(data, cellpy_file_version, limits)
+
+
+@dataclass(frozen=True)
+class DeferredTable:
+    """Loader for a table left out of a ``load(..., tables=...)`` call.
+
+    Calling it reads ``table`` from ``filename`` with the same ``selector``
+    and ``columns`` as the original load and returns the frame (translated
+    to native names when ``native`` is set). Register it on the ``Data``
+    object with ``Data.defer`` to fetch the table on first access.
+    """
+
+    filename: Any
+    table: str
+    selector: Optional[dict] = None
+    columns: Optional[tuple] = None
+    native: bool = False
+    label: Optional[str] = None
+    # data point column of the full table, read once for labelling windows
+    _data_points: dict = field(default_factory=dict, compare=False, repr=False)
+
+    def __call__(self):
+        logging.debug(f"loading deferred {self.table} table from {self.filename}")
+        return self._read(self.selector)
+
+    def for_cycles(self, cycles=None):
+        """Read only the raw rows of ``cycles`` (all cycles if None).
+
+        The window between the lowest and highest requested cycle is pushed
+        down to the reader as a cycle selector (row groups for v9, a
+        data-point where-query for v8) and the frame is then trimmed to
+        ``cycles``. The rows keep the labels they have in the full table.
+        """
+        if self.table != "raw":
+            raise ValueError(f"Only the raw table is read by cycle (not {self.table})")
+        if cycles is None:
+            return self()
+        cycles = sorted({int(c) for c in cycles})
+        selector = dict(self.selector or {})
+        if cycles:
+            max_cycle = selector.get("max_cycle")
+            min_cycle = selector.get("min_cycle")
+            selector["max_cycle"] = (
+                cycles[-1] if max_cycle is None else min(cycles[-1], max_cycle)
+            )
+            selector["min_cycle"] = (
+                cycles[0] if min_cycle is None else max(cycles[0], min_cycle)
+            )
+        logging.debug(f"loading cycles {cycles} of deferred raw from {self.filename}")
+        return self._read(selector, cycles=cycles)
+
+    def _read(self, selector, cycles=None):
+        data = load(
+            self.filename,
+            selector=selector,
+            columns=self.columns,
+            tables=(self.table,),
+            label=self.label,
+        ).data
+        if cycles is not None:
+            from cellpy.parameters.internal_settings import get_headers_normal
+
+            headers = get_headers_normal()
+            raw = data.raw
+            raw = raw.loc[raw[headers.cycle_index_txt].isin(cycles)]
+            raw.index = self._row_labels(raw[headers.data_point_txt].to_numpy())
+            data.raw = raw
+        if self.native:
+            from cellpy.readers.cellpy_file import translate as cellpy_file_translate
+
+            cellpy_file_translate.to_native(data)
+        return getattr(data, self.table)
+
+    def _row_labels(self, data_points):
+        """Labels of the rows holding ``data_points`` in the full raw table.
+
+        A full load numbers the raw rows from 0, so the rows of a cycle window
+        get their positions in the table read with ``selector``. Its data
+        point column is read on the first call and kept.
+        """
+        from cellpy.parameters.internal_settings import get_headers_normal
+
+        np = externals.numpy
+        if not self._data_points:
+            data_point = get_headers_normal().data_point_txt
+            full = load(
+                self.filename,
+                selector=self.selector,
+                columns=(data_point,),
+                tables=("raw",),
+                label=self.label,
+            ).data.raw[data_point].to_numpy()
+            self._data_points["full"] = full
+            self._data_points["sorted"] = bool(np.all(full[1:] > full[:-1]))
+        full = self._data_points["full"]
+        if self._data_points["sorted"]:
+            return np.searchsorted(full, data_points)
+        index = externals.pandas.Index(full)
+        if not index.is_unique:
+            logging.debug("raw data points are not unique - window labels from 0")
+            return externals.pandas.RangeIndex(len(data_points))
+        return index.get_indexer(data_points)
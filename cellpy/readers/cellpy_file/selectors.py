@@ -1,4 +1,4 @@
-"""Load selector and limits for cellpy-file (HDF5) reads."""
+"""Load selector and limits for cellpy-file reads."""
 
 from __future__ import annotations
 
@@ -8,22 +8,89 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from cellpy.readers.data_structures import Data
 
+TABLES = ("raw", "steps", "summary")
+
+
+def check_tables(tables) -> tuple[str, ...]:
+    """Validate a ``tables=`` argument; ``None`` means all tables.
+
+    The summary is always included since the load limits are derived from it.
+    """
+    if tables is None:
+        return TABLES
+    if isinstance(tables, str):
+        tables = (tables,)
+    unknown = [t for t in tables if t not in TABLES]
+    if unknown:
+        raise ValueError(
+            f"Unknown cellpy-file table(s) {unknown}; choose from {TABLES}"
+        )
+    return tuple(t for t in TABLES if t in tables or t == "summary")
+
+
+def loaded_columns(columns) -> tuple[str, ...] | None:
+    """The ``columns=`` projection of a load as recorded on ``Data`` (None: all)."""
+    if columns is None:
+        return None
+    if isinstance(columns, str):
+        columns = (columns,)
+    return tuple(columns)
+
+
+def check_complete_raw(data: "Data", partial: bool = False) -> None:
+    """Refuse to write a cell whose raw was loaded with a column projection.
+
+    Writing it would silently drop every raw column that was not loaded.
+    ``partial=True`` writes it anyway (only the loaded columns are stored).
+    """
+    projection = getattr(data, "loaded_columns", None)
+    if projection is not None and not partial:
+        raise ValueError(
+            f"The raw data was loaded with columns={list(projection)}; saving it "
+            f"would drop the other raw columns from the file. Load the cell "
+            f"without columns=, or pass partial=True to save only these columns."
+        )
+
 
 @dataclass(frozen=True)
 class LoadSelector:
+    """Cycle window to load.
+
+    Built from a selector dict with ``max_cycle`` and/or ``min_cycle``, or
+    with ``cycles`` (e.g. ``range(100, 200)``), which selects the window from
+    its lowest to its highest cycle.
+    """
+
     max_cycle: int | None = None
+    min_cycle: int | None = None
 
     @classmethod
     def from_dict(cls, selector: dict | None) -> "LoadSelector":
         if not selector:
             return cls(max_cycle=None)
-        return cls(max_cycle=selector.get("max_cycle"))
+        max_cycle = selector.get("max_cycle")
+        min_cycle = selector.get("min_cycle")
+        if (cycles := selector.get("cycles")) is not None:
+            cycles = [int(c) for c in cycles]
+            if not cycles:
+                raise ValueError("The cycles selector is empty")
+            max_cycle = max(cycles) if max_cycle is None else min(max(cycles), max_cycle)
+            min_cycle = min(cycles) if min_cycle is None else max(min(cycles), min_cycle)
+        return cls(max_cycle=max_cycle, min_cycle=min_cycle)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.max_cycle is None and self.min_cycle is None
 
 
 @dataclass
 class LoadLimits:
     limit_loaded_cycles: int | None = None
     limit_data_points: int | None = None
+    # first data point of a window starting after cycle 1 (HDF5 reads only)
+    first_data_point: int | None = None
+    # the selected cycle window holds no cycle (HDF5 reads only)
+    empty_window: bool = False
 
 
 @dataclass
@@ -89,6 +89,35 @@ def summary_to_legacy(frame: "pd.DataFrame") -> "pd.DataFrame":
     return _rename_present(frame, _summary_native_to_legacy_rename())
 
 
+def raw_projection(columns, available, *, native: bool = True) -> list | None:
+    """Raw columns to read for a ``columns=`` projection on load.
+
+    Args:
+        columns: Requested raw columns, in native or legacy spelling (None
+            means all columns).
+        available: Columns stored in the file.
+        native: True if the file stores native names (v9), False for legacy
+            names (v8).
+
+    Returns:
+        list | None: The stored columns to read, in file order. The key
+        columns (test id, data point, cycle and step) are always included;
+        names the file does not have are dropped.
+    """
+    if columns is None:
+        return None
+    if isinstance(columns, str):
+        columns = [columns]
+    schema = default_schema().raw
+    keys = [schema.test_id, schema.datapoint_num, schema.cycle_num, schema.step_num]
+    to_native = mapping.legacy_to_native_raw()
+    wanted = {to_native.get(col, col) for col in [*keys, *columns]}
+    if not native:
+        to_legacy = dict(mapping.RAW_PAIRS)
+        wanted = {to_legacy.get(col, col) for col in wanted}
+    return [col for col in available if col in wanted]
+
+
 # --- column classification (the totality guard) --------------------------------
 def classify_legacy_columns(columns, family: str) -> dict:
     """Classify legacy columns as ``mapped`` / ``legacy-only`` / ``unknown``.
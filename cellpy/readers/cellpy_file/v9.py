@@ -11,20 +11,33 @@ Metadata document shape is owned by ``meta_archive`` (cellpy policy; core
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
 import io
 import json
 import logging
+import shutil
+import struct
 import zipfile
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Mapping, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Union
 
+from cellpycore.config import default_schema
+
+import cellpy.config as config
 from cellpy.exceptions import CorruptCellpyFile, WrongFileVersion
+from cellpy.parameters.internal_settings import get_headers_summary
 from cellpy.readers import data_structures as ds
 from cellpy.readers import externals
 from cellpy.readers.cellpy_file import fids as cellpy_file_fids
 from cellpy.readers.cellpy_file import meta_archive
 from cellpy.readers.cellpy_file import translate as cellpy_file_translate
 from cellpy.readers.cellpy_file.atomic import atomic_write
+from cellpy.readers.cellpy_file.compression import (
+    get_profile as get_compression_profile,
+)
 from cellpy.readers.cellpy_file.format import (
     CELLPY_FILE_VERSION,
     META_JSON_NAME,
@@ -35,7 +48,14 @@ from cellpy.readers.cellpy_file.format import (
     V9_SUMMARY_PARQUET,
     ZIP_LOCAL_HEADER_MAGIC,
 )
-from cellpy.readers.cellpy_file.selectors import LoadLimits, LoadResult
+from cellpy.readers.cellpy_file.selectors import (
+    LoadLimits,
+    LoadResult,
+    LoadSelector,
+    check_complete_raw,
+    check_tables,
+    loaded_columns,
+)
 
 if TYPE_CHECKING:
     from cellpy.readers.data_structures import Data
@@ -91,31 +111,208 @@ def _normalize_frame_nulls(frame):
     return frame.replace({None: externals.numpy.nan})
 
 
-# Parquet already compresses columns. zstd:3 matches old zip-DEFLATE size
-# without a second zip compressor (#912). Readers still accept snappy (#898).
-PARQUET_COMPRESSION = "zstd"
-PARQUET_COMPRESSION_LEVEL = 3
+# pyarrow's default row-group size, used for raw without a row-group map.
+_PYARROW_ROW_GROUP_ROWS = 1024 * 1024
 
+# Target number of raw rows per parquet row group. Row groups are cut on cycle
+# boundaries, so a cycle never spans two groups (a single cycle longer than the
+# target gets a group of its own).
+RAW_ROW_GROUP_ROWS = 100_000
 
-def _frame_to_parquet_bytes(frame) -> bytes:
-    buf = io.BytesIO()
-    to_write = frame
+# meta.json key holding the raw row-group map written by cycle-aligned saves.
+RAW_ROW_GROUPS_KEY = "raw_row_groups"
+
+# meta.json key listing the raw parts added by ``append`` (after raw.parquet).
+RAW_PARTS_KEY = "raw_parts"
+
+# Chunk size for copying stored members into the staged file on append.
+_COPY_CHUNK_BYTES = 1 << 20
+
+# Per-table digests of the stored content, so a save can tell that the file
+# already holds the same tables and metadata and skip the rewrite.
+CONTENT_DIGESTS_KEY = "content_digests"
+
+# meta.json entries that describe the file rather than the cell.
+_UNDIGESTED_META_KEYS = (
+    "loaded_from",
+    RAW_ROW_GROUPS_KEY,
+    RAW_PARTS_KEY,
+    CONTENT_DIGESTS_KEY,
+)
+
+
+def _frame_for_parquet(frame):
     if getattr(frame, "index", None) is not None and frame.index.name is not None:
         name = frame.index.name
         if name in frame.columns:
-            to_write = frame.reset_index(drop=True)
-        else:
-            to_write = frame.reset_index()
-    to_write.to_parquet(
-        buf,
-        index=False,
-        engine="pyarrow",
-        compression=PARQUET_COMPRESSION,
-        compression_level=PARQUET_COMPRESSION_LEVEL,
+            return frame.reset_index(drop=True)
+        return frame.reset_index()
+    return frame
+
+
+def _frame_to_parquet_bytes(frame, *, compression=None) -> bytes:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(_frame_for_parquet(frame), preserve_index=False)
+    buf = io.BytesIO()
+    pq.write_table(
+        table, buf, **get_compression_profile(compression).parquet_options(table.schema)
     )
     return buf.getvalue()
 
 
+def _cycle_row_groups(cycles, target_rows: int) -> Optional[list[dict]]:
+    """Split rows into runs of whole cycles of roughly ``target_rows`` rows.
+
+    Returns one ``{"first_row", "num_rows", "first_cycle", "last_cycle"}`` entry
+    per row group, or None when the cycle column is not sorted (no alignment
+    possible).
+    """
+    np = externals.numpy
+    cycles = np.asarray(cycles)
+    if not len(cycles):
+        return None
+    if len(cycles) > 1 and (np.diff(cycles) < 0).any():
+        return None
+
+    # first row of every cycle, plus the end of the frame
+    starts = np.flatnonzero(np.r_[True, cycles[1:] != cycles[:-1]])
+    bounds = np.r_[starts, len(cycles)]
+
+    groups = []
+    first = 0
+    for i in range(1, len(bounds)):
+        stop = int(bounds[i])
+        if stop - first >= target_rows or stop == len(cycles):
+            groups.append(
+                {
+                    "first_row": first,
+                    "num_rows": stop - first,
+                    "first_cycle": int(cycles[first]),
+                    "last_cycle": int(cycles[stop - 1]),
+                }
+            )
+            first = stop
+    return groups
+
+
+def _raw_row_group_map(
+    frame, cycle_column: str, target_rows: Optional[int]
+) -> Optional[dict]:
+    """Row-group map for ``meta.json`` (None: write raw with pyarrow defaults)."""
+    if not target_rows or cycle_column not in frame.columns:
+        return None
+    groups = _cycle_row_groups(frame[cycle_column].to_numpy(), int(target_rows))
+    if groups is None:
+        return None
+    return {
+        "cycle_column": cycle_column,
+        "groups": [dict(row_group=i, **group) for i, group in enumerate(groups)],
+    }
+
+
+def _raw_chunks(n_rows: int, row_group_map: Optional[Mapping], chunk_rows: int):
+    """``(first_row, num_rows)`` of every raw row group to write."""
+    if row_group_map is not None:
+        return [(g["first_row"], g["num_rows"]) for g in row_group_map["groups"]]
+    return [
+        (first, min(chunk_rows, n_rows - first))
+        for first in range(0, n_rows, chunk_rows)
+    ]
+
+
+def _write_raw_member(
+    zf: zipfile.ZipFile,
+    frame,
+    row_group_map: Optional[Mapping],
+    chunk_rows: Optional[int],
+    *,
+    name: str = V9_RAW_PARQUET,
+    schema=None,
+    compression=None,
+) -> None:
+    """Stream raw into its zip member, one row group at a time.
+
+    Each row group is converted to arrow, encoded and written straight into
+    the open (stored) zip member before the next one is touched, so neither
+    an arrow copy of the whole frame nor the whole encoded parquet is ever
+    held in memory. Row groups follow ``row_group_map`` when there is one,
+    else ``chunk_rows`` rows (pyarrow's default size when None). ``schema``
+    (arrow) pins the column types, e.g. to those of the parts already stored.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    frame = _frame_for_parquet(frame)
+    if schema is None:
+        schema = pa.Schema.from_pandas(frame, preserve_index=False)
+    chunks = _raw_chunks(
+        len(frame), row_group_map, chunk_rows or _PYARROW_ROW_GROUP_ROWS
+    )
+    with zf.open(name, mode="w", force_zip64=True) as member:
+        with pq.ParquetWriter(
+            member,
+            schema,
+            **get_compression_profile(compression).parquet_options(schema),
+        ) as writer:
+            for first, num_rows in chunks:
+                chunk = pa.Table.from_pandas(
+                    frame.iloc[first : first + num_rows],
+                    schema=schema,
+                    preserve_index=False,
+                )
+                writer.write_table(chunk, row_group_size=num_rows)
+
+
+@contextlib.contextmanager
+def _encoded_members(encoders: Mapping[str, Callable[[], bytes]], workers: int):
+    """Start encoding the members; yields ``(name, bytes)`` pairs in order.
+
+    With more than one worker the members are encoded concurrently in a thread
+    pool (pyarrow releases the GIL while encoding and compressing), starting
+    on entry, so they are encoded while the caller streams raw into the zip.
+    Each one is handed on as soon as it and the members before it are done.
+    """
+    names = list(encoders)
+    if workers <= 1 or len(names) <= 1:
+        yield ((name, encoders[name]()) for name in names)
+        return
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="cellpy-save"
+    ) as pool:
+        futures = [pool.submit(encoders[name]) for name in names]
+        try:
+            yield (
+                (name, future.result()) for name, future in zip(names, futures)
+            )
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _save_workers(workers: Optional[int], members: int) -> int:
+    if workers is None:
+        workers = getattr(config.reader, "save_workers", None)
+    if workers is None:
+        workers = members
+    return max(1, min(int(workers), members))
+
+
+def _row_groups_for(row_group_map: Optional[Mapping], selector: LoadSelector):
+    """Indices of the raw row groups overlapping the cycle window of ``selector``."""
+    if not row_group_map or selector.is_empty:
+        return None
+    low = selector.min_cycle
+    high = selector.max_cycle
+    return [
+        group["row_group"]
+        for group in row_group_map.get("groups", [])
+        if (high is None or group["first_cycle"] <= high)
+        and (low is None or group["last_cycle"] >= low)
+    ]
+
+
 def _verify_members(path: Path, required: list[str]) -> None:
     """Reject a staged v9 zip that does not hold every expected member.
 
@@ -131,36 +328,146 @@ def _verify_members(path: Path, required: list[str]) -> None:
         )
 
 
-def _read_parquet_member(zf: zipfile.ZipFile, name: str):
+def _cycle_filters(selector: LoadSelector, column: str) -> Optional[list]:
+    """pyarrow ``filters`` for the cycle window of ``selector`` (None if unlimited)."""
+    filters = []
+    if selector.min_cycle is not None:
+        filters.append((column, ">=", int(selector.min_cycle)))
+    if selector.max_cycle is not None:
+        filters.append((column, "<=", int(selector.max_cycle)))
+    return filters or None
+
+
+# Fixed part of a zip local file header; the file name and extra field follow.
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+
+def _stored_member_buffer(mm, info: zipfile.ZipInfo):
+    """Zero-copy slice of a stored member's bytes in the memory-mapped zip.
+
+    Returns None if the member is compressed or encrypted (no contiguous
+    payload to hand out) or its local header does not look right.
+    """
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return None
+    header = mm.read_at(_ZIP_LOCAL_HEADER_SIZE, info.header_offset)
+    if header[:4] != ZIP_LOCAL_HEADER_MAGIC:
+        return None
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    offset = info.header_offset + _ZIP_LOCAL_HEADER_SIZE + name_length + extra_length
+    if offset + info.file_size > mm.size():
+        return None
+    mm.seek(offset)
+    return mm.read_buffer(info.file_size)
+
+
+@contextlib.contextmanager
+def _open_member(zf: zipfile.ZipFile, name: str):
+    """Seekable source for a parquet member, memory-mapped when possible.
+
+    ``save`` writes parquet members ``ZIP_STORED``, so their bytes lie
+    contiguously in the zip file. Those are handed to pyarrow as a slice of a
+    memory map of the file: nothing is copied into Python bytes, and pages are
+    shared through the OS page cache with other processes reading the same
+    file. Other members fall back to the (seekable) zip member handle.
+    """
     try:
-        raw = zf.read(name)
+        info = zf.getinfo(name)
     except KeyError as e:
         raise CorruptCellpyFile(f"missing zip member {name!r}") from e
-    frame = externals.pandas.read_parquet(io.BytesIO(raw), engine="pyarrow")
-    return _normalize_frame_nulls(frame)
 
+    import pyarrow as pa
 
-def save(
-    data: "Data",
-    path: PathLike,
-    *,
-    cellpy_units: Optional[Mapping[str, Any]] = None,
-) -> None:
-    """Write ``Data`` as a v9 ``.cellpy`` zip (parquet tables + ``meta.json``).
+    if zf.filename is not None:
+        with pa.memory_map(zf.filename, "r") as mm:
+            buffer = _stored_member_buffer(mm, info)
+            if buffer is not None:
+                yield pa.BufferReader(buffer)
+                return
+    with zf.open(info) as fh:
+        yield fh
 
-    Frames are translated to native column names for storage. The in-memory
-    ``data`` object is **not** mutated (work is done on copies).
+
+def _member_columns(zf: zipfile.ZipFile, name: str) -> list[str]:
+    """Column names of a parquet member (reads only its footer)."""
+    import pyarrow.parquet as pq
+
+    with _open_member(zf, name) as source:
+        return pq.read_schema(source).names
+
+
+def _read_parquet_member(
+    zf: zipfile.ZipFile,
+    name: str,
+    *,
+    filters: Optional[list] = None,
+    row_groups: Optional[list[int]] = None,
+    columns: Optional[list[str]] = None,
+):
+    """Read one parquet member, optionally with row filters pushed to pyarrow.
+
+    The member is read through ``_open_member``, so only the footer, the
+    requested ``columns`` and the row groups whose statistics can match the
+    ``filters`` are touched; the filter is dropped if the member does not have
+    the filtered column. ``row_groups`` (from the ``meta.json`` row-group map)
+    names the groups to read directly.
     """
-    path = Path(path)
-    had_test_id = _frames_had_test_id(data)
+    if row_groups is not None:
+        return _read_row_groups(zf, name, row_groups, filters, columns)
+
+    import pyarrow.parquet as pq
+
+    with _open_member(zf, name) as source:
+        if filters is not None:
+            names = pq.read_schema(source).names
+            source.seek(0)
+            if not all(column in names for column, _, _ in filters):
+                _module_logger.debug(
+                    "%s: no column to filter on - reading all rows", name
+                )
+                filters = None
+        frame = externals.pandas.read_parquet(
+            source, engine="pyarrow", filters=filters, columns=columns
+        )
+    return _normalize_frame_nulls(frame)
+
+
+def _read_row_groups(
+    zf: zipfile.ZipFile,
+    name: str,
+    row_groups: list[int],
+    filters: Optional[list],
+    columns: Optional[list[str]] = None,
+):
+    import pyarrow.parquet as pq
+
+    with _open_member(zf, name) as source:
+        table = pq.ParquetFile(source).read_row_groups(row_groups, columns=columns)
+        if filters is not None:
+            table = table.filter(pq.filters_to_expression(filters))
+        frame = table.to_pandas()
+    return _normalize_frame_nulls(frame)
+
+
+def _native_scratch(data: "Data") -> "Data":
+    """Shallow, native-named stand-in for ``data`` to write from.
 
+    Shallow copies: pandas copy-on-write keeps ``data`` untouched, and the
+    renames in to_native do not copy column data either.
+    """
     scratch = ds.Data()
-    scratch.raw = data.raw.copy() if data.raw is not None else externals.pandas.DataFrame()
+    scratch.raw = (
+        data.raw.copy(deep=False)
+        if data.raw is not None
+        else externals.pandas.DataFrame()
+    )
     scratch.steps = (
-        data.steps.copy() if data.steps is not None else externals.pandas.DataFrame()
+        data.steps.copy(deep=False)
+        if data.steps is not None
+        else externals.pandas.DataFrame()
     )
     scratch.summary = (
-        data.summary.copy()
+        data.summary.copy(deep=False)
         if data.summary is not None
         else externals.pandas.DataFrame()
     )
@@ -175,21 +482,158 @@ def save(
     scratch.raw_data_files_length = list(data.raw_data_files_length or [])
     scratch.loaded_from = getattr(data, "loaded_from", None)
 
-    cellpy_file_translate.to_native(scratch)
+    return cellpy_file_translate.to_native(scratch)
+
 
+def _meta_document(data: "Data", cellpy_units: Optional[Mapping[str, Any]]) -> dict:
     meta_doc = meta_archive.build_meta_document(
         data,
         cellpy_units=cellpy_units,
-        frames_had_test_id=had_test_id,
+        frames_had_test_id=_frames_had_test_id(data),
     )
     meta_doc["active_test_id"] = int(data.active_test_id)
+    return meta_doc
 
-    fid_table = cellpy_file_fids.convert2fid_table(data)
-    fid_df = externals.pandas.DataFrame(fid_table)
 
-    required = [META_JSON_NAME, V9_RAW_PARQUET, V9_STEPS_PARQUET, V9_SUMMARY_PARQUET]
+def _table_encoders(
+    data: "Data", scratch: "Data", compression=None
+) -> dict[str, Callable[[], bytes]]:
+    """Encoders for the members other than raw, in archive order."""
+    fid_df = externals.pandas.DataFrame(cellpy_file_fids.convert2fid_table(data))
+    frames = {V9_STEPS_PARQUET: scratch.steps, V9_SUMMARY_PARQUET: scratch.summary}
     if not fid_df.empty:
-        required.append(V9_FID_PARQUET)
+        frames[V9_FID_PARQUET] = fid_df
+    return {
+        name: functools.partial(_frame_to_parquet_bytes, frame, compression=compression)
+        for name, frame in frames.items()
+    }
+
+
+def _frame_digest(frame) -> str:
+    """Digest of a frame's column names, dtypes and values (not its index)."""
+    digest = hashlib.blake2b(digest_size=16)
+    if frame is None or not len(frame.columns):
+        return digest.hexdigest()
+    frame = _frame_for_parquet(frame)
+    header = [(str(c), str(t)) for c, t in frame.dtypes.items()]
+    digest.update(json.dumps(header).encode("utf-8"))
+    rows = externals.pandas.util.hash_pandas_object(frame, index=False)
+    digest.update(rows.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _content_digests(
+    data: "Data", scratch: "Data", meta_doc: Mapping
+) -> Optional[dict]:
+    """Digests of the tables and metadata written for ``data`` (None if unhashable)."""
+    meta = {k: v for k, v in meta_doc.items() if k not in _UNDIGESTED_META_KEYS}
+    meta_json = json.dumps(meta, sort_keys=True, default=meta_archive._json_default)
+    meta_digest = hashlib.blake2b(meta_json.encode("utf-8"), digest_size=16)
+    fid_df = externals.pandas.DataFrame(cellpy_file_fids.convert2fid_table(data))
+    try:
+        return {
+            "raw": _frame_digest(scratch.raw),
+            "steps": _frame_digest(scratch.steps),
+            "summary": _frame_digest(scratch.summary),
+            "fid": _frame_digest(fid_df),
+            "meta": meta_digest.hexdigest(),
+        }
+    except TypeError as e:
+        _module_logger.debug("could not digest the tables (%s)", e)
+        return None
+
+
+def _add_content_digests(data: "Data", scratch: "Data", meta_doc: dict) -> None:
+    digests = _content_digests(data, scratch, meta_doc)
+    if digests is not None:
+        meta_doc[CONTENT_DIGESTS_KEY] = digests
+
+
+def is_unchanged(
+    data: "Data", path: PathLike, *, cellpy_units: Optional[Mapping[str, Any]] = None
+) -> bool:
+    """True if the v9 file at ``path`` already holds what ``save`` would write.
+
+    Compares the content digests stored in ``meta.json`` with digests of
+    ``data`` (raw, steps, summary, fid table and metadata). Files without
+    digests (written before they were added) never count as unchanged.
+    """
+    path = Path(path)
+    if not path.is_file() or not is_zip_cellpy(path):
+        return False
+    try:
+        stored = read_meta(path).get(CONTENT_DIGESTS_KEY)
+    except (CorruptCellpyFile, WrongFileVersion):
+        return False
+    if not stored:
+        return False
+    meta_doc = _meta_document(data, cellpy_units)
+    return _content_digests(data, _native_scratch(data), meta_doc) == stored
+
+
+def _write_meta_member(zf: zipfile.ZipFile, meta_doc: Mapping) -> None:
+    zf.writestr(
+        META_JSON_NAME,
+        json.dumps(meta_doc, indent=2, default=meta_archive._json_default),
+        compress_type=zipfile.ZIP_DEFLATED,
+    )
+
+
+def save(
+    data: "Data",
+    path: PathLike,
+    *,
+    cellpy_units: Optional[Mapping[str, Any]] = None,
+    raw_row_group_rows: Optional[int] = RAW_ROW_GROUP_ROWS,
+    workers: Optional[int] = None,
+    compression=None,
+    partial: bool = False,
+) -> None:
+    """Write ``Data`` as a v9 ``.cellpy`` zip (parquet tables + ``meta.json``).
+
+    Frames are translated to native column names for storage. The in-memory
+    ``data`` object is **not** mutated (work is done on copies).
+
+    ``raw.parquet`` is written with row groups of about ``raw_row_group_rows``
+    rows cut on cycle boundaries, and the cycle range of every row group is
+    recorded in ``meta.json`` (``raw_row_groups``), so loading a cycle window
+    reads only the groups holding it. Pass ``raw_row_group_rows=None`` to write
+    raw with pyarrow defaults (no row-group map).
+
+    Raw is streamed into the zip one row group at a time, so the writer never
+    holds more than one row group of it beyond the frame itself. The smaller
+    tables are encoded meanwhile by ``workers`` threads (default
+    ``config.reader.save_workers``, or one per table when that is unset);
+    ``workers=1`` encodes them one after another.
+
+    ``compression`` is a compression profile (``"fast"``, ``"balanced"``,
+    ``"archive"`` or ``"none"``, see ``cellpy_file.compression``); the default
+    is ``config.reader.compression_profile``, else ``"balanced"``.
+
+    ``meta.json`` records a digest of every table and of the metadata
+    (``content_digests``); ``is_unchanged`` compares them with a ``Data``
+    object to find out whether a rewrite would change anything. The digests
+    cover the content only, not the compression profile.
+
+    A cell loaded with a raw column projection (``columns=``) is refused with
+    a ``ValueError`` unless ``partial=True``.
+    """
+    check_complete_raw(data, partial)
+    path = Path(path)
+    compression = get_compression_profile(compression)
+    scratch = _native_scratch(data)
+    meta_doc = _meta_document(data, cellpy_units)
+    _add_content_digests(data, scratch, meta_doc)
+
+    row_group_map = _raw_row_group_map(
+        scratch.raw, default_schema().raw.cycle_num, raw_row_group_rows
+    )
+    if row_group_map is not None:
+        meta_doc[RAW_ROW_GROUPS_KEY] = row_group_map
+
+    encoders = _table_encoders(data, scratch, compression)
+    required = [META_JSON_NAME, V9_RAW_PARQUET, *encoders]
+    workers = _save_workers(workers, len(encoders))
 
     def verify(staged: Path) -> None:
         _verify_members(staged, required)
@@ -199,23 +643,186 @@ def save(
     # and stays deflated. ZIP_STORED is plain zip - old readers handle it.
     with atomic_write(path, verify=verify) as staged:
         with zipfile.ZipFile(staged, mode="w", compression=zipfile.ZIP_STORED) as zf:
-            zf.writestr(
-                META_JSON_NAME,
-                json.dumps(meta_doc, indent=2, default=meta_archive._json_default),
-                compress_type=zipfile.ZIP_DEFLATED,
-            )
-            zf.writestr(V9_RAW_PARQUET, _frame_to_parquet_bytes(scratch.raw))
-            zf.writestr(V9_STEPS_PARQUET, _frame_to_parquet_bytes(scratch.steps))
-            zf.writestr(V9_SUMMARY_PARQUET, _frame_to_parquet_bytes(scratch.summary))
-            if not fid_df.empty:
-                zf.writestr(V9_FID_PARQUET, _frame_to_parquet_bytes(fid_df))
+            _write_meta_member(zf, meta_doc)
+            with _encoded_members(encoders, workers) as members:
+                _write_raw_member(
+                    zf,
+                    scratch.raw,
+                    row_group_map,
+                    raw_row_group_rows,
+                    compression=compression,
+                )
+                for name, payload in members:
+                    zf.writestr(name, payload)
 
     _module_logger.debug("wrote v9 cellpy-file %s", path)
 
 
-def load(filename: PathLike, *, selector=None) -> LoadResult:
-    """Load a v9 ``.cellpy`` zip into a legacy-named ``Data`` object."""
-    del selector  # max_cycle selection not implemented for v9 yet
+def _raw_members(meta_doc: Mapping) -> list[tuple[str, Optional[Mapping]]]:
+    """``(member, row-group map)`` of every raw part, in row order."""
+    parts = [(V9_RAW_PARQUET, meta_doc.get(RAW_ROW_GROUPS_KEY))]
+    for part in meta_doc.get(RAW_PARTS_KEY) or []:
+        parts.append((part["member"], part.get(RAW_ROW_GROUPS_KEY)))
+    return parts
+
+
+def _stored_raw_shape(zf: zipfile.ZipFile, members: list[str]):
+    """Number of stored raw rows and their arrow schema (parquet footers only)."""
+    import pyarrow.parquet as pq
+
+    rows = 0
+    schema = None
+    for name in members:
+        with _open_member(zf, name) as source:
+            parquet = pq.ParquetFile(source)
+            rows += parquet.metadata.num_rows
+            schema = parquet.schema_arrow
+    return rows, schema
+
+
+def _copy_member(source: zipfile.ZipFile, target: zipfile.ZipFile, name: str) -> None:
+    """Copy a member's bytes from one zip into another without re-encoding."""
+    info = source.getinfo(name)
+    copied = zipfile.ZipInfo(name, date_time=info.date_time)
+    copied.compress_type = info.compress_type
+    with source.open(info) as src, target.open(copied, mode="w", force_zip64=True) as dst:
+        shutil.copyfileobj(src, dst, _COPY_CHUNK_BYTES)
+
+
+def append(
+    data: "Data",
+    path: PathLike,
+    *,
+    cellpy_units: Optional[Mapping[str, Any]] = None,
+    raw_row_group_rows: Optional[int] = RAW_ROW_GROUP_ROWS,
+    workers: Optional[int] = None,
+    compression=None,
+    partial: bool = False,
+) -> bool:
+    """Add the raw rows appended to ``data`` since ``path`` was written.
+
+    Only the new raw rows are encoded, into an extra ``raw_part_NNNN.parquet``
+    member. The raw members already in the file are copied over as they are
+    (no parquet decoding or encoding), and steps, summary, fid table and
+    ``meta.json`` are written anew. ``load`` stitches the raw parts back
+    together.
+
+    The new file is staged next to ``path`` and replaces it only once it is
+    complete (as for ``save``), so an interrupted append leaves ``path`` as it
+    was. The new members are written with the ``compression`` profile.
+
+    Whether the raw of ``data`` continues the file is decided on the raw
+    digest stored in ``meta.json`` (``content_digests``): the first rows of
+    ``data.raw`` must hash to it. A cell loaded with a raw column projection
+    is refused as by ``save`` (``partial``).
+
+    Returns:
+        bool: False (file untouched) when ``path`` cannot be appended to - it
+        is not a v9 file, it has no raw digest (written before digests were
+        added) or its raw is not the start of ``data.raw``. Do a full ``save``
+        then.
+    """
+    check_complete_raw(data, partial)
+    path = Path(path)
+    if not path.is_file() or not is_zip_cellpy(path):
+        return False
+    try:
+        old_meta = read_meta(path)
+    except (CorruptCellpyFile, WrongFileVersion):
+        return False
+    stored_digest = (old_meta.get(CONTENT_DIGESTS_KEY) or {}).get("raw")
+    if stored_digest is None:
+        _module_logger.debug("%s: no raw digest to append against", path)
+        return False
+
+    scratch = _native_scratch(data)
+    raw = scratch.raw
+    raw_members = [name for name, _ in _raw_members(old_meta)]
+    with zipfile.ZipFile(path, mode="r") as zf:
+        stored_rows, stored_schema = _stored_raw_shape(zf, raw_members)
+    if (
+        len(raw) < stored_rows
+        or stored_schema is None
+        or _frame_digest(raw.iloc[:stored_rows]) != stored_digest
+    ):
+        _module_logger.debug("%s: raw does not continue the file", path)
+        return False
+
+    meta_doc = _meta_document(data, cellpy_units)
+    _add_content_digests(data, scratch, meta_doc)
+    for key in (RAW_ROW_GROUPS_KEY, RAW_PARTS_KEY):
+        if key in old_meta:
+            meta_doc[key] = old_meta[key]
+    new_raw = raw.iloc[stored_rows:]
+    new_members = []
+    if len(new_raw):
+        part = f"raw_part_{len(raw_members):04d}.parquet"
+        part_map = _raw_row_group_map(
+            new_raw, default_schema().raw.cycle_num, raw_row_group_rows
+        )
+        entry = {"member": part}
+        if part_map is not None:
+            entry[RAW_ROW_GROUPS_KEY] = part_map
+        meta_doc[RAW_PARTS_KEY] = [*meta_doc.get(RAW_PARTS_KEY, []), entry]
+        new_members.append(part)
+
+    compression = get_compression_profile(compression)
+    encoders = _table_encoders(data, scratch, compression)
+    required = [META_JSON_NAME, *raw_members, *new_members, *encoders]
+    workers = _save_workers(workers, len(encoders))
+
+    def verify(staged: Path) -> None:
+        _verify_members(staged, required)
+
+    with atomic_write(path, verify=verify) as staged:
+        with zipfile.ZipFile(path, mode="r") as source, zipfile.ZipFile(
+            staged, mode="w", compression=zipfile.ZIP_STORED
+        ) as zf:
+            _write_meta_member(zf, meta_doc)
+            with _encoded_members(encoders, workers) as members:
+                for name in raw_members:
+                    _copy_member(source, zf, name)
+                if len(new_raw):
+                    _write_raw_member(
+                        zf,
+                        new_raw,
+                        part_map,
+                        raw_row_group_rows,
+                        name=part,
+                        schema=stored_schema,
+                        compression=compression,
+                    )
+                for name, payload in members:
+                    zf.writestr(name, payload)
+
+    _module_logger.debug(
+        "appended %s raw rows to v9 cellpy-file %s", len(new_raw), path
+    )
+    return True
+
+
+def load(
+    filename: PathLike, *, selector=None, columns=None, tables=None
+) -> LoadResult:
+    """Load a v9 ``.cellpy`` zip into a legacy-named ``Data`` object.
+
+    ``selector`` (``{"max_cycle": n}``, optionally with ``"min_cycle"``, or
+    ``{"cycles": ...}``, see ``LoadSelector``) is
+    pushed down to pyarrow as a filter on the cycle column of the raw, step
+    and summary tables, so row groups outside the window are skipped. Files
+    with a raw row-group map read only the raw row groups covering the window.
+    Raw parts added by ``append`` are read the same way and concatenated.
+
+    ``columns`` (native or legacy names) limits the raw columns read from the
+    file; the key columns (test id, data point, cycle, step) are always kept.
+
+    ``tables`` (any of ``"raw"``, ``"steps"``, ``"summary"``) skips reading
+    the parquet members of the tables not listed; those frames are left
+    empty. The summary and the metadata are always read.
+    """
+    tables = check_tables(tables)
+    selection = LoadSelector.from_dict(selector)
+    schema = default_schema()
     path = Path(filename)
     if not path.is_file():
         raise IOError(f"File does not exist: {filename}")
@@ -235,9 +842,39 @@ def load(filename: PathLike, *, selector=None) -> LoadResult:
             )
 
         data = ds.Data()
-        data.raw = _read_parquet_member(zf, V9_RAW_PARQUET)
-        data.steps = _read_parquet_member(zf, V9_STEPS_PARQUET)
-        data.summary = _read_parquet_member(zf, V9_SUMMARY_PARQUET)
+        data.loaded_columns = loaded_columns(columns)
+        if "raw" in tables:
+            raw_columns = None
+            if columns is not None:
+                raw_columns = cellpy_file_translate.raw_projection(
+                    columns, _member_columns(zf, V9_RAW_PARQUET)
+                )
+            raw_parts = [
+                _read_parquet_member(
+                    zf,
+                    member,
+                    filters=_cycle_filters(selection, schema.raw.cycle_num),
+                    row_groups=_row_groups_for(row_group_map, selection),
+                    columns=raw_columns,
+                )
+                for member, row_group_map in _raw_members(meta_doc)
+            ]
+            data.raw = (
+                raw_parts[0]
+                if len(raw_parts) == 1
+                else externals.pandas.concat(raw_parts, ignore_index=True)
+            )
+        if "steps" in tables:
+            data.steps = _read_parquet_member(
+                zf,
+                V9_STEPS_PARQUET,
+                filters=_cycle_filters(selection, schema.step.cycle_num),
+            )
+        data.summary = _read_parquet_member(
+            zf,
+            V9_SUMMARY_PARQUET,
+            filters=_cycle_filters(selection, schema.cycle.cycle_num),
+        )
 
         if V9_FID_PARQUET in zf.namelist():
             fid_table = _read_parquet_member(zf, V9_FID_PARQUET)
@@ -248,6 +885,13 @@ def load(filename: PathLike, *, selector=None) -> LoadResult:
             data.raw_data_files = []
             data.raw_data_files_length = []
 
+    return _finish_load(data, meta_doc, selection, path)
+
+
+def _finish_load(
+    data: "Data", meta_doc: Mapping, selection: LoadSelector, loaded_from
+) -> LoadResult:
+    """Apply the metadata, translate to legacy names and derive the limits."""
     meta_archive.apply_meta_document(data, meta_doc)
     # Keep real campaign test_id columns; strip only injected ones.
     cellpy_file_translate.to_legacy(data, injected_test_id=False)
@@ -257,9 +901,14 @@ def load(filename: PathLike, *, selector=None) -> LoadResult:
         "summary": False,
     }
     _strip_injected_test_id(data, had)
-    data.loaded_from = str(path)
+    data.loaded_from = str(loaded_from)
 
     limits = LoadLimits()
+    if not selection.is_empty:
+        limits.limit_loaded_cycles = selection.max_cycle
+        point_col = get_headers_summary().data_point
+        if point_col in data.summary.columns and len(data.summary):
+            limits.limit_data_points = int(data.summary[point_col].max())
     return LoadResult.from_limits(data, CELLPY_FILE_VERSION, limits)
 
 
@@ -298,6 +947,19 @@ def read_meta(path: PathLike) -> dict:
     return meta_doc
 
 
+def read_fid_table(path: PathLike):
+    """Read the raw-file ids of a v9 file (``None`` if it has no fid table)."""
+    try:
+        with zipfile.ZipFile(path, mode="r") as zf:
+            if V9_FID_PARQUET not in zf.namelist():
+                return None
+            fid_table = _read_parquet_member(zf, V9_FID_PARQUET)
+    except (OSError, zipfile.BadZipFile) as e:
+        _module_logger.debug("could not read the fid table of %s (%s)", path, e)
+        return None
+    return cellpy_file_fids.convert2fid_list(fid_table)
+
+
 def get_version_from_zip(path: PathLike) -> int:
     """Read ``cellpy_file_version`` from a v9 zip's ``meta.json``."""
     return int(read_meta(path).get("cellpy_file_version", 0))
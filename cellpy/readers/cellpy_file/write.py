@@ -13,6 +13,7 @@ from cellpy.readers import externals
 from cellpy.readers.cellpy_file import dtype as cellpy_file_dtype
 from cellpy.readers.cellpy_file import fids as cellpy_file_fids
 from cellpy.readers.cellpy_file.atomic import atomic_write
+from cellpy.readers.cellpy_file.selectors import check_complete_raw
 
 _module_logger = logging.getLogger(__name__)
 
@@ -54,8 +55,14 @@ def create_infotable(data, fmt: CellpyFileFormat = FORMAT_V8):
     return new_info_table, new_info_table_test_dependent, fidtable
 
 
-def save(data, path, *, format_spec: CellpyFileFormat = FORMAT_V8) -> None:
-    """Write ``Data`` to a cellpy-file (HDF5) with a single owned store lifecycle."""
+def save(
+    data, path, *, format_spec: CellpyFileFormat = FORMAT_V8, partial: bool = False
+) -> None:
+    """Write ``Data`` to a cellpy-file (HDF5) with a single owned store lifecycle.
+
+    A cell loaded with a raw column projection is refused unless ``partial``.
+    """
+    check_complete_raw(data, partial)
     require_hdf5_support(f"writing the HDF5 cellpy-file {path}")
     fmt = format_spec
     if getattr(data, "_extra_tests", None):
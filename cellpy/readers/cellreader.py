@@ -1381,16 +1381,26 @@ class CellpyCell:
         # their parse result (AutoLoader, arbin_res, biologics_mpr, …) reuse it
         # when building the Data shell below.
         prefetched_harmonized_raw = None
+        parse_cache, parse_cache_key, cached_data = None, None, None
         if (
             self.native_schema
             and getattr(config.reader, "use_harmonized_raw", True)
             and len(self.file_names) == 1
         ):
-            # Forward loader knobs (bad_steps, data_points, …) so parse and the
-            # cached Data shell see the same filters as loader() would.
-            prefetched_harmonized_raw = self._try_harmonized_raw_frame(
-                refuse_copying=refuse_copying, **kwargs
-            )
+            # Hooks can change anything, so loads using them are not cached.
+            hooked = pre_processor_hook is not None or post_processor_hook is not None
+            if is_a_file and not hooked:
+                parse_cache, parse_cache_key = self._parse_cache_entry(**kwargs)
+            if parse_cache_key is not None:
+                cached = parse_cache.get(parse_cache_key, self.file_names[0])
+                if cached is not None:
+                    prefetched_harmonized_raw, cached_data = cached
+            if prefetched_harmonized_raw is None:
+                # Forward loader knobs (bad_steps, data_points, …) so parse and
+                # the cached Data shell see the same filters as loader() would.
+                prefetched_harmonized_raw = self._try_harmonized_raw_frame(
+                    refuse_copying=refuse_copying, **kwargs
+                )
         if self.loader_class is not None:
             # Loaders may skip work whose only product is the legacy raw frame
             # that the harmonized frame replaces below (#902).
@@ -1398,8 +1408,9 @@ class CellpyCell:
                 prefetched_harmonized_raw is not None
             )
 
-        data = None
-        for file_name in self.file_names:
+        # a parse-cache hit already holds the Data shell the loader would build
+        data = cached_data
+        for file_name in self.file_names if data is None else ():
             logging.debug("loading raw file:")
             logging.debug(f"{file_name}")
             if is_a_file:
@@ -1477,6 +1488,12 @@ class CellpyCell:
             "raw_file_names": [f.name for f in data.raw_data_files],
             "loaded_datetime": datetime.datetime.now().isoformat(),
         }
+        if (
+            parse_cache_key is not None
+            and cached_data is None
+            and prefetched_harmonized_raw is not None
+        ):
+            parse_cache.put(parse_cache_key, prefetched_harmonized_raw, data)
 
         self.data = data
         if self.native_schema:
@@ -1520,6 +1537,23 @@ class CellpyCell:
         self.last_uploaded_at = datetime.datetime.now()
         return self
 
+    def _parse_cache_entry(self, **parse_kwargs):
+        """The parse cache and the key of the file to load (``None`` if off).
+
+        Only local single files loaded by a loader with a two-stage parse are
+        cached; see :mod:`cellpy.readers.parse_cache`.
+        """
+        from cellpy.readers.parse_cache import ParseCache, cache_key
+
+        parse_cache = ParseCache.from_config()
+        loader = self.loader_class
+        if parse_cache is None or loader is None or not hasattr(loader, "parse"):
+            return None, None
+        source = self.file_names[0]
+        if getattr(source, "is_external", False):
+            return None, None
+        return parse_cache, cache_key(source, loader, **parse_kwargs)
+
     def _try_harmonized_raw_frame(self, *, refuse_copying=False, **parse_kwargs):
         """Phase C: try ``harmonize(parse())`` for single-file raw.
 
@@ -1620,6 +1654,9 @@ class CellpyCell:
         return_cls=True,
         accept_old=False,
         selector=None,
+        columns=None,
+        tables=None,
+        label=None,
         **kwargs,
     ):
         """Loads a cellpy file.
@@ -1633,7 +1670,18 @@ class CellpyCell:
                 ``WrongFileVersion`` naming ``cellpy convert`` on 1.x. Pass
                 ``True`` only as an escape (tests / advanced use). Prefer
                 rewriting with ``cellpy convert`` instead.
-            selector (dict): Experimental feature - select specific ranges of data.
+            selector (dict): select a cycle window, e.g. ``{"max_cycle": 50}``,
+                ``{"min_cycle": 100, "max_cycle": 199}`` or
+                ``{"cycles": range(100, 200)}``. Only the rows of the window
+                are read from the file.
+            columns (list of str): load only these raw columns (native or legacy
+                names). The data point, cycle and step columns are always
+                loaded.
+            tables (tuple of str): load only these tables (e.g. ``("summary",)``;
+                the summary and meta-data are always loaded). The raw and step
+                tables left out are read from the file on first access.
+            label (str): the cell to load when ``cellpy_file`` is a dataset
+                store (a directory written with ``cellpy_file_format="dataset"``).
 
         Returns:
             cellpy.CellpyCell class if return_cls is True
@@ -1657,6 +1705,9 @@ class CellpyCell:
             accept_old=accept_old,
             selector=selector,
             parent_level=parent_level,
+            columns=columns,
+            tables=tables,
+            label=label,
         )
         data = result.data
         limits = result
@@ -1672,6 +1723,10 @@ class CellpyCell:
                 )
 
                 cellpy_file_translate.to_native(self.data)
+            if tables is not None:
+                self._defer_skipped_tables(
+                    cellpy_file, tables, selector=selector, columns=columns, label=label
+                )
             self.limit_loaded_cycles = limits.limit_loaded_cycles
             self.limit_data_points = limits.limit_data_points
 
@@ -1680,7 +1735,7 @@ class CellpyCell:
             logging.warning("Could not load")
             logging.warning(str(cellpy_file))
 
-        self._invent_a_cell_name(cellpy_file)
+        self._invent_a_cell_name(cellpy_file if label is None else cellpy_file / label)
         self.last_uploaded_from = cellpy_file
         self.cellpy_file_name = cellpy_file
         self.last_uploaded_at = datetime.datetime.now()
@@ -1688,6 +1743,25 @@ class CellpyCell:
         if return_cls:
             return self
 
+    def _defer_skipped_tables(
+        self, cellpy_file, tables, selector=None, columns=None, label=None
+    ):
+        """Register loaders for the tables left out of a partial load."""
+        for table in ("raw", "steps"):
+            if table in tables or not getattr(self.data, table).empty:
+                continue
+            self.data.defer(
+                table,
+                cellpy_file_read.DeferredTable(
+                    cellpy_file,
+                    table,
+                    selector=selector,
+                    columns=tuple(columns) if columns and table == "raw" else None,
+                    native=self.native_schema,
+                    label=label,
+                ),
+            )
+
     def save(
         self,
         filename,
@@ -1697,12 +1771,23 @@ class CellpyCell:
         ensure_step_table=None,
         ensure_summary_table=None,
         cellpy_file_format=None,
+        append=False,
+        label=None,
+        skip_unchanged=False,
+        compression=None,
+        partial=False,
     ):
         """Save the data structure to cellpy-format.
 
         Default on-disk format is **v9** (zip-of-parquet + ``meta.json``,
         ``.cellpy``). Pass ``cellpy_file_format="hdf5"`` / ``"v8"`` or a
-        ``.h5`` / ``.hdf5`` path to write the legacy HDF5 layout.
+        ``.h5`` / ``.hdf5`` path to write the legacy HDF5 layout, or
+        ``cellpy_file_format="dataset"`` to add the cell to a partitioned
+        parquet store holding many cells (``filename`` is then the root
+        directory of the store, see ``cellpy.readers.cellpy_file.dataset``).
+        ``cellpy_file_format="arrow"`` writes the tables as uncompressed Arrow
+        IPC files into the directory ``filename``, for memory-mapped sharing
+        with other processes (see ``cellpy.readers.cellpy_file.arrow``).
 
         The write is atomic: a staged file next to the destination replaces it
         only once complete, so an interrupted save leaves an existing file
@@ -1719,14 +1804,41 @@ class CellpyCell:
             ensure_step_table: (bool) make step-table if missing.
             ensure_summary_table: (bool) make summary-table if missing.
             cellpy_file_format: (str | None) ``"v9"`` / ``"cellpy"`` (default),
-                or ``"hdf5"`` / ``"v8"`` for the legacy HDF5 writer. When
-                omitted, inferred from the path suffix (``.h5``/``.hdf5`` →
-                hdf5, otherwise v9).
+                ``"hdf5"`` / ``"v8"`` for the legacy HDF5 writer, or
+                ``"dataset"`` for a partitioned parquet store, or ``"arrow"``
+                for a directory of Arrow IPC files. When omitted, inferred from
+                the path (an existing dataset store → dataset, an existing
+                arrow directory → arrow, ``.h5``/``.hdf5`` → hdf5, otherwise
+                v9).
+            append: (bool) only add the raw data collected since an existing v9
+                file was written (and replace its step table and summary)
+                instead of rewriting the whole file. When the file does not hold
+                the start of this cell's raw data, it is only replaced by a full
+                save if ``overwrite`` is set. Ignored (with a warning) for other
+                formats.
+            label: (str) name of the cell in a dataset store (defaults to the
+                cell name).
+            skip_unchanged: (bool) do not rewrite an existing v9 file that
+                already holds the same tables and metadata (compared by the
+                content digests stored in the file). Ignored when
+                ``compression`` is given, since the digests do not tell which
+                profile the file was written with.
+            compression: (str) compression profile for the parquet tables of
+                v9 files and dataset stores: ``"fast"``, ``"balanced"``,
+                ``"archive"`` or ``"none"`` (defaults to
+                ``prms.Reader.compression_profile``, else ``"balanced"``).
+            partial: (bool) save a cell loaded with a raw column projection
+                (``columns=``) anyway; only the loaded raw columns are written.
+                Without it such a cell raises ``ValueError``, since saving it
+                would drop the other raw columns from the file.
 
         Returns:
             None
 
         """
+        from cellpy.readers.cellpy_file import arrow as cellpy_file_arrow
+        from cellpy.readers.cellpy_file import selectors as cellpy_file_selectors
+        from cellpy.readers.cellpy_file import dataset as cellpy_file_dataset
         from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
 
         logging.debug(f"Trying to save cellpy-file to {filename}")
@@ -1743,6 +1855,7 @@ class CellpyCell:
             ensure_summary_table = self.ensure_summary_table
 
         my_data = self.data
+        cellpy_file_selectors.check_complete_raw(my_data, partial)
         summary_made = my_data.has_summary
         if not summary_made and not force and not ensure_summary_table:
             logging.info("File not saved!")
@@ -1765,11 +1878,15 @@ class CellpyCell:
                 "Saving to a remote path is not supported. "
                 "Provide a local path (or save locally and upload separately)."
             )
-        if not outfile_all.suffix:
+        fmt = (cellpy_file_format or "").lower().strip()
+        if not fmt and cellpy_file_dataset.is_dataset(outfile_all):
+            fmt = "dataset"
+        if not fmt and cellpy_file_arrow.is_arrow(outfile_all):
+            fmt = "arrow"
+        if fmt not in {"dataset", "arrow", "ipc", "feather"} and not outfile_all.suffix:
             logging.debug("No suffix given - adding one")
             outfile_all = outfile_all.with_suffix(f".{extension}")
 
-        fmt = (cellpy_file_format or "").lower().strip()
         suffix = outfile_all.suffix.lower()
         if not fmt:
             if suffix in {".h5", ".hdf5"}:
@@ -1780,13 +1897,31 @@ class CellpyCell:
             fmt = "hdf5"
         elif fmt in {"v9", "cellpy", "zip"}:
             fmt = "v9"
+        elif fmt in {"dataset", "parquet-dataset"}:
+            fmt = "dataset"
+            label = label or self.cell_name
+            if not label:
+                raise ValueError("Saving to a dataset store needs a label")
+        elif fmt in {"arrow", "ipc", "feather"}:
+            fmt = "arrow"
         else:
             logging.warning(
                 f"Unknown cellpy_file_format={cellpy_file_format!r}; using v9"
             )
             fmt = "v9"
+        if append and fmt != "v9":
+            logging.warning(
+                f"append=True only applies to v9 cellpy-files (not {fmt}) - ignored"
+            )
+            append = False
 
-        if outfile_all.is_file() and not overwrite:
+        if fmt == "dataset":
+            exists = cellpy_file_dataset.contains(outfile_all, label)
+        elif fmt == "arrow":
+            exists = cellpy_file_arrow.is_arrow(outfile_all)
+        else:
+            exists = outfile_all.is_file()
+        if exists and not overwrite and not append:
             logging.critical("File exists - did not save")
             logging.info(outfile_all)
             return
@@ -1820,23 +1955,116 @@ class CellpyCell:
                     )
 
                     data_to_write = cellpy_file_translate.to_legacy(_copy.copy(my_data))
-                cellpy_file_write.save(data_to_write, outfile_all)
+                cellpy_file_write.save(data_to_write, outfile_all, partial=partial)
                 logging.debug(" all -> hdf5 OK")
             else:
-                units = None
-                try:
-                    units = self.cellpy_units.to_frame()["value"].to_dict()
-                except Exception:
-                    logging.debug(
-                        "could not serialize cellpy_units for v9 meta", exc_info=True
+                units = self._cellpy_units_for_meta()
+                if skip_unchanged and compression is not None:
+                    # the digests do not cover the codec of the stored tables
+                    logging.info("compression given - rewriting even if unchanged")
+                    skip_unchanged = False
+                if skip_unchanged and cellpy_file_v9.is_unchanged(
+                    my_data, outfile_all, cellpy_units=units
+                ):
+                    logging.debug(f"{outfile_all} is up to date - not rewritten")
+                elif fmt == "dataset":
+                    cellpy_file_dataset.save(
+                        my_data,
+                        outfile_all,
+                        label,
+                        cellpy_units=units,
+                        compression=compression,
+                        partial=partial,
+                    )
+                    logging.debug(f" all -> dataset store OK (cell {label})")
+                elif fmt == "arrow":
+                    cellpy_file_arrow.save(
+                        my_data, outfile_all, cellpy_units=units, partial=partial
                     )
-                cellpy_file_v9.save(my_data, outfile_all, cellpy_units=units)
-                logging.debug(" all -> v9 .cellpy OK")
+                    logging.debug(" all -> arrow tables OK")
+                elif append and cellpy_file_v9.append(
+                    my_data,
+                    outfile_all,
+                    cellpy_units=units,
+                    compression=compression,
+                    partial=partial,
+                ):
+                    logging.debug(" new rows -> v9 .cellpy OK")
+                else:
+                    if append and exists:
+                        if not overwrite:
+                            logging.critical(
+                                "Could not append and the file exists - did not save"
+                            )
+                            logging.info(outfile_all)
+                            return
+                        logging.info("could not append - saving the full file")
+                    cellpy_file_v9.save(
+                        my_data,
+                        outfile_all,
+                        cellpy_units=units,
+                        compression=compression,
+                        partial=partial,
+                    )
+                    logging.debug(" all -> v9 .cellpy OK")
         except PermissionError as e:
             logging.critical(f"Could not write to {outfile_all} - old file kept")
             logging.info(e)
             return
 
+    def _cellpy_units_for_meta(self):
+        try:
+            return self.cellpy_units.to_frame()["value"].to_dict()
+        except Exception:
+            logging.debug("could not serialize cellpy_units for v9 meta", exc_info=True)
+            return None
+
+    def to_arrow(self):
+        """Return the tables of the cell as pyarrow tables.
+
+        The dict holds ``raw``, ``steps``, ``summary`` (and ``fid`` when the
+        cell has raw-file ids) with native column names, as stored in v9
+        files. Every table carries the meta-data of the cell in its schema
+        metadata, so ``CellpyCell.from_arrow`` can rebuild the cell. Use
+        ``save(..., cellpy_file_format="arrow")`` to write them as Arrow IPC
+        files that other processes can memory-map.
+
+        Returns:
+            dict of pyarrow.Table
+        """
+        from cellpy.readers.cellpy_file import arrow as cellpy_file_arrow
+
+        return cellpy_file_arrow.to_tables(
+            self.data, cellpy_units=self._cellpy_units_for_meta()
+        )
+
+    @classmethod
+    def from_arrow(cls, tables, selector=None, columns=None, **kwargs):
+        """Create a CellpyCell from tables made by ``to_arrow``.
+
+        Args:
+            tables (dict): ``raw``, ``steps``, ``summary`` and ``fid`` tables
+                (only ``summary``, which carries the meta-data, is required).
+            selector (dict): select a cycle window (as for ``load``).
+            columns (list of str): keep only these raw columns (as for ``load``).
+            **kwargs: sent to ``CellpyCell``.
+
+        Returns:
+            CellpyCell instance.
+        """
+        from cellpy.readers.cellpy_file import arrow as cellpy_file_arrow
+
+        cell = cls(**kwargs)
+        result = cellpy_file_arrow.from_tables(tables, selector=selector, columns=columns)
+        cell.data = result.data
+        if cell.native_schema:
+            from cellpy.readers.cellpy_file import translate as cellpy_file_translate
+
+            cellpy_file_translate.to_native(cell.data)
+        cell.limit_loaded_cycles = result.limit_loaded_cycles
+        cell.limit_data_points = result.limit_data_points
+        return cell
+
     # TODO @jepe: move this to its own module (e.g. as a cellpy-exporters?):
     @staticmethod
     def _convert2fid_table(cell):
@@ -2379,6 +2607,7 @@ class CellpyCell:
         sort_rows=True,
         from_data_point=None,
         nom_cap_specifics=None,
+        incremental=False,
     ):
         """Create a table (v.4) that contains summary information for each step.
 
@@ -2412,13 +2641,17 @@ class CellpyCell:
             sort_rows (bool): sort the rows after processing.
             from_data_point (int): first data point to use.
             nom_cap_specifics (str): "gravimetric", "areal", or "absolute".
+            incremental (bool): update an existing step table after new data has been
+                appended to raw: the rows of the last cycle in the step table (which
+                might not have been finished when the table was made) and everything
+                after it are re-calculated and spliced onto the rows of the earlier
+                cycles. Falls back to a full build if there is no (matching) step table.
 
         Returns:
             None
 
         """
         # TODO: @jepe - include option for omitting steps
-        # TODO: @jepe  - make it is possible to update only new data
 
         if all_steps:
             warnings.warn(
@@ -2460,8 +2693,17 @@ class CellpyCell:
                     nom_cap_abs, 1.0, nom_cap_specifics
                 )
 
+        source = self.data
+        kept_steps = None
+        if incremental and from_data_point is None:
+            kept_steps, from_data_point, first_row = self._closed_cycle_steps()
+            if kept_steps is not None:
+                # only the raw rows of the open cycle and onward go to the core
+                source = ds.Data()
+                source.raw = self.data.raw.iloc[first_row:]
+
         result = self.core.make_core_step_table(
-            self.data,
+            source,
             raw_limits=self.raw_limits,
             step_specifications=step_specifications,
             short=short,
@@ -2477,21 +2719,82 @@ class CellpyCell:
 
         logging.debug(f"(dt: {(time.time() - time_00):4.2f}s)")
 
+        if kept_steps is not None:
+            if "index" in result.columns:
+                # the legacy 'index' column numbers the steps over the whole table
+                result["index"] += len(kept_steps)
+            self.data.steps = externals.pandas.concat(
+                [kept_steps, result], ignore_index=True
+            )
+            return self
+
         if from_data_point is not None:
             return result
 
         return self
 
+    def _closed_cycle_steps(self):
+        """Step rows of the cycles that are finished, and where to continue from.
+
+        The last cycle in the step table is treated as open (the test might have
+        been running when the table was made). Returns the step rows of the
+        earlier cycles, the first data point of the open cycle and its row
+        position in raw, or ``(None, None, None)`` if the step table is missing
+        or does not match raw.
+        """
+        data = self.data
+        if not data.has_steps or not data.has_data:
+            return None, None, None
+        s_hdr = self.schema.steps
+        r_hdr = self.schema.raw
+        point_first, _ = self._step_point_columns()
+        steps = data.steps
+        open_cycle = steps[s_hdr.cycle_num].max()
+        from_data_point = steps.loc[
+            steps[s_hdr.cycle_num] == open_cycle, point_first
+        ].min()
+
+        rows = np.flatnonzero(
+            data.raw[r_hdr.datapoint_num].to_numpy() == from_data_point
+        )
+        if not len(rows) or data.raw[r_hdr.cycle_num].iat[rows[0]] != open_cycle:
+            logging.info(
+                "the step table does not match the raw data - making it from scratch"
+            )
+            return None, None, None
+        logging.debug(f"re-calculating steps from data point {from_data_point}")
+        kept_steps = steps.loc[steps[s_hdr.cycle_num] < open_cycle]
+        return kept_steps, int(from_data_point), int(rows[0])
+
+    def _steps_lag_behind_raw(self):
+        """True if raw has data points after the last one in the step table."""
+        _, point_last = self._step_point_columns()
+        return (
+            self.data.raw[self.schema.raw.datapoint_num].max()
+            > self.data.steps[point_last].max()
+        )
+
+    def _step_point_columns(self):
+        """Names of the first and last data-point columns of the step table."""
+        s_hdr = self.schema.steps
+        if self.native_schema:
+            return s_hdr.datapoint_num_first, s_hdr.datapoint_num_last
+        return f"{s_hdr.datapoint_num}_first", f"{s_hdr.datapoint_num}_last"
+
+    def _step_end_rows(self):
+        """Row positions of the last raw row of every (cycle, step) run."""
+        return self._raw_index().stops - 1
+
+    def _raw_index(self):
+        """Cycle/step row-range index of the raw frame (see :mod:`cellpy.readers.raw_index`)."""
+        return self.data.raw_index(self.schema.raw.cycle_num, self.schema.raw.step_num)
+
     def _select_usteps(self, cycle: int, steps: Union[list, np.ndarray]):
         # TODO: @jepe - insert sub_step here
         s_hdr = self.schema.steps.step_num
         us_hdr = "ustep"
-        c_txt = self.schema.raw.cycle_num
-        s_txt = self.schema.raw.step_num
         steps = self.data.steps.loc[self.data.steps[us_hdr].isin(steps), s_hdr].unique()
-        v = self.data.raw[
-            (self.data.raw[c_txt] == cycle) & (self.data.raw[s_txt].isin(steps))
-        ]
+        v = self.data.raw.iloc[self._raw_index().rows(cycle, steps)]
 
         if self._is_empty_array(v):
             logging.debug("empty dataframe")
@@ -2501,11 +2804,7 @@ class CellpyCell:
 
     def _select_step(self, cycle, step):
         # TODO: @jepe - insert sub_step here
-        c_txt = self.schema.raw.cycle_num
-        s_txt = self.schema.raw.step_num
-        v = self.data.raw[
-            (self.data.raw[c_txt] == cycle) & (self.data.raw[s_txt] == step)
-        ]
+        v = self.data.raw.iloc[self._raw_index().rows(cycle, step)]
 
         if self._is_empty_array(v):
             logging.debug("empty dataframe")
@@ -2802,8 +3101,6 @@ class CellpyCell:
         if additional_headers is not None:
             y_headers.extend(additional_headers)
 
-        data = self.data.raw
-
         if cycle is None:
             cycle = self.get_cycle_numbers()
         else:
@@ -2811,7 +3108,9 @@ class CellpyCell:
                 cycle = [cycle]
 
         logging.debug(f"getting current for cycles {cycle}")
-        c = data.loc[(data[cycle_index_header].isin(cycle)), y_headers]
+        with self.data.cycle_window(cycle):
+            data = self.data.raw
+            c = data[list(y_headers)].iloc[self._raw_index().rows_for_cycles(cycle)]
 
         if scaler is not None:
             c[y_header] = c[y_header] * scaler
@@ -2960,18 +3259,12 @@ class CellpyCell:
     def _sget(self, cycle, step, header):
         logging.debug(f"searching for {header}")
 
-        cycle_index_header = self.schema.raw.cycle_num
-        step_index_header = self.schema.raw.step_num
-
-        test = self.data.raw
-
         if not isinstance(step, (list, tuple)):
             step = [step]
 
-        return test.loc[
-            (test[cycle_index_header] == cycle) & (test[step_index_header].isin(step)),
-            header,
-        ].reset_index(drop=True)
+        with self.data.cycle_window([cycle]):
+            rows = self._raw_index().rows(cycle, step)
+            return self.data.raw[header].iloc[rows].reset_index(drop=True)
 
     def sget_timestamp(self, cycle, step):
         """Returns timestamp for cycle, step.
@@ -3083,7 +3376,7 @@ class CellpyCell:
         volume=None,
         cycle_mode=None,
         usteps=None,
-        dynamic=False,
+        dynamic=None,
         **kwargs,
     ):
         """Gets the capacity for the run. See :func:`cellpy.readers.capacity_curves.get_cap`."""
@@ -3246,8 +3539,13 @@ class CellpyCell:
         logging.debug("getting cycle numbers")
 
         if steptable is None:
-            d = self.data.raw
-            cycles = d[self.schema.raw.cycle_num].dropna().unique()
+            if "raw" in self.data.deferred_tables and self.data.has_steps:
+                # do not read the whole raw table from the cellpy-file
+                d = self.data.steps
+                cycles = d[self.schema.steps.cycle_num].dropna().unique()
+            else:
+                d = self.data.raw
+                cycles = d[self.schema.raw.cycle_num].dropna().unique()
             steptable = self.data.steps
         else:
             logging.debug("steptable is given as input parameter")
@@ -3878,6 +4176,7 @@ class CellpyCell:
         selector_type=None,
         selector=None,
         exclude_step_types=None,
+        incremental=False,
         **kwargs,
     ):
         """Convenience function that makes a summary of the cycling data.
@@ -3896,7 +4195,9 @@ class CellpyCell:
             normalization_cycles (int or list of int): cycles to use for normalization.
             nom_cap (float or str): nominal capacity (if None, the nominal capacity from the data will be used).
             nom_cap_specifics (str): gravimetric, areal, or volumetric.
-            create_copy (bool): if True, a copy of the cellpy object will be returned.
+            create_copy (bool): if True, a copy of the cellpy object will be returned
+                (the copy shares the raw frame with this cell through pandas
+                copy-on-write; only the step table, summary and meta-data are copied).
             exclude_types (list of str): deprecated, has no effect.
             exclude_steps (list of int): deprecated, has no effect.
             selector_type (str): deprecated, has no effect.
@@ -3909,6 +4210,12 @@ class CellpyCell:
                 columns (coulombic efficiency, losses, cumulated and specific
                 columns) are computed — a summary "as if those steps never
                 happened". Replaces the removed selector-based exclusion.
+            incremental (bool): update after new data has been appended to raw. A step
+                table that lags behind raw is updated with
+                ``make_step_table(incremental=True)``, and the summary is built from
+                the last raw row of each step only (instead of the full raw frame),
+                so the cost follows the number of steps and the new data rather
+                than the total length of the test.
             **kwargs: additional keyword arguments sent to internal method (check source for info).
 
         Returns:
@@ -3927,12 +4234,6 @@ class CellpyCell:
                 stacklevel=2,
             )
 
-        # TODO: @jepe  - make it is possible to update only new data by implementing
-        #  from_cycle (only calculate summary from a given cycle number).
-        #  Probably best to keep the old summary and make
-        #  a new one for the rest, then use pandas.concat to merge them.
-        #  Might have to create the cumulative cols etc after merging?
-
         # first - check if we need some "instrument-specific" prms
         if ensure_step_table is None:
             ensure_step_table = self.ensure_step_table
@@ -3970,11 +4271,13 @@ class CellpyCell:
             nom_cap_specifics=nom_cap_specifics,
             create_copy=create_copy,
             exclude_step_types=exclude_step_types,
+            incremental=incremental,
             **kwargs,
         )
         if create_copy:
-            other = copy.deepcopy(self)
-            other.data = data
+            # hand the summary copy to deepcopy through the memo, so that the
+            # original data object (and its raw frame) is not copied again
+            other = copy.deepcopy(self, {id(self.data): data})
             return other
         else:
             # TODO: check if anything is using this feature (returning self), if not, remove it.
@@ -3996,6 +4299,7 @@ class CellpyCell:
         normalization_cycles=None,
         create_copy=True,
         exclude_step_types=None,
+        incremental=False,
         **kwargs,
     ):
         # ---------------- discharge loss --------------------------------------
@@ -4038,7 +4342,8 @@ class CellpyCell:
         logging.debug("start making summary")
 
         if create_copy:
-            data = copy.deepcopy(self.data)
+            # copies steps, summary and meta; raw is shared (copy-on-write)
+            data = self.data.lazy_copy()
         else:
             data = self.data
 
@@ -4097,6 +4402,11 @@ class CellpyCell:
                 # update nom_cap in case it is given as argument to make_summary:
                 data.nom_cap = nom_cap
                 self.make_step_table()
+            elif incremental and self._steps_lag_behind_raw():
+                logging.info("running make_step_table (incremental)")
+                self.make_step_table(incremental=True)
+                if data is not self.data:
+                    data.steps = self.data.steps.copy()
 
         if not self.data.raw.index.is_unique:
             warnings.warn(f"{self.cell_name}: index is not unique for raw data")
@@ -4130,14 +4440,22 @@ class CellpyCell:
             )
             for mode in specifics
         }
-        data = self.core.make_core_summary(
-            data,
+        source = data
+        if incremental:
+            # the summary only reads raw at the end of each step (cycle-end values,
+            # last IR of the step, date-time of the cycle end), so the core does
+            # not need to see (and convert) the rest of the frame
+            source = data.lazy_copy()
+            source.raw = data.raw.iloc[self._step_end_rows()]
+        source = self.core.make_core_summary(
+            source,
             find_ir=find_ir,
             find_end_voltage=find_end_voltage,
             select_columns=select_columns,
             current_conversion_factor=current_conversion_factor,
             exclude_step_types=exclude_step_types,
         )
+        data.summary = source.summary
         data = self.core.add_scaled_summary_columns(
             data,
             nom_cap_abs=nom_cap_abs,
@@ -4369,6 +4687,8 @@ def get(
     step_kwargs=None,
     summary_kwargs=None,
     selector=None,
+    columns=None,
+    tables=None,
     testing=False,
     refuse_copying=False,
     initialize=False,
@@ -4403,12 +4723,19 @@ def get(
         estimate_area (bool): calculate area from loading if given (defaults to True).
         auto_pick_cellpy_format (bool): decide if it is a cellpy-file based on suffix.
             For ``.h5`` / ``.hdf5``, a set ``instrument=`` wins over suffix auto-pick
-            (raw loader path). ``.cellpy`` / ``.cpy`` still auto-pick when enabled.
+            (raw loader path). ``.cellpy`` / ``.cpy`` still auto-pick when enabled,
+            and so do the root directory of a dataset store (pick the cell
+            with ``label=``) and a directory of Arrow IPC tables.
         auto_summary (bool): (re-) create summary.
         units (dict): update cellpy units (used after the file is loaded, e.g. when creating summary).
         step_kwargs (dict): sent to make_steps.
         summary_kwargs (dict): sent to make_summary.
         selector (dict): passed to load (when loading cellpy-files).
+        columns (list of str): raw columns to load (when loading cellpy-files;
+            the data point, cycle and step columns are always loaded).
+        tables (tuple of str): tables to load (when loading cellpy-files), e.g.
+            ``("summary",)`` for a summary-only load; raw and steps are then
+            read from the file the first time they are accessed.
         testing (bool): set to True if testing (will for example prevent making .log files)
         refuse_copying (bool): set to True if you do not want to copy the raw-file before loading.
         initialize (bool): set to True if you want to initialize the CellpyCell object (probably only
@@ -4530,6 +4857,13 @@ def get(
                 load_cellpy_file = True
             elif suffix in [".h5", ".hdf5"] and not instrument:
                 load_cellpy_file = True
+            elif not instrument and not filename.is_external:
+                from cellpy.readers.cellpy_file import arrow as cellpy_file_arrow
+                from cellpy.readers.cellpy_file import dataset as cellpy_file_dataset
+
+                load_cellpy_file = cellpy_file_dataset.is_dataset(
+                    filename
+                ) or cellpy_file_arrow.is_arrow(filename)
 
     if filename and cellpy_file and not load_cellpy_file:
         try:
@@ -4549,7 +4883,9 @@ def get(
                 "post_processor_hook is not allowed when loading cellpy-files"
             )
 
-        cellpy_instance.load(filename, selector=selector, **kwargs)
+        cellpy_instance.load(
+            filename, selector=selector, columns=columns, tables=tables, **kwargs
+        )
         cellpy_instance = _update_meta(
             cellpy_instance,
             cycle_mode=cycle_mode,
@@ -5,6 +5,8 @@ And it has the file version definitions.
 """
 
 import abc
+import contextlib
+import copy
 import datetime
 import importlib
 import importlib.util
@@ -16,11 +18,12 @@ import pickle
 import sys
 import time
 import warnings
-from typing import Any, Tuple, Dict, List, Union, Optional
+from typing import Any, Callable, Tuple, Dict, List, Union, Optional
 from typing import TypedDict
 
 from . import externals as externals
 from . import test_meta as test_meta_helpers
+from .raw_index import RawIndex
 
 from cellpycore.metadata.models import TestMeta, TestMetaCollection
 
@@ -39,6 +42,8 @@ logger = logging.getLogger(__name__)
 
 # Process-level: max_segments fallback can fire once per cycle in collectors.
 _max_segments_warned = False
+# number of cycle windows of a deferred raw table kept by Data.cycle_window
+_RAW_WINDOWS_KEPT = 4
 
 LOADERS_NOT_READY_FOR_PROD = [
     "ext_nda_reader"
@@ -369,6 +374,8 @@ class Data:
         raw_units (dict): dictionary with units for the raw data.
         raw_limits (dict): dictionary with limits for the raw data.
         loaded_from (str): name of the file where the data was loaded from.
+        deferred_tables (tuple): tables (``raw``/``steps``) left out of a
+            partial cellpy-file load; they are read on first access.
     """
 
     def __repr__(self):
@@ -518,11 +525,21 @@ class Data:
         self.raw_data_files = []
         self.raw_data_files_length = []
         self.loaded_from = None
+        # Raw columns asked for by a projected cellpy-file load (``columns=``);
+        # None when all of them were loaded. Writers refuse a projected cell.
+        self.loaded_columns = None
         self._raw_id = None
         self._internal_test_number = None
         self.raw_units = get_default_raw_units()
         self.raw_limits = get_default_raw_limits()
 
+        self._raw_index = None
+        # Tables left out of a partial cellpy-file load: name -> loader,
+        # called on first access (see ``defer``).
+        self._deferred_tables: Dict[str, Callable[[], Any]] = {}
+        # Recently read cycle windows of a deferred raw table, oldest first:
+        # sorted cycle tuple -> frame (see ``cycle_window``).
+        self._raw_windows: Dict[tuple, Any] = {}
         self.raw = externals.pandas.DataFrame()
         self.summary = externals.pandas.DataFrame()
         self.steps = externals.pandas.DataFrame()
@@ -551,6 +568,132 @@ class Data:
             if hasattr(self, k):
                 setattr(self, k, kwargs[k])
 
+    @property
+    def raw(self):
+        if "raw" in self._deferred_tables:
+            self._load_deferred("raw")
+        return self._raw
+
+    @raw.setter
+    def raw(self, frame):
+        self._deferred_tables.pop("raw", None)
+        self._raw_windows = {}
+        self._raw = frame
+        self._raw_index = None
+
+    @property
+    def steps(self):
+        if "steps" in self._deferred_tables:
+            self._load_deferred("steps")
+        return self._steps
+
+    @steps.setter
+    def steps(self, frame):
+        self._deferred_tables.pop("steps", None)
+        self._steps = frame
+
+    def defer(self, table: str, loader: Callable[[], Any]) -> None:
+        """Fetch ``table`` (``"raw"`` or ``"steps"``) with ``loader`` on first access.
+
+        Used for cellpy-files loaded with ``tables=...``. Assigning the table
+        cancels the deferral.
+        """
+        if table not in ("raw", "steps"):
+            raise ValueError(f"Only raw and steps can be deferred (got {table!r})")
+        if table == "raw":
+            self._raw_windows = {}
+        self._deferred_tables[table] = loader
+
+    @property
+    def deferred_tables(self) -> tuple:
+        """Names of the tables that are not loaded yet."""
+        return tuple(self._deferred_tables)
+
+    def _load_deferred(self, table: str) -> None:
+        frame = self._deferred_tables[table]()
+        setattr(self, table, frame)
+
+    @contextlib.contextmanager
+    def cycle_window(self, cycles=None):
+        """Expose only ``cycles`` of a deferred raw table while in the block.
+
+        If ``raw`` is deferred and its loader can read single cycles (see
+        ``cellpy.readers.cellpy_file.read.DeferredTable.for_cycles``), ``raw``
+        holds just the rows of ``cycles`` inside the ``with`` block and is
+        deferred again afterwards, so the full table is never kept in memory.
+        The last few windows are kept, so asking for the same cycles again
+        (e.g. ``sget_voltage`` and ``sget_current`` of one cycle) does not
+        re-read the file. With ``cycles=None`` the whole table is needed
+        anyway: it is loaded and kept, which ends the deferral. Otherwise
+        this does nothing.
+        """
+        loader = self._deferred_tables.get("raw")
+        if loader is None or not hasattr(loader, "for_cycles"):
+            yield
+            return
+        if cycles is None:
+            self._load_deferred("raw")
+            yield
+            return
+        if not isinstance(cycles, (list, tuple, set)):
+            try:
+                cycles = list(cycles)
+            except TypeError:
+                cycles = [cycles]
+        key = tuple(sorted({int(c) for c in cycles}))
+        windows = self._raw_windows
+        frame = windows.pop(key, None)
+        if frame is None:
+            frame = loader.for_cycles(key)
+        windows[key] = frame
+        while len(windows) > _RAW_WINDOWS_KEPT:
+            del windows[next(iter(windows))]
+        # a shallow copy: edits inside the block do not reach the kept window
+        window = frame.copy(deep=False)
+        self.raw = window
+        try:
+            yield
+        finally:
+            # keep a raw frame assigned inside the block
+            if self._raw is window:
+                self.raw = externals.pandas.DataFrame()
+                self._deferred_tables["raw"] = loader
+                self._raw_windows = windows
+
+    def raw_index(self, cycle_col: str, step_col: str) -> RawIndex:
+        """Cycle/step row-range index of ``raw`` (built on first use, then cached).
+
+        The cached index is dropped when ``raw`` is re-assigned and rebuilt if
+        it no longer matches the frame (see :mod:`cellpy.readers.raw_index`).
+        """
+        raw = self.raw
+        index = self._raw_index
+        if index is None or not index.is_current(raw, cycle_col, step_col):
+            index = RawIndex(raw, cycle_col, step_col)
+            self._raw_index = index
+        return index
+
+    def invalidate_raw_index(self) -> None:
+        """Drop the cached raw index (call after editing key columns in place)."""
+        self._raw_index = None
+
+    def lazy_copy(self) -> "Data":
+        """Copy of the data object that does not duplicate the raw frame.
+
+        Everything except ``raw`` (steps, summary, meta-data, file ids) is
+        deep-copied. The copy gets a shallow copy of ``raw``; with pandas
+        copy-on-write it shares the column buffers with the original until one
+        of the two frames is modified, so writes to either side never leak to
+        the other.
+        """
+        memo = {
+            id(self._raw): self._raw.copy(deep=False),
+            id(self._raw_windows): {},
+        }
+        if self._raw_index is not None:
+            memo[id(self._raw_index)] = None
+        return copy.deepcopy(self, memo)
+
     # ---------------- left-over-properties v7 -> v8 -----------------
     # these now belong to the CellpyMeta attributes
     #   however, since they are extensively used in the instrument
@@ -786,6 +929,8 @@ class Data:
     @property
     def has_steps(self):
         """check if the step table exists"""
+        if "steps" in self._deferred_tables:
+            return True
         try:
             empty = self.steps.empty
         except AttributeError:
@@ -794,6 +939,8 @@ class Data:
 
     @property
     def has_data(self):
+        if "raw" in self._deferred_tables:
+            return True
         try:
             empty = self.raw.empty
         except AttributeError:
@@ -1567,6 +1714,141 @@ def interpolate_y_on_x(
     return new_df
 
 
+def _warn_max_segments(n_segments, max_segments):
+    """Log (once per process at WARNING) that a curve is left uninterpolated."""
+    global _max_segments_warned
+    msg = (
+        "interpolate_y_on_x_per_monotonic_segments: %d segments exceeds "
+        "max_segments=%s; returning dataframe unchanged (likely noisy x-data)."
+    )
+    if not _max_segments_warned:
+        logger.warning(
+            msg + " Further occurrences in this process are logged at DEBUG.",
+            n_segments,
+            max_segments,
+        )
+        _max_segments_warned = True
+    else:
+        logger.debug(msg, n_segments, max_segments)
+
+
+def _interpolate_monotonic_segments(
+    x, y, counts, direction=1, dx=10.0, number_of_points=None, max_segments=100
+):
+    """Interpolate many curves per strictly monotonic segment, all at once.
+
+    ``x`` and ``y`` hold the curves back to back (``counts`` points each). Each
+    curve is split where ``x`` stops being strictly monotonic in ``direction``
+    and every segment of at least two points is interpolated linearly on a
+    regular grid running from its first x (``dx`` steps, or
+    ``number_of_points`` points ending at its last x). Shorter segments are
+    dropped. A curve without such a segment, or with more than
+    ``max_segments`` segments, is kept as it is.
+
+    Returns:
+        ``(x, y, counts, unchanged)``: the new curves back to back, their
+        lengths and a boolean per curve telling which were kept as they are;
+        None if ``x`` or ``y`` is not float64 or ``x`` holds NaN.
+    """
+    np = externals.numpy
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+    counts = np.asarray(counts, dtype=np.int64)
+    if x.dtype != np.float64 or y.dtype != np.float64 or np.isnan(x).any():
+        return None
+    n_curves = len(counts)
+    if not len(x):
+        return x, y, counts, np.zeros(n_curves, dtype=bool)
+
+    curve_starts = np.cumsum(counts) - counts
+    curve_first = np.zeros(len(x), dtype=bool)
+    curve_first[curve_starts[counts > 0]] = True
+    if direction > 0:
+        broken = np.r_[True, x[1:] <= x[:-1]]
+    else:
+        broken = np.r_[True, x[1:] >= x[:-1]]
+    seg_starts = np.flatnonzero(broken | curve_first)
+    seg_lengths = np.diff(np.r_[seg_starts, len(x)])
+    seg_curve = np.repeat(np.arange(n_curves), counts)[seg_starts]
+
+    n_segments = np.bincount(seg_curve, minlength=n_curves)
+    usable = seg_lengths >= 2
+    unchanged = (counts > 0) & (
+        np.bincount(seg_curve[usable], minlength=n_curves) == 0
+    )
+    if max_segments is not None:
+        crowded = (n_segments > max_segments) & ~unchanged
+        for k in np.flatnonzero(crowded):
+            _warn_max_segments(int(n_segments[k]), max_segments)
+        unchanged |= crowded
+    usable &= ~unchanged[seg_curve]
+    seg_starts = seg_starts[usable]
+    seg_lengths = seg_lengths[usable]
+    seg_curve = seg_curve[usable]
+
+    # the grid of every segment
+    seg_first = x[seg_starts]
+    seg_last = x[seg_starts + seg_lengths - 1]
+    if number_of_points:
+        n_new = np.full(len(seg_starts), number_of_points, dtype=np.int64)
+    else:
+        step = dx if direction > 0 else -dx
+        n_new = np.maximum(np.ceil((seg_last - seg_first) / step), 0).astype(np.int64)
+    grid_seg = np.repeat(np.arange(len(seg_starts)), n_new)
+    i = np.arange(len(grid_seg)) - np.repeat(np.cumsum(n_new) - n_new, n_new)
+    if number_of_points:
+        width = (seg_last - seg_first) / max(number_of_points - 1, 1)
+        new_x = seg_first[grid_seg] + i * width[grid_seg]
+        if number_of_points > 1:
+            end = i == number_of_points - 1
+            new_x[end] = seg_last[grid_seg][end]
+    else:
+        new_x = seg_first[grid_seg] + i * step
+
+    # the segment node at or before each grid point (x increasing along
+    # ``sign * x``; nodes sort before grid points at the same x)
+    sign = 1.0 if direction > 0 else -1.0
+    node_offsets = np.cumsum(seg_lengths) - seg_lengths
+    node_pos = np.repeat(seg_starts - node_offsets, seg_lengths) + np.arange(
+        int(seg_lengths.sum())
+    )
+    node_seg = np.repeat(np.arange(len(seg_starts)), seg_lengths)
+    node_x = x[node_pos]
+    node_y = y[node_pos]
+    is_grid = np.r_[np.zeros(len(node_x), dtype=bool), np.ones(len(new_x), dtype=bool)]
+    merged = np.lexsort(
+        (is_grid, sign * np.r_[node_x, new_x], np.r_[node_seg, grid_seg])
+    )
+    nodes_seen = np.cumsum(~is_grid[merged])
+    j = np.empty(len(new_x), dtype=np.int64)
+    on_grid = is_grid[merged]
+    j[merged[on_grid] - len(node_x)] = nodes_seen[on_grid] - 1
+    first_node = node_offsets[grid_seg]
+    last_node = first_node + seg_lengths[grid_seg] - 1
+    j = np.clip(j, first_node, last_node - 1)
+    slope = (node_y[j + 1] - node_y[j]) / (node_x[j + 1] - node_x[j])
+    new_y = slope * (new_x - node_x[j]) + node_y[j]
+    end = new_x == node_x[last_node]
+    new_y[end] = node_y[last_node][end]
+    outside = (sign * new_x < sign * node_x[first_node]) | (
+        sign * new_x > sign * node_x[last_node]
+    )
+    new_y[outside] = np.nan
+
+    # the curves back to back: kept ones as they are, the others gridded
+    out_counts = np.where(
+        unchanged, counts, np.bincount(seg_curve, weights=n_new, minlength=n_curves)
+    ).astype(np.int64)
+    kept_rows = unchanged[np.repeat(np.arange(n_curves), counts)]
+    out_kept = np.repeat(unchanged, out_counts)
+    out_x = np.empty(int(out_counts.sum()))
+    out_y = np.empty(len(out_x))
+    out_x[out_kept], out_y[out_kept] = x[kept_rows], y[kept_rows]
+    out_x[~out_kept], out_y[~out_kept] = new_x, new_y
+    return out_x, out_y, out_counts, unchanged
+
+
 def interpolate_y_on_x_per_monotonic_segments(
     df,
     x=None,
@@ -1591,6 +1873,10 @@ def interpolate_y_on_x_per_monotonic_segments(
     DataFrames (memory). If the segment count exceeds max_segments, the
     function returns the dataframe unchanged and logs a warning.
 
+    Without ``kwargs`` (and for x-data without NaN) the segments are
+    interpolated linearly in one go by ``_interpolate_monotonic_segments``,
+    which the all-cycles ``get_cap`` engine runs on every curve at once.
+
     Args:
         df: DataFrame with the (cycle) data.
         x: Column name for the x-value.
@@ -1618,6 +1904,22 @@ def interpolate_y_on_x_per_monotonic_segments(
     if n < 2:
         return df
 
+    if not kwargs:
+        curves = _interpolate_monotonic_segments(
+            df[x].to_numpy(dtype=float),
+            df[y].to_numpy(dtype=float),
+            [n],
+            direction=direction,
+            dx=dx,
+            number_of_points=number_of_points,
+            max_segments=max_segments,
+        )
+        if curves is not None:
+            new_x, new_y, _, unchanged = curves
+            if unchanged[0]:
+                return df
+            return externals.pandas.DataFrame({x: new_x, y: new_y})
+
     # Find segment boundaries: start new segment when monotonicity breaks
     if direction > 0:
         # segment starts at i when i==0 or when x[i] <= x[i-1] (not strictly increasing)
@@ -1628,20 +1930,7 @@ def interpolate_y_on_x_per_monotonic_segments(
 
     n_segments = int(segment_start.sum())
     if max_segments is not None and n_segments > max_segments:
-        global _max_segments_warned
-        msg = (
-            "interpolate_y_on_x_per_monotonic_segments: %d segments exceeds "
-            "max_segments=%s; returning dataframe unchanged (likely noisy x-data)."
-        )
-        if not _max_segments_warned:
-            logger.warning(
-                msg + " Further occurrences in this process are logged at DEBUG.",
-                n_segments,
-                max_segments,
-            )
-            _max_segments_warned = True
-        else:
-            logger.debug(msg, n_segments, max_segments)
+        _warn_max_segments(n_segments, max_segments)
         return df
 
     segment_id = externals.numpy.cumsum(segment_start) - 1
@@ -172,6 +172,52 @@ NORMAL_HEADERS_RENAMING_DICT = {
 }
 
 
+# Tables with free-text columns (comments, paths) that may hold quoted line
+# breaks; the CSV reader only looks for those where it has to.
+_TABLES_WITH_FREE_TEXT = (TABLE_NAMES["global"], TABLE_NAMES["aux_global"])
+
+
+def _export_table(temp_filename, table_name, column_types=None):
+    """Read one table of a .res file from the stdout of ``mdb-export``.
+
+    pyarrow parses the CSV text in blocks while ``mdb-export`` is still
+    writing it. If pyarrow gives up (e.g. a column that looked like integers
+    turns out to hold floats further down), the table is exported again and
+    read with pandas, as before.
+    """
+    import subprocess
+
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    command = [_sub_process_path, str(temp_filename), table_name]
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE)
+    except FileNotFoundError as e:
+        logging.critical(f"Could not run {_sub_process_path} on {temp_filename}")
+        logging.critical("Possible work-around: install mdbtools")
+        raise e
+
+    table = None
+    with process:
+        try:
+            table = pa_csv.read_csv(
+                process.stdout,
+                parse_options=pa_csv.ParseOptions(
+                    newlines_in_values=table_name in _TABLES_WITH_FREE_TEXT
+                ),
+                convert_options=pa_csv.ConvertOptions(column_types=column_types or {}),
+            )
+        except pa.ArrowInvalid as e:
+            logging.debug(f"pyarrow could not read {table_name} ({e}) - using pandas")
+    logging.debug(f"ran mdb-export {temp_filename} {table_name}")
+
+    if table is None:
+        with subprocess.Popen(command, stdout=subprocess.PIPE) as process:
+            return pd.read_csv(process.stdout)
+    return table.to_pandas()
+
+
 class DataLoader(BaseLoader):
     """Class for loading arbin-data from res-files.
 
@@ -726,24 +772,19 @@ class DataLoader(BaseLoader):
         if DEBUG_MODE:
             time_0 = time.time()
 
-        (
-            tmp_name_global,
-            tmp_name_raw,
-            tmp_name_stats,
-            tmp_name_aux_global,
-            tmp_name_aux,
-        ) = self._create_tmp_files(
-            table_name_global,
-            table_name_normal,
-            table_name_stats,
-            table_name_aux_global,
-            table_name_aux,
-            temp_dir,
+        exported = self._export_tables(
+            [
+                table_name_global,
+                table_name_normal,
+                table_name_stats,
+                table_name_aux_global,
+                table_name_aux,
+            ],
             temp_filename,
+            column_types=self._normal_column_types(),
         )
 
-        # use pandas to load in the data
-        global_data_df = pd.read_csv(tmp_name_global)
+        global_data_df = exported[table_name_global]
         tests = global_data_df[self.arbin_headers_normal.test_id_txt]
         number_of_sets = len(tests)
         self.logger.debug("number of datasets: %i" % number_of_sets)
@@ -764,13 +805,12 @@ class DataLoader(BaseLoader):
             summary_df,
             aux_global_data_df,
             aux_df,
-        ) = self._load_from_tmp_files(
+        ) = self._load_from_exported_tables(
             data,
-            tmp_name_global,
-            tmp_name_raw,
-            tmp_name_stats,
-            tmp_name_aux_global,
-            tmp_name_aux,
+            exported[table_name_normal],
+            exported[table_name_stats],
+            exported[table_name_aux_global],
+            exported[table_name_aux],
             temp_filename,
             bad_steps,
             data_points,
@@ -1045,62 +1085,66 @@ class DataLoader(BaseLoader):
         data.raw = pd.concat(groups, ignore_index=True)
         return data
 
-    @staticmethod
-    def _create_tmp_files(
-        table_name_global,
-        table_name_normal,
-        table_name_stats,
-        table_name_aux_global,
-        table_name_aux,
-        temp_dir,
-        temp_filename,
-    ):
-        import subprocess
-
-        # creating tmp-filenames
-        temp_csv_filename_global = os.path.join(temp_dir, "global_tmp.csv")
-        temp_csv_filename_normal = os.path.join(temp_dir, "normal_tmp.csv")
-        temp_csv_filename_stats = os.path.join(temp_dir, "stats_tmp.csv")
-        temp_csv_filename_aux_global = os.path.join(temp_dir, "aux_global_tmp.csv")
-        temp_csv_filename_aux = os.path.join(temp_dir, "aux_tmp.csv")
-        # making the cmds
-        mdb_prms = [
-            (table_name_global, temp_csv_filename_global),
-            (table_name_normal, temp_csv_filename_normal),
-            (table_name_stats, temp_csv_filename_stats),
-            (table_name_aux_global, temp_csv_filename_aux_global),
-            (table_name_aux, temp_csv_filename_aux),
-        ]
-        # executing cmds
-        for table_name, tmp_file in mdb_prms:
-            with open(tmp_file, "w") as f:
-                try:
-                    subprocess.call(
-                        [_sub_process_path, temp_filename, table_name], stdout=f
-                    )
-                    logging.debug(f"ran mdb-export {str(f)} {table_name}")
-                except FileNotFoundError as e:
-                    logging.critical(
-                        f"Could not run {_sub_process_path} on {temp_filename}"
-                    )
-                    logging.critical(f"Possible work-around: install mdbtools")
-                    raise e
-        return (
-            temp_csv_filename_global,
-            temp_csv_filename_normal,
-            temp_csv_filename_stats,
-            temp_csv_filename_aux_global,
-            temp_csv_filename_aux,
+    def _normal_column_types(self):
+        """Explicit dtypes for the key and measurement columns of the normal table."""
+        import pyarrow as pa
+
+        headers = self.arbin_headers_normal
+        integers = ("test_id_txt", "data_point_txt", "cycle_index_txt", "step_index_txt")
+        floats = (
+            "test_time_txt",
+            "step_time_txt",
+            "datetime_txt",
+            "current_txt",
+            "voltage_txt",
+            "charge_capacity_txt",
+            "discharge_capacity_txt",
+            "charge_energy_txt",
+            "discharge_energy_txt",
+            "internal_resistance_txt",
+            "dv_dt_txt",
         )
+        column_types = {headers[key]: pa.int64() for key in integers}
+        column_types.update({headers[key]: pa.float64() for key in floats})
+        return {TABLE_NAMES["normal"]: column_types}
+
+    @staticmethod
+    def _export_tables(table_names, temp_filename, column_types=None):
+        """Run ``mdb-export`` for each table and parse its output as it arrives.
 
-    def _load_from_tmp_files(
+        The tables are exported concurrently, and the CSV text on the stdout
+        of each ``mdb-export`` process goes straight into pyarrow's
+        multithreaded CSV reader (no temporary CSV files). ``column_types``
+        maps table names to ``{column: pyarrow type}`` for the columns whose
+        dtype should not be inferred.
+
+        Returns:
+            dict of table name -> pandas.DataFrame
+        """
+        import concurrent.futures
+
+        column_types = column_types or {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(table_names)
+        ) as pool:
+            futures = {
+                table_name: pool.submit(
+                    _export_table,
+                    temp_filename,
+                    table_name,
+                    column_types.get(table_name),
+                )
+                for table_name in table_names
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    def _load_from_exported_tables(
         self,
         data,
-        temp_csv_filename_global,
-        temp_csv_filename_normal,
-        temp_csv_filename_stats,
-        temp_csv_filename_aux_global,
-        temp_csv_filename_aux,
+        normal_df,
+        summary_df,
+        aux_global_df,
+        aux_df,
         temp_filename,
         bad_steps,
         data_points,
@@ -1118,10 +1162,6 @@ class DataLoader(BaseLoader):
                 sql_4 += "AND %s=%i) " % (self.headers_normal.step_index_txt, bad_step)
 
         """
-        # should include a more efficient to load the csv (maybe a loop where
-        #   we load only chunks and only keep the parts that fulfill the
-        #   filters (e.g. bad_steps, data_points,...)
-        normal_df = pd.read_csv(temp_csv_filename_normal)
         # filter on test ID
         if data._internal_test_number is not None:
             normal_df = normal_df[
@@ -1176,24 +1216,13 @@ class DataLoader(BaseLoader):
                 normal_df = normal_df.loc[selector, :]
 
         length_of_test = normal_df.shape[0]
-        summary_df = pd.read_csv(temp_csv_filename_stats)
-        aux_global_df = pd.read_csv(temp_csv_filename_aux_global)
-        aux_df = pd.read_csv(temp_csv_filename_aux)
 
         # clean up
-        for f in [
-            temp_filename,
-            temp_csv_filename_stats,
-            temp_csv_filename_normal,
-            temp_csv_filename_global,
-            temp_csv_filename_aux_global,
-            temp_csv_filename_aux,
-        ]:
-            if os.path.isfile(f):
-                try:
-                    os.remove(f)
-                except WindowsError as e:
-                    logging.warning(f"could not remove tmp-file\n{f} {e}")
+        if os.path.isfile(temp_filename):
+            try:
+                os.remove(temp_filename)
+            except OSError as e:
+                logging.warning(f"could not remove tmp-file\n{temp_filename} {e}")
         return length_of_test, normal_df, summary_df, aux_global_df, aux_df
 
     def _init_data(self, file_name, global_data_df, test_no=None):
@@ -19,6 +19,7 @@ from cellpy.exceptions import LoaderError, WrongFileVersion
 import cellpy.internals.connections
 import cellpy.readers.data_structures as core
 from cellpy.parameters.internal_settings import headers_normal, merge_raw_units
+from cellpy.readers.instruments import csv_engines
 from cellpy.readers.instruments.configurations import (
     ModelParameters,
     register_configuration_from_module,
@@ -208,7 +209,7 @@ def query_csv(
     decimal=None,
     thousands=None,
 ):
-    """function to query a csv file using pandas.read_csv.
+    """function to query a csv file using the csv engine of the loader.
 
 
     Args:
@@ -224,7 +225,8 @@ def query_csv(
         pandas.DataFrame
 
     """
-    logging.debug(f"parsing with pandas.read_csv: {name}")
+    engine = getattr(self, "csv_engine", None)
+    logging.debug(f"parsing with the {engine or 'pandas'} csv engine: {name}")
     sep = sep or self.sep
     skiprows = skiprows or self.skiprows
     header = header or self.header
@@ -232,14 +234,20 @@ def query_csv(
     decimal = decimal or self.decimal
     thousands = thousands or self.thousands
     logging.critical(f"{sep=}, {skiprows=}, {header=}, {encoding=}, {decimal=}")
-    data_df = pd.read_csv(
+    # only AutoLoader and its sub-classes declare their columns
+    column_hints = getattr(self, "_csv_column_hints", None)
+    columns, dtypes = column_hints() if column_hints is not None else (None, None)
+    data_df = csv_engines.read_csv(
         name,
+        engine=engine,
         sep=sep,
         skiprows=skiprows,
         header=header,
         encoding=encoding,
         decimal=decimal,
         thousands=thousands,
+        columns=columns,
+        dtypes=dtypes,
     )
     return data_df
 
@@ -583,6 +591,44 @@ class AutoLoader(BaseLoader):
             "missing method in sub-class of TxtLoader: get_headers_aux"
         )
 
+    def _csv_column_hints(self):
+        """Columns to read and dtype hints for the csv engine (see ``csv_engines``).
+
+        Both come from the declarations derived from the configuration. Models
+        whose column names carry units read from the file (``{{ unit }}``
+        templates) get neither, since those names are unknown before parsing.
+
+        Returns:
+            ``(columns, dtypes)``; ``None`` for what does not apply.
+        """
+        from cellpy.readers.instruments.config_declarations import (
+            declarations_from_configuration,
+        )
+
+        engine = csv_engines.check_engine(getattr(self, "csv_engine", None))
+        declared_only = getattr(self, "declared_columns_only", False) and not self.include_aux
+        if engine == "pandas" and not declared_only:
+            return None, None
+        renaming = self.config_params.normal_headers_renaming_dict or {}
+        if any("{{" in str(vendor) for vendor in renaming.values()):
+            logging.debug("vendor column names depend on the file; no csv column hints")
+            return None, None
+        try:
+            declarations = declarations_from_configuration(self.config_params)
+        except Exception as e:  # noqa: BLE001 — hints are an optimisation only
+            logging.debug(f"no csv column hints ({e})")
+            return None, None
+
+        columns = None
+        if declared_only:
+            # the legacy post-processors still work on the parsed frame
+            columns = csv_engines.declared_columns(declarations)
+            columns.update(self.config_params.columns_to_keep)
+            if self.config_params.states:
+                columns.add(self.config_params.states["column_name"])
+        dtypes = csv_engines.dtype_hints(declarations) if engine != "pandas" else None
+        return columns, dtypes
+
     def _pre_process(self):
         for processor_name in self.pre_processors:
             if self.pre_processors[processor_name]:
@@ -805,6 +851,8 @@ class TxtLoader(AutoLoader, ABC):
         header (int): number of the header lines.
         encoding (str): encoding.
         decimal (str): character used for decimal in the raw data, defaults to '.'.
+        csv_engine (str): "pandas" (default), "pyarrow" or "polars"; the last two parse on all cores.
+        declared_columns_only (bool): only read the columns the loader declarations use.
         processors (dict): pre-processing steps to take (before loading with pandas).
         post_processors (dict): post-processing steps to make after loading the data, but before
         returning them to the caller.
@@ -846,6 +894,8 @@ class TxtLoader(AutoLoader, ABC):
             self.encoding = kwargs.pop("encoding", "utf-8")
             self.decimal = kwargs.pop("decimal", ".")
             self.thousands = kwargs.pop("thousands", None)
+            self.csv_engine = kwargs.pop("csv_engine", "pandas")
+            self.declared_columns_only = kwargs.pop("declared_columns_only", False)
 
         else:
             # Remark! This will break if one of these parameters are missing
@@ -864,11 +914,21 @@ class TxtLoader(AutoLoader, ABC):
             self.thousands = kwargs.pop(
                 "thousands", self.config_params.formatters["thousands"]
             )
+            # optional: most models read with pandas and keep every column
+            self.csv_engine = kwargs.pop(
+                "csv_engine", self.config_params.formatters.get("csv_engine", "pandas")
+            )
+            self.declared_columns_only = kwargs.pop(
+                "declared_columns_only",
+                self.config_params.formatters.get("declared_columns_only", False),
+            )
+        csv_engines.check_engine(self.csv_engine)
         logging.debug(
             f"Formatters: self.sep={self.sep} self.skiprows={self.skiprows} self.header={self.header} self.encoding={self.encoding}"
         )
         logging.debug(
             f"Formatters (cont.): self.decimal={self.decimal} self.thousands={self.thousands}"
+            f" self.csv_engine={self.csv_engine} self.declared_columns_only={self.declared_columns_only}"
         )
 
     # override this if needed
@@ -925,6 +985,14 @@ class TxtLoader(AutoLoader, ABC):
             logging.critical(f"overriding sep: {sep}")
             self.sep = sep
 
+        if csv_engine := kwargs.get("csv_engine", None):
+            logging.critical(f"overriding csv_engine: {csv_engine}")
+            self.csv_engine = csv_engines.check_engine(csv_engine)
+
+        if (declared_columns_only := kwargs.get("declared_columns_only", None)) is not None:
+            logging.critical(f"overriding declared_columns_only: {declared_columns_only}")
+            self.declared_columns_only = declared_columns_only
+
     def _auto_formatter(self):
         separator, first_index, encoding = find_delimiter_and_start(
             self.name,
@@ -943,17 +1011,21 @@ class TxtLoader(AutoLoader, ABC):
 
     # override this if using other query functions
     def query_file(self, name):
-        logging.critical(f"parsing with pandas.read_csv: {name}")
+        logging.critical(f"parsing with the {self.csv_engine} csv engine: {name}")
         logging.critical(
             f"parameters: {self.sep=}, {self.skiprows=}, {self.header=}, {self.encoding=}, {self.decimal=}"
         )
-        data_df = pd.read_csv(
+        columns, dtypes = self._csv_column_hints()
+        data_df = csv_engines.read_csv(
             name,
+            engine=self.csv_engine,
             sep=self.sep,
             skiprows=self.skiprows,
             header=self.header,
             encoding=self.encoding,
             decimal=self.decimal,
             thousands=self.thousands,
+            columns=columns,
+            dtypes=dtypes,
         )
         return data_df
@@ -11,6 +11,7 @@ import tempfile
 import time
 import warnings
 import logging
+import mmap
 import os
 from collections import OrderedDict
 
@@ -62,17 +63,45 @@ MINIMUM_SELECTION = [
 ]
 
 
-def _read_modules(fileobj):
-    module_magic = fileobj.read(len(b"MODULE"))
-    logging.debug(f"-")
-    hdr_bytes = fileobj.read(hdr_dtype.itemsize)
-    hdr = np.frombuffer(hdr_bytes, dtype=hdr_dtype, count=1)
-    hdr_dict = dict(((n, hdr[n][0]) for n in hdr_dtype.names))
-    hdr_dict["offset"] = fileobj.tell()
-    hdr_dict["data"] = fileobj.read(hdr_dict["length"])
-    fileobj.seek(hdr_dict["offset"] + hdr_dict["length"], SEEK_SET)
-    hdr_dict["end"] = fileobj.tell()
-    return hdr_dict
+def _index_modules(buffer):
+    """Read the module headers of a (memory-mapped) mpr file.
+
+    Only the headers are read; each module's contents stay in the buffer
+    between ``offset`` and ``end`` until somebody asks for them.
+    """
+    modules = []
+    position = len(mpr_label)
+    while True:
+        position += len(b"MODULE")
+        hdr = np.frombuffer(buffer, dtype=hdr_dtype, count=1, offset=position)
+        hdr_dict = dict(((n, hdr[n][0]) for n in hdr_dtype.names))
+        hdr_dict["offset"] = position + hdr_dtype.itemsize
+        hdr_dict["end"] = hdr_dict["offset"] + int(hdr_dict["length"])
+        modules.append(hdr_dict)
+        position = hdr_dict["end"]
+        if position >= len(buffer):
+            break
+    return modules
+
+
+def _unpack_flags(flags, flags_dict):
+    """Split the packed flags byte into one column per flag.
+
+    Args:
+        flags: the ``flags`` column (uint8 array).
+        flags_dict: flag name -> (bit mask, dtype), as found in the data module.
+
+    Returns:
+        dict of flag name -> array (boolean flags as 0/1 integers).
+    """
+    unpacked = OrderedDict()
+    for flag_name, (mask, dtype) in flags_dict.items():
+        masked = np.bitwise_and(flags, mask)
+        if dtype == np.bool_:  # bool, but we prefer 0 and 1
+            unpacked[flag_name] = (masked != 0).astype(int)
+        else:
+            unpacked[flag_name] = masked.astype(dtype)
+    return unpacked
 
 
 class DataLoader(BaseLoader):
@@ -382,71 +411,99 @@ class DataLoader(BaseLoader):
         if bad_steps is not None:
             warnings.warn("Exluding bad steps is not implemented")
 
-        stats_info = os.stat(filename)
-        mpr_modules = []
-
         # VMP LOG: log module
         # VMP data: data module
         # VMP Set: settings module
-        with open(filename, mode="rb") as file_obj:
-            label = file_obj.read(len(mpr_label))
+        # The file is memory-mapped, and only the settings, log and data
+        # modules are read from it; the data records are viewed in place.
+        with open(filename, mode="rb") as file_obj, mmap.mmap(
+            file_obj.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            label = buffer[: len(mpr_label)]
             self.logger.debug(f"label: {label}")
-            counter = 0
-            while True:
-                counter += 1
-                new_module = _read_modules(file_obj)
-                position = int(new_module["end"])
-                mpr_modules.append(new_module)
-                if position >= stats_info.st_size:
-                    txt = "-reached end of file"
-                    if position == stats_info.st_size:
-                        txt += " --exactly at end of file"
-                    self.logger.info(txt)
+            mpr_modules = _index_modules(buffer)
+            if mpr_modules[-1]["end"] == len(buffer):
+                self.logger.info("-reached end of file --exactly at end of file")
+            else:
+                self.logger.info("-reached end of file")
+
+            # ------------- settings -------------------------------
+            settings_mod = None
+            for m in mpr_modules:
+                if m["shortname"].strip().decode() == "VMP Set":
+                    settings_mod = m
                     break
+            if settings_mod is None:
+                raise IOError("No settings-module found!")
+
+            settings_mod["data"] = buffer[settings_mod["offset"] : settings_mod["end"]]
+            self._parse_mpr_settings_data(settings_mod)
+
+            # ------------- data -----------------------------------
+            data_module = None
+            for i, m in enumerate(mpr_modules):
+                if m["shortname"].decode().strip() == "VMP data":
+                    data_module = m
+            if data_module is None:
+                raise IOError("No data module!")
+
+            mpr_data = self._read_data_module(buffer, data_module)
+
+            # ------------- log  -----------------------------------
+            log_module = None
+            for m in mpr_modules:
+                if m["shortname"].strip().decode() == "VMP LOG":
+                    log_module = m
+
+            mpr_log = dict()
+            if log_module is None:
+                txt = "WARNING - no log module found!"
+                logging.info(txt)
+            else:
+                end_date = dateparser.parse(log_module["date"].decode())
+                mpr_log["end_date"] = end_date
+                mpr_log["length2"] = log_module["length"]
+                mpr_log["end2"] = log_module["end"]
+                mpr_log["offset2"] = log_module["offset"]
+                mpr_log["version2"] = log_module["version"]
+                mpr_log["data"] = buffer[
+                    log_module["offset"] : log_module["end"]
+                ]  # Not sure if I will ever need it, but just in case....
 
-        # ------------- settings -------------------------------
-        settings_mod = None
-        for m in mpr_modules:
-            if m["shortname"].strip().decode() == "VMP Set":
-                settings_mod = m
-                break
-        if settings_mod is None:
-            raise IOError("No settings-module found!")
-
-        self._parse_mpr_settings_data(settings_mod)
-
-        # ------------- data -----------------------------------
-        data_module = None
-        for i, m in enumerate(mpr_modules):
-            if m["shortname"].decode().strip() == "VMP data":
-                data_module = m
-        if data_module is None:
-            raise IOError("No data module!")
+        self.mpr_log = mpr_log
+        self._parse_mpr_log_data()
+        self.mpr_data = mpr_data
 
+    def _read_data_module(self, buffer, data_module):
+        """Build the data frame from the data module of a mapped mpr file.
+
+        The records are a numpy view over the mapped file; each column is
+        copied out of it exactly once, and the flags byte is split into its
+        flag columns with vectorised bit masks.
+        """
+        start = data_module["offset"]
+        end = min(data_module["end"], len(buffer))
         data_version = data_module["version"]
-        n_data_points = np.frombuffer(data_module["data"][:4], dtype="<u4")
-        n_data_points = n_data_points[0]
-        n_columns = np.frombuffer(data_module["data"][4:5], dtype="u1")
-        n_columns = n_columns[0]
+        n_data_points = int(np.frombuffer(buffer, dtype="<u4", count=1, offset=start)[0])
+        n_columns = int(np.frombuffer(buffer, dtype="u1", count=1, offset=start + 4)[0])
 
         logging.debug(f"data (points, cols): {n_data_points}, {n_columns}")
 
         if data_version == 0:
             logging.debug("data version 0")
             column_types = np.frombuffer(
-                data_module["data"][5:], dtype="u1", count=n_columns
-            )
-
-            remaining_headers = data_module["data"][5 + n_columns : 100]
-            main_data = data_module["data"][100:]
+                buffer, dtype="u1", count=n_columns, offset=start + 5
+            ).copy()
+            remaining_headers = buffer[start + 5 + n_columns : min(start + 100, end)]
+            main_data_start = start + 100
 
         elif data_version == 2:
             logging.debug("data version 2")
             column_types = np.frombuffer(
-                data_module["data"][5:], dtype="<u2", count=n_columns
-            )
-            main_data = data_module["data"][405:]
-            remaining_headers = data_module["data"][5 + 2 * n_columns : 405]
+                buffer, dtype="<u2", count=n_columns, offset=start + 5
+            ).copy()
+            remaining_headers = buffer[start + 5 + 2 * n_columns : min(start + 405, end)]
+            main_data_start = start + 405
 
         else:
             raise IOError("Unrecognised version for data module: %d" % data_version)
@@ -460,7 +517,6 @@ class DataLoader(BaseLoader):
         dtype_dict = OrderedDict()
         flags_dict = OrderedDict()
         for col in column_types:
-            # print(f"col: {col} - {bl_dtypes[col]}")
             self.cols.append(col)
             if col in bl_flags.keys():
                 flags_dict[bl_flags[col][0]] = bl_flags[col][1]
@@ -470,58 +526,25 @@ class DataLoader(BaseLoader):
 
         dtype = np.dtype(list(dtype_dict.items()))
         p = dtype.itemsize
-        if not p == (len(main_data) / n_data_points):
+        main_data_length = max(end - main_data_start, 0)
+        if not p == (main_data_length / n_data_points):
             self.logger.info(
-                f"WARNING! You have defined {p} bytes, but it seems it should be [{len(main_data) / n_data_points}]"
+                f"WARNING! You have defined {p} bytes, but it seems it should be [{main_data_length / n_data_points}]"
             )
-        bulk = main_data
-        bulk_data = np.frombuffer(bulk, dtype=dtype)
-        mpr_data = pd.DataFrame(bulk_data)
-
-        # ------------- log  -----------------------------------
-        log_module = None
-        for m in mpr_modules:
-            if m["shortname"].strip().decode() == "VMP LOG":
-                log_module = m
-
-        mpr_log = dict()
-        if log_module is None:
-            txt = "WARNING - no log module found!"
-            logging.info(txt)
-        else:
-            end_date = dateparser.parse(log_module["date"].decode())
-            mpr_log["end_date"] = end_date
-            mpr_log["length2"] = log_module["length"]
-            mpr_log["end2"] = log_module["end"]
-            mpr_log["offset2"] = log_module["offset"]
-            mpr_log["version2"] = log_module["version"]
-            mpr_log["data"] = log_module[
-                "data"
-            ]  # Not sure if I will ever need it, but just in case....
-        self.mpr_log = mpr_log
-        self._parse_mpr_log_data()
-        self.mpr_data = mpr_data
-        self._unpack_flags()
-
-        # # temporary export while developing
-        # temp = self.mpr_data.copy()
-        #
-        # temp.to_csv(
-        #     r"C:\scripting\cellpy_dev_resources\dev_data\biologic\out\intermediate.csv",
-        #     sep=";",
-        # )
-
-    def _unpack_flags(self):
-        df = self.mpr_data
-        flags_dict = self.flags_dict
-
-        for flag_name, (mask, dtype) in flags_dict.items():
-            if flag_name in df.columns:
-                continue
-            df[flag_name] = np.array(df["flags"] & mask, dtype=dtype)
-            if dtype == np.bool_:  # bool, but we prefer 0 and 1
-                df[flag_name] = df[flag_name].astype(int)
-        self.mpr_data = df
+        n_records, remainder = divmod(main_data_length, p)
+        if remainder:
+            raise IOError(
+                f"the data module holds {main_data_length} bytes, which is not a "
+                f"whole number of {p}-byte records"
+            )
+
+        records = np.frombuffer(buffer, dtype=dtype, count=n_records, offset=main_data_start)
+        columns = OrderedDict((name, records[name].copy()) for name in dtype.names)
+        del records  # releases the mapped buffer
+        if "flags" in columns:
+            for flag_name, values in _unpack_flags(columns["flags"], flags_dict).items():
+                columns.setdefault(flag_name, values)
+        return pd.DataFrame(columns, copy=False)
 
     def _rename_header(self, h_old, h_new):
         try:
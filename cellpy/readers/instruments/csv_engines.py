@@ -0,0 +1,226 @@
+"""CSV engines for the text loaders.
+
+``TxtLoader.query_file`` and the ``custom`` loader read their files with
+``pandas.read_csv``, which parses on a single core. For the multi-GB text
+exports some cyclers write, the model configuration can pick a multithreaded
+engine instead, through two optional ``formatters`` entries::
+
+    formatters = {
+        "sep": "\\t",
+        ...
+        "csv_engine": "pyarrow",         # "pandas" (default), "pyarrow" or "polars"
+        "declared_columns_only": True,   # read only the columns cellpy uses
+    }
+
+The pyarrow and polars engines get dtype hints from the loader declarations:
+vendor columns mapped onto a floating-point native column are read as
+``float64`` straight away instead of being inferred. With
+``declared_columns_only`` the columns nobody maps (``harmonize()`` would drop
+them anyway) are not parsed at all.
+
+The frame that comes back looks like the one ``pandas.read_csv`` gives
+(unnamed and duplicated headers are spelled the pandas way). Whatever an
+engine cannot read - ragged rows, a ``thousands`` separator, a missing or
+non-integer header - is read with pandas instead.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import itertools
+import logging
+from collections.abc import Collection, Mapping, Sequence
+from typing import Optional
+
+import pandas as pd
+import polars as pl
+from cellpycore.config import default_schema
+
+CSV_ENGINES = ("pandas", "pyarrow", "polars")
+
+_FLOAT_DTYPES = (pl.Float64, pl.Float32)
+_UTF8_ENCODINGS = {"utf-8", "utf8", "ascii", "us-ascii"}
+#: How much of the file pyarrow looks at to tell which columns hold dates.
+_HEAD_BYTES = 1024 * 1024
+
+
+def check_engine(engine: Optional[str]) -> str:
+    """Validate ``engine`` (None: ``"pandas"``)."""
+    engine = (engine or "pandas").lower()
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unknown csv engine {engine!r}; choose from {CSV_ENGINES}")
+    return engine
+
+
+def declared_columns(declarations) -> set[str]:
+    """The vendor columns ``declarations`` read, map, keep or knowingly drop."""
+    return (
+        set(declarations.column_map)
+        | set(declarations.aux_map)
+        | set(declarations.passthrough)
+        | set(declarations.dropped)
+    )
+
+
+def dtype_hints(declarations) -> dict[str, str]:
+    """``float64`` for the vendor columns mapped onto floating-point native columns.
+
+    Duration columns are left out: their vendor form is an elapsed-time string.
+    """
+    dtype_map = default_schema().raw.dtype_map()
+    return {
+        vendor: "float64"
+        for vendor, native in declarations.column_map.items()
+        if dtype_map.get(native) in _FLOAT_DTYPES
+        and native not in declarations.duration_columns
+    }
+
+
+def read_csv(
+    name,
+    *,
+    engine: Optional[str] = None,
+    sep=None,
+    skiprows=0,
+    header=0,
+    encoding="utf-8",
+    decimal=".",
+    thousands=None,
+    columns: Optional[Collection[str]] = None,
+    dtypes: Optional[Mapping[str, str]] = None,
+) -> pd.DataFrame:
+    """Read a delimited text file into a pandas frame.
+
+    Args:
+        name: path to the file.
+        engine: ``"pandas"``, ``"pyarrow"`` or ``"polars"`` (None: pandas).
+        sep, skiprows, header, encoding, decimal, thousands: as for
+            ``pandas.read_csv``.
+        columns: read only these columns (those missing from the file are
+            ignored; None: all).
+        dtypes: column name to dtype hint (used by pyarrow and polars).
+
+    Returns:
+        pandas.DataFrame
+    """
+    engine = check_engine(engine)
+    if engine != "pandas":
+        skiprows = skiprows or 0
+        if sep is None or thousands is not None:
+            logging.debug(f"{engine} cannot read {name} with {sep=}, {thousands=}")
+        elif not isinstance(skiprows, int) or not isinstance(header, int):
+            logging.debug(f"{engine} needs integer skiprows and header")
+        else:
+            try:
+                return _read_with_engine(
+                    engine,
+                    name,
+                    sep=sep,
+                    skip=skiprows + header,
+                    encoding=encoding or "utf-8",
+                    decimal=decimal or ".",
+                    columns=columns,
+                    dtypes=dtypes or {},
+                )
+            except Exception as e:  # noqa: BLE001 — fall back to pandas
+                logging.info(f"{engine} could not read {name} ({e}); using pandas")
+
+    usecols = None
+    if columns is not None:
+        columns = set(columns)
+        usecols = lambda column: column in columns  # noqa: E731
+    return pd.read_csv(
+        name,
+        sep=sep,
+        skiprows=skiprows,
+        header=header,
+        encoding=encoding,
+        decimal=decimal,
+        thousands=thousands,
+        usecols=usecols,
+    )
+
+
+def _pandas_column_names(names: Sequence[str]) -> list[str]:
+    """Spell header names as ``pandas.read_csv`` does (``Unnamed: 3``, ``X.1``)."""
+    names = [name if name else f"Unnamed: {i}" for i, name in enumerate(names)]
+    seen = set(names)
+    spelled, counts = [], {}
+    for name in names:
+        count = counts.get(name, 0)
+        counts[name] = count + 1
+        if count:
+            candidate = f"{name}.{count}"
+            while candidate in seen:
+                counts[name] += 1
+                candidate = f"{name}.{counts[name] - 1}"
+            seen.add(candidate)
+            name = candidate
+        spelled.append(name)
+    return spelled
+
+
+def _header(name, *, sep, skip, encoding) -> list[str]:
+    with open(name, "r", encoding=encoding, newline="") as handle:
+        lines = itertools.islice(handle, skip, None)
+        return _pandas_column_names(next(csv.reader(lines, delimiter=sep)))
+
+
+def _read_with_engine(engine, name, *, sep, skip, encoding, decimal, columns, dtypes):
+    names = _header(name, sep=sep, skip=skip, encoding=encoding)
+    if columns is None:
+        selected = names
+    else:
+        selected = [column for column in names if column in columns]
+    hints = {column: dtype for column, dtype in dtypes.items() if column in selected}
+    if engine == "polars" and encoding.lower() not in _UTF8_ENCODINGS:
+        logging.debug(f"polars reads utf-8 only; using pyarrow for {encoding}")
+        engine = "pyarrow"
+
+    if engine == "pyarrow":
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        read_options = pa_csv.ReadOptions(
+            skip_rows=skip + 1, column_names=names, encoding=encoding
+        )
+        parse_options = pa_csv.ParseOptions(delimiter=sep)
+        column_types = {column: pa.from_numpy_dtype(dtype) for column, dtype in hints.items()}
+
+        def convert_options():
+            return pa_csv.ConvertOptions(
+                include_columns=selected,
+                column_types=column_types,
+                decimal_point=decimal,
+                strings_can_be_null=True,
+            )
+
+        # pyarrow turns dates and times into temporal types, pandas leaves
+        # them as text (and the loaders parse them); find them in the head
+        with open(name, "rb") as handle:
+            head = handle.read(_HEAD_BYTES)
+        head = head[: head.rfind(b"\n") + 1] or head
+        sample = pa_csv.read_csv(
+            io.BytesIO(head), read_options, parse_options, convert_options()
+        )
+        for field in sample.schema:
+            if pa.types.is_temporal(field.type):
+                column_types[field.name] = pa.string()
+
+        table = pa_csv.read_csv(name, read_options, parse_options, convert_options())
+        return table.to_pandas()
+
+    frame = pl.read_csv(
+        name,
+        separator=sep,
+        has_header=False,
+        skip_rows=skip + 1,
+        columns=[names.index(column) for column in selected],
+        new_columns=selected,
+        schema_overrides={column: pl.Float64 for column in hints},
+        decimal_comma=decimal == ",",
+        encoding="utf8",
+        infer_schema_length=10_000,
+    )
+    return frame.to_pandas()
@@ -19,6 +19,7 @@ from pathlib import Path
 import pandas as pd
 
 from cellpy import prms
+from cellpy.readers.instruments import csv_engines
 from cellpy.readers.instruments.base import find_delimiter_and_start, AutoLoader
 from cellpy.readers.instruments.configurations import (
     register_local_configuration_from_yaml_file,
@@ -103,6 +104,12 @@ class DataLoader(AutoLoader, ABC):
             self.thousands = self._config_sub_parser(
                 "thousands", default_value=None, **kwargs
             )
+            self.csv_engine = self._config_sub_parser(
+                "csv_engine", default_value="pandas", **kwargs
+            )
+            self.declared_columns_only = self._config_sub_parser(
+                "declared_columns_only", default_value=False, **kwargs
+            )
 
         elif self.file_format == "xlsx":
             self.table_name = self._config_sub_parser(
@@ -149,18 +156,22 @@ class DataLoader(AutoLoader, ABC):
 
         # rewrite this on a later stage to use functions and dict lookup instead of if - else
         if self.file_format == "csv":
-            logging.debug(f"parsing with pandas.read_csv: {name}")
+            logging.debug(f"parsing with the {self.csv_engine} csv engine: {name}")
             logging.critical(
                 f"{self.sep=}, {self.skiprows=}, {self.header=}, {self.encoding=}, {self.decimal=}"
             )
-            data_df = pd.read_csv(
+            columns, dtypes = self._csv_column_hints()
+            data_df = csv_engines.read_csv(
                 name,
+                engine=self.csv_engine,
                 sep=self.sep,
                 skiprows=self.skiprows,
                 header=self.header,
                 encoding=self.encoding,
                 decimal=self.decimal,
                 thousands=self.thousands,
+                columns=columns,
+                dtypes=dtypes,
             )
         elif self.file_format == "xls":
             logging.debug(
@@ -21,6 +21,15 @@ Step 6 is the one to be careful about; see :func:`normalize_reset_granularity`.
 Step 4 must precede step 5: the schema dtype for those columns is numeric, so
 casting a duration string first would null the column outright — see
 :func:`_cast_to_schema`, which now refuses to do that quietly.
+
+Steps 2-7 are built as one lazy polars query and collected once, right before
+step 8. ``parse()`` may therefore return a ``pl.LazyFrame`` (a ``scan_csv``, a
+``scan_parquet``, ...): polars then pushes the column selection of step 2 down
+into the scan, so undeclared columns are never read, fuses the conversions,
+and collects on the streaming engine, which does not need the whole vendor
+file in memory at once. The checks that need the data (failed duration
+parses, values lost in a cast) ride along in the same query as flag columns
+and are evaluated on the collected frame.
 """
 
 from __future__ import annotations
@@ -28,7 +37,7 @@ from __future__ import annotations
 import logging
 import re
 from datetime import datetime, timedelta, timezone as dt_timezone
-from typing import Any
+from typing import Any, Callable
 
 import polars as pl
 from cellpycore.cell_core import validate_raw_frame
@@ -39,11 +48,27 @@ from cellpy.readers.instruments.declarations import LoaderDeclarations, ResetGra
 
 _NS_PER_SECOND = 1_000_000_000
 
+#: Prefix of the flag columns the data checks of the lazy query travel in.
+_CHECK_PREFIX = "__harmonize_had_value__"
+
+#: What each ``datetime_kind`` parses into (``"datetime"`` keeps its dtype).
+_PARSED_DATETIME_DTYPES = {
+    "string": pl.Datetime("us"),
+    "epoch_seconds": pl.Datetime("ns"),
+    "arbin_epoch": pl.Datetime("ns"),
+    "excel_serial": pl.Datetime("us"),
+}
+
+
+def _column_names(frame: pl.DataFrame | pl.LazyFrame) -> list[str]:
+    """Column names of an eager or lazy frame (without collecting it)."""
+    return frame.collect_schema().names()
+
 
 def normalize_reset_granularity(
-    raw: pl.DataFrame,
+    raw: pl.DataFrame | pl.LazyFrame,
     declarations: LoaderDeclarations,
-) -> pl.DataFrame:
+) -> pl.DataFrame | pl.LazyFrame:
     """Convert cumulative columns to the harmonized-raw convention.
 
     The target (harmonized-raw spec, *Capacity convention*) is **cumulative per
@@ -65,18 +90,19 @@ def normalize_reset_granularity(
         running total of the *completed* steps of that cycle.
 
     Args:
-        raw: frame already renamed to native columns.
+        raw: frame already renamed to native columns, eager or lazy.
         declarations: carries ``reset_granularity`` per column.
 
     Returns:
-        A new frame; the input is not mutated.
+        A new frame of the same kind; the input is not mutated.
     """
     schema = default_schema().raw
     cycle_column = schema.cycle_num
 
     if not declarations.reset_granularity:
         return raw
-    if cycle_column not in raw.columns:
+    columns = _column_names(raw)
+    if cycle_column not in columns:
         raise LoaderError(
             f"reset-granularity normalization needs {cycle_column!r}, which the "
             f"loader did not produce; declare it in column_map."
@@ -84,7 +110,7 @@ def normalize_reset_granularity(
 
     out = raw
     for column, granularity in declarations.reset_granularity.items():
-        if column not in out.columns:
+        if column not in columns:
             # Declared but absent: the file simply did not carry it.
             continue
 
@@ -103,7 +129,7 @@ def normalize_reset_granularity(
 
         if granularity is ResetGranularity.PER_STEP:
             step_column = schema.step_num
-            if step_column not in out.columns:
+            if step_column not in columns:
                 raise LoaderError(
                     f"per-step reset granularity for {column!r} needs "
                     f"{step_column!r}; declare it in column_map."
@@ -124,7 +150,12 @@ def normalize_reset_granularity(
                 .drop("_step_total")
             )
             out = (
-                out.join(step_totals, on=[cycle_column, step_column], how="left")
+                out.join(
+                    step_totals,
+                    on=[cycle_column, step_column],
+                    how="left",
+                    maintain_order="left",
+                )
                 .with_columns((pl.col(column) + pl.col("_offset")).alias(column))
                 .drop("_offset")
             )
@@ -198,8 +229,8 @@ def _parse_datetime_column(series: pl.Series, kind: str) -> pl.Series:
 
 
 def _derive_epoch_time_utc(
-    raw: pl.DataFrame, declarations: LoaderDeclarations
-) -> pl.DataFrame:
+    raw: pl.LazyFrame, declarations: LoaderDeclarations
+) -> pl.LazyFrame:
     """Parse the ``date_time`` passthrough and derive ``epoch_time_utc``.
 
     ``epoch_time_utc`` is a **required** native column, but no vendor writes it;
@@ -219,33 +250,42 @@ def _derive_epoch_time_utc(
     from cellpy.parameters.internal_settings import get_headers_normal
 
     date_time = get_headers_normal().datetime_txt
-    if date_time not in raw.columns:
+    if date_time not in _column_names(raw):
         # Declared but this file did not carry it; nothing to derive from.
         return raw
 
-    parsed = _parse_datetime_column(raw[date_time], kind)
-    return raw.with_columns(
-        parsed.alias(date_time),
-        parsed.alias(schema.epoch_time_utc),
-    )
+    if kind != "datetime":
+        if kind not in _PARSED_DATETIME_DTYPES:
+            raise LoaderError(f"unknown datetime_kind {kind!r}")
+        # "string" has to see the whole column at once (pandas infers the
+        # format from it); the other kinds may be parsed batch by batch.
+        raw = raw.with_columns(
+            pl.col(date_time).map_batches(
+                lambda series: _parse_datetime_column(series, kind),
+                return_dtype=_PARSED_DATETIME_DTYPES[kind],
+                is_elementwise=kind != "string",
+            )
+        )
+    return raw.with_columns(pl.col(date_time).alias(schema.epoch_time_utc))
 
 
 def _convert_timestamps(
-    raw: pl.DataFrame, declarations: LoaderDeclarations
-) -> pl.DataFrame:
+    raw: pl.LazyFrame, declarations: LoaderDeclarations
+) -> pl.LazyFrame:
     """Vendor datetimes → ``epoch_time_utc`` as int64 nanoseconds UTC."""
     schema = default_schema().raw
     column = schema.epoch_time_utc
-    if column not in raw.columns:
+    dtypes = raw.collect_schema()
+    if column not in dtypes:
         return raw
 
-    dtype = raw[column].dtype
+    dtype = dtypes[column]
     if dtype == pl.Int64:
         return raw
 
     if dtype == pl.Datetime:
-        series = raw[column]
-        if series.dtype.time_zone is None:
+        timestamps = pl.col(column)
+        if dtype.time_zone is None:
             if declarations.timezone is None:
                 # Decision (2026-07-21, #560): a naive timestamp is read as
                 # **UTC**, not the host's local zone. This matches
@@ -260,11 +300,11 @@ def _convert_timestamps(
                     "naive timestamps interpreted as UTC; declare a timezone in "
                     "the loader declarations if the cycler's local zone is known"
                 )
-                series = series.dt.replace_time_zone("UTC")
+                timestamps = timestamps.dt.replace_time_zone("UTC")
             else:
-                series = series.dt.replace_time_zone(declarations.timezone)
+                timestamps = timestamps.dt.replace_time_zone(declarations.timezone)
         return raw.with_columns(
-            series.dt.convert_time_zone("UTC").dt.epoch("ns").alias(column)
+            timestamps.dt.convert_time_zone("UTC").dt.epoch("ns").alias(column)
         )
 
     if dtype in (pl.Float64, pl.Float32):
@@ -300,40 +340,54 @@ def _duration_to_seconds(value: str | None) -> float | None:
 
 
 def _convert_durations(
-    raw: pl.DataFrame, declarations: LoaderDeclarations
-) -> pl.DataFrame:
+    raw: pl.LazyFrame,
+    declarations: LoaderDeclarations,
+    checks: list[Callable[[pl.DataFrame], None]],
+) -> pl.LazyFrame:
     """Elapsed-time strings → float seconds.
 
     Matches the legacy ``pd.to_timedelta(...).dt.total_seconds()`` semantics.
     Only string columns are touched; a vendor that already writes seconds needs
-    no declaration and is left alone.
+    no declaration and is left alone. Values that do not parse are caught by
+    the check appended to ``checks``, once the query has run.
     """
+    dtypes = raw.collect_schema()
     columns = [
         column
         for column in declarations.duration_columns
-        if column in raw.columns and raw[column].dtype == pl.String
+        if dtypes.get(column) == pl.String
     ]
     if not columns:
         return raw
 
-    out = raw.with_columns(
-        pl.col(column)
-        .map_elements(_duration_to_seconds, return_dtype=pl.Float64)
-        .alias(column)
-        for column in columns
+    flags = {column: f"{_CHECK_PREFIX}duration_{column}" for column in columns}
+
+    def check(out: pl.DataFrame) -> None:
+        for column, flag in flags.items():
+            failed = (out[flag] & out[column].is_null()).sum()
+            if failed:
+                examples = raw.select(pl.col(column).head(3)).collect()[column]
+                raise LoaderError(
+                    f"{column!r} is declared as a duration column but {failed} of "
+                    f"{out.height} values could not be parsed as an elapsed time "
+                    f"(examples: {examples.to_list()})"
+                )
+
+    checks.append(check)
+    return raw.with_columns(
+        *(pl.col(column).is_not_null().alias(flag) for column, flag in flags.items()),
+        *(
+            pl.col(column)
+            .map_elements(_duration_to_seconds, return_dtype=pl.Float64)
+            .alias(column)
+            for column in columns
+        ),
     )
-    for column in columns:
-        failed = out[column].null_count() - raw[column].null_count()
-        if failed:
-            raise LoaderError(
-                f"{column!r} is declared as a duration column but {failed} of "
-                f"{raw.height} values could not be parsed as an elapsed time "
-                f"(examples: {raw[column].head(3).to_list()})"
-            )
-    return out
 
 
-def _cast_to_schema(raw: pl.DataFrame) -> pl.DataFrame:
+def _cast_to_schema(
+    raw: pl.LazyFrame, checks: list[Callable[[pl.DataFrame], None]]
+) -> pl.LazyFrame:
     """Cast every recognised column to its schema dtype.
 
     Casts are non-strict, because real vendor files carry the occasional junk
@@ -345,63 +399,67 @@ def _cast_to_schema(raw: pl.DataFrame) -> pl.DataFrame:
     neware writes ``Time`` as ``"00:01:00"``, and casting that to the schema's
     Float64 nulled all 9065 rows without a word — the same silent-data-loss
     shape. Partial losses warn, so they are visible without being
-    fatal.
+    fatal. Both are judged by the check appended to ``checks``.
     """
     dtype_map = default_schema().raw.dtype_map()
-    casts = [
-        pl.col(name).cast(dtype, strict=False).alias(name)
-        for name, dtype in dtype_map.items()
-        if name in raw.columns
-    ]
-    if not casts:
+    dtypes = raw.collect_schema()
+    present = [name for name in dtype_map if name in dtypes]
+    if not present:
         return raw
 
-    out = raw.with_columns(casts)
+    # A column that already has its schema dtype cannot lose values.
+    flags = {
+        name: f"{_CHECK_PREFIX}cast_{name}"
+        for name in present
+        if dtypes[name] != dtype_map[name]
+    }
 
-    def _describe(name: str, lost: int) -> str:
-        return (
-            f"{name} ({lost}/{raw.height} values, {raw[name].dtype} -> "
-            f"{dtype_map[name]})"
-        )
+    def check(out: pl.DataFrame) -> None:
+        emptied, damaged = [], []
+        for name, flag in flags.items():
+            lost = (out[flag] & out[name].is_null()).sum()
+            if lost <= 0:
+                continue
+            described = (
+                f"{name} ({lost}/{out.height} values, {dtypes[name]} -> "
+                f"{dtype_map[name]})"
+            )
+            if out[flag].any() and out[name].null_count() == out.height:
+                emptied.append(described)
+            else:
+                damaged.append(described)
 
-    emptied, damaged = [], []
-    for name in dtype_map:
-        if name not in raw.columns:
-            continue
-        lost = out[name].null_count() - raw[name].null_count()
-        if lost <= 0:
-            continue
-        had_data = raw[name].null_count() < raw.height
-        if had_data and out[name].null_count() == raw.height:
-            emptied.append(_describe(name, lost))
-        else:
-            damaged.append(_describe(name, lost))
+        if damaged:
+            logging.warning(
+                "casting to the schema dtypes produced nulls: %s; the affected "
+                "values could not be read as the native dtype",
+                ", ".join(sorted(damaged)),
+            )
+        if emptied:
+            raise LoaderError(
+                f"casting to the schema dtypes emptied column(s) entirely: "
+                f"{', '.join(sorted(emptied))}. The vendor column is not what the "
+                f"native column expects - declare a conversion (e.g. "
+                f"duration_columns) or fix the column_map target."
+            )
 
-    if damaged:
-        logging.warning(
-            "casting to the schema dtypes produced nulls: %s; the affected "
-            "values could not be read as the native dtype",
-            ", ".join(sorted(damaged)),
-        )
-    if emptied:
-        raise LoaderError(
-            f"casting to the schema dtypes emptied column(s) entirely: "
-            f"{', '.join(sorted(emptied))}. The vendor column is not what the "
-            f"native column expects - declare a conversion (e.g. "
-            f"duration_columns) or fix the column_map target."
-        )
-    return out
+    checks.append(check)
+    return raw.with_columns(
+        *(pl.col(name).is_not_null().alias(flag) for name, flag in flags.items()),
+        *(pl.col(name).cast(dtype_map[name], strict=False).alias(name) for name in present),
+    )
 
 
-def _stamp_identity(raw: pl.DataFrame, *, test_id: int) -> pl.DataFrame:
+def _stamp_identity(raw: pl.LazyFrame, *, test_id: int) -> pl.LazyFrame:
     """Fill the framework-owned identity columns."""
     schema = default_schema().raw
+    columns = _column_names(raw)
     additions = []
-    if schema.test_id not in raw.columns:
+    if schema.test_id not in columns:
         additions.append(pl.lit(test_id, dtype=pl.Int64).alias(schema.test_id))
-    if schema.mask not in raw.columns:
+    if schema.mask not in columns:
         additions.append(pl.lit(True, dtype=pl.Boolean).alias(schema.mask))
-    if schema.datapoint_num not in raw.columns:
+    if schema.datapoint_num not in columns:
         additions.append(
             pl.int_range(0, pl.len(), dtype=pl.Int64).alias(schema.datapoint_num)
         )
@@ -414,18 +472,25 @@ def harmonize(
     *,
     test_id: int = 0,
     strict: bool = True,
+    engine: str | None = None,
 ) -> pl.DataFrame:
     """Normalize a parsed vendor frame into harmonized native raw.
 
     Args:
         vendor_frame: what the loader's ``parse()`` produced — a polars frame,
-            or a pandas frame (converted here, so legacy parsers can be reused
-            unchanged during the port).
-        declarations: the loader's declarations.
+            a polars ``LazyFrame`` (harmonized without ever materializing the
+            vendor frame), or a pandas frame (converted here, so legacy
+            parsers can be reused unchanged during the port).
+        declarations: the loader's declarations. The post hooks get the frame
+            as ``parse()`` returned it, so hooks of a loader that returns a
+            ``LazyFrame`` must accept one (the shipped hooks do).
         test_id: identity for the rows of this test.
         strict: run ``validate_raw_frame`` strictly. The two sanctioned
             warn-only escape hatches (``local_instrument`` and friends,
             conventions plan §4) pass ``strict=False``.
+        engine: the polars engine that runs the query (``"auto"``,
+            ``"in-memory"`` or ``"streaming"``). None: ``"streaming"`` for a
+            ``LazyFrame``, ``"auto"`` otherwise.
 
     Returns:
         A polars frame in the harmonized-raw schema.
@@ -433,7 +498,8 @@ def harmonize(
     Raises:
         LoaderError: if the frame cannot be normalized or fails validation.
     """
-    if not isinstance(vendor_frame, pl.DataFrame):
+    lazy = isinstance(vendor_frame, pl.LazyFrame)
+    if not lazy and not isinstance(vendor_frame, pl.DataFrame):
         try:
             vendor_frame = pl.from_pandas(vendor_frame)
         except Exception as exc:
@@ -441,10 +507,13 @@ def harmonize(
                 f"parse() must return a polars or pandas frame, got "
                 f"{type(vendor_frame).__name__}"
             ) from exc
+    if engine is None:
+        engine = "streaming" if lazy else "auto"
 
     raw = vendor_frame
     for hook in declarations.post_hooks:
         raw = hook(raw)
+    vendor_columns = _column_names(raw)
 
     # Passthrough columns are renamed alongside the native ones; they simply
     # keep a name the schema does not own (see LoaderDeclarations.passthrough).
@@ -453,7 +522,7 @@ def harmonize(
         **declarations.aux_map,
         **declarations.passthrough,
     }
-    missing = [vendor for vendor in mapping if vendor not in raw.columns]
+    missing = [vendor for vendor in mapping if vendor not in vendor_columns]
     if missing:
         logging.debug("declared vendor columns absent from this file: %s", missing)
 
@@ -463,7 +532,7 @@ def harmonize(
     # not warn (e.g. a state flag a post hook has already consumed).
     unrecognised = [
         column
-        for column in raw.columns
+        for column in vendor_columns
         if column not in mapping and column not in declarations.dropped
     ]
     if unrecognised:
@@ -474,15 +543,27 @@ def harmonize(
             unrecognised,
         )
 
-    present = {vendor: native for vendor, native in mapping.items() if vendor in raw.columns}
-    raw = raw.select(list(present)).rename(present)
+    present = {
+        vendor: native for vendor, native in mapping.items() if vendor in vendor_columns
+    }
+    checks: list[Callable[[pl.DataFrame], None]] = []
+    query = raw.lazy().select(list(present)).rename(present)
+    query = _derive_epoch_time_utc(query, declarations)
+    query = _convert_timestamps(query, declarations)
+    query = _convert_durations(query, declarations, checks)
+    query = _cast_to_schema(query, checks)
+    query = normalize_reset_granularity(query, declarations)
+    query = _stamp_identity(query, test_id=test_id)
 
-    raw = _derive_epoch_time_utc(raw, declarations)
-    raw = _convert_timestamps(raw, declarations)
-    raw = _convert_durations(raw, declarations)
-    raw = _cast_to_schema(raw)
-    raw = normalize_reset_granularity(raw, declarations)
-    raw = _stamp_identity(raw, test_id=test_id)
+    try:
+        raw = query.collect(engine=engine)
+    except pl.exceptions.PolarsError as exc:
+        raise LoaderError(f"could not harmonize the vendor frame: {exc}") from exc
+    for check in checks:
+        check(raw)
+    raw = raw.drop(
+        [column for column in raw.columns if column.startswith(_CHECK_PREFIX)]
+    )
 
     try:
         validate_raw_frame(raw, default_schema().raw)
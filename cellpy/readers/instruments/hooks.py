@@ -13,7 +13,10 @@ Two differences from the legacy version, both structural rather than semantic:
   that synthesises a column gives it a vendor-side name which the declarations
   then map like any other (the ``maccor_txt_native`` pilot established the
   pattern).
-- **Polars, expression-based**, so the per-cycle Python loop is gone.
+- **Polars, expression-based**, so the per-cycle Python loop is gone. That is
+  also what lets every hook here take a ``pl.LazyFrame`` as well as a
+  ``pl.DataFrame``: ``harmonize()`` hands hooks whatever ``parse()`` returned,
+  and a lazy parse stays lazy through them.
 
 The semantics are deliberately a faithful port, quirks included — see
 :func:`state_splitter`. Improving them is a separate, release-noted decision;
@@ -22,18 +25,19 @@ doing it inside a port is how a refactor silently changes someone's data.
 
 from __future__ import annotations
 
-import logging
-import math
-from typing import Callable, Sequence
+from typing import Callable, Sequence, TypeVar
 
 import polars as pl
 
 from cellpy.exceptions import LoaderError
 
+#: A hook returns the kind of frame it was given, eager or lazy.
+Frame = TypeVar("Frame", pl.DataFrame, pl.LazyFrame)
+
 
 def forward_fill(
     *, columns: Sequence[str]
-) -> Callable[[pl.DataFrame], pl.DataFrame]:
+) -> Callable[[Frame], Frame]:
     """Carry the last value forward over the nulls that follow it.
 
     For measurements a tester records only when they change — internal
@@ -52,8 +56,9 @@ def forward_fill(
             declaration can name a column a given file happens not to carry.
     """
 
-    def hook(frame: pl.DataFrame) -> pl.DataFrame:
-        present = [column for column in columns if column in frame.columns]
+    def hook(frame: Frame) -> Frame:
+        names = frame.collect_schema().names()
+        present = [column for column in columns if column in names]
         if not present:
             return frame
         return frame.with_columns(pl.col(column).forward_fill() for column in present)
@@ -64,7 +69,7 @@ def forward_fill(
 
 def drop_last_row_if_worse(
     *, columns: Sequence[str]
-) -> Callable[[pl.DataFrame], pl.DataFrame]:
+) -> Callable[[Frame], Frame]:
     """Drop the final row when it is more incomplete than the one before it.
 
     A port of the legacy ``remove_last_if_bad``, which exists because some
@@ -88,37 +93,34 @@ def drop_last_row_if_worse(
         nothing else, but a row dropped *wrongly* silently loses a measurement.
     """
 
-    def _missing(row: tuple) -> int:
-        return sum(
-            1
-            for value in row
-            if value is None or (isinstance(value, float) and math.isnan(value))
-        )
+    def _missing(column: str, dtype: pl.DataType) -> pl.Expr:
+        # Missing as pandas ``isna`` has it: null, or NaN in a float column.
+        missing = pl.col(column).is_null()
+        if dtype.is_float():
+            missing = missing | pl.col(column).is_nan().fill_null(False)
+        return missing
 
-    def hook(frame: pl.DataFrame) -> pl.DataFrame:
-        if frame.height < 2:
+    def hook(frame: Frame) -> Frame:
+        if isinstance(frame, pl.DataFrame) and frame.height < 2:
             # Legacy indexes iloc[-2]; with fewer than two rows there is
             # nothing to compare against.
             return frame
 
-        present = [column for column in columns if column in frame.columns]
+        schema = frame.collect_schema()
+        present = [column for column in columns if column in schema]
         if not present:
             raise LoaderError(
                 f"drop-last-if-worse was given no column it could check; it "
                 f"expected some of {sorted(columns)} but the frame has "
-                f"{sorted(frame.columns)}"
+                f"{sorted(schema.names())}"
             )
 
-        tail = frame.select(present).tail(2)
-        if _missing(tail.row(1)) > _missing(tail.row(0)):
-            logging.debug(
-                "dropping the final row: %d missing values against %d in the "
-                "row before it",
-                _missing(tail.row(1)),
-                _missing(tail.row(0)),
-            )
-            return frame.head(frame.height - 1)
-        return frame
+        # Missing values per row; the final row goes if it has more than the
+        # row before it (a single row has no row before it and stays).
+        missing = pl.sum_horizontal(_missing(column, schema[column]) for column in present)
+        is_last = pl.int_range(pl.len()) == pl.len() - 1
+        worse = (missing > missing.shift(1)).fill_null(False)
+        return frame.filter(~(is_last & worse))
 
     hook.__name__ = "drop_last_row_if_worse"
     return hook
@@ -126,7 +128,7 @@ def drop_last_row_if_worse(
 
 def cycle_number_not_zero(
     *, cycle_column: str
-) -> Callable[[pl.DataFrame], pl.DataFrame]:
+) -> Callable[[Frame], Frame]:
     """Shift zero-based vendor cycle numbering to start at 1.
 
     A port of the legacy ``set_cycle_number_not_zero``, quirk included: the
@@ -144,26 +146,27 @@ def cycle_number_not_zero(
         cycle_column: the **vendor** cycle column (hooks run before renaming).
     """
 
-    def hook(frame: pl.DataFrame) -> pl.DataFrame:
-        if cycle_column not in frame.columns:
+    def hook(frame: Frame) -> Frame:
+        schema = frame.collect_schema()
+        if cycle_column not in schema:
             raise LoaderError(
                 f"cycle-number normalization needs vendor column "
-                f"{cycle_column!r}; the parsed frame has {sorted(frame.columns)}"
+                f"{cycle_column!r}; the parsed frame has {sorted(schema.names())}"
             )
-        if not frame[cycle_column].dtype.is_numeric():
+        if not schema[cycle_column].is_numeric():
             # Silence here would be the bug: a string column compares unequal
             # to 0, so the shift would simply never happen and every cycle
             # index would be off by one with nothing to show for it.
             raise LoaderError(
-                f"cycle column {cycle_column!r} is {frame[cycle_column].dtype}, "
+                f"cycle column {cycle_column!r} is {schema[cycle_column]}, "
                 f"not numeric; cycle-number normalization cannot tell whether "
                 f"it starts at zero"
             )
-        if frame.height == 0:
-            return frame
-        if frame[cycle_column].min() != 0:
-            return frame
-        return frame.with_columns((pl.col(cycle_column) + 1).alias(cycle_column))
+        cycle = pl.col(cycle_column)
+        # An empty column has no minimum (null), so it is left as it is.
+        return frame.with_columns(
+            pl.when(cycle.min() == 0).then(cycle + 1).otherwise(cycle).alias(cycle_column)
+        )
 
     hook.__name__ = f"cycle_number_not_zero[{cycle_column}]"
     return hook
@@ -182,7 +185,7 @@ def state_splitter(
     n_charge: float = 1.0,
     n_discharge: float = 1.0,
     propagate: bool = True,
-) -> Callable[[pl.DataFrame], pl.DataFrame]:
+) -> Callable[[Frame], Frame]:
     """Build a hook that splits one column by the vendor's state flag.
 
     Args:
@@ -248,13 +251,14 @@ def state_splitter(
             .fill_null(0.0)
         )
 
-    def hook(frame: pl.DataFrame) -> pl.DataFrame:
+    def hook(frame: Frame) -> Frame:
         required = {base_column, state_column, cycle_column, datapoint_column}
-        missing = sorted(required - set(frame.columns))
+        names = frame.collect_schema().names()
+        missing = sorted(required - set(names))
         if missing:
             raise LoaderError(
                 f"state splitting needs vendor column(s) {missing}, which the "
-                f"parsed frame does not have; it has {sorted(frame.columns)}"
+                f"parsed frame does not have; it has {sorted(names)}"
             )
 
         if combined:
@@ -156,11 +156,16 @@ class MaccorTxtLoader:
             return False
         return any(_VENDOR_CAPACITY in line for line in head)
 
-    def parse(self, source: Path) -> pl.DataFrame:
-        """Vendor stage: read the file into a frame with vendor column names."""
+    def parse(self, source: Path) -> pl.LazyFrame:
+        """Vendor stage: scan the file into a lazy frame with vendor column names.
+
+        Nothing is read beyond the header and the rows polars needs to infer
+        the dtypes; ``harmonize()`` runs the scan, reading only the declared
+        columns.
+        """
         source = Path(source)
         try:
-            frame = pl.read_csv(
+            frame = pl.scan_csv(
                 source,
                 separator="\t",
                 skip_rows=self.skip_rows,
@@ -169,18 +174,19 @@ class MaccorTxtLoader:
                 truncate_ragged_lines=True,
                 infer_schema_length=10_000,
             )
+            dtypes = frame.collect_schema()
         except Exception as exc:
             raise LoaderError(f"could not parse Maccor file {source}: {exc}") from exc
 
         conversions = []
         for column in ("TestTime", "StepTime"):
-            if column in frame.columns and frame[column].dtype == pl.String:
+            if dtypes.get(column) == pl.String:
                 conversions.append(
                     pl.col(column)
                     .map_elements(_duration_to_seconds, return_dtype=pl.Float64)
                     .alias(column)
                 )
-        if "DPt Time" in frame.columns and frame["DPt Time"].dtype == pl.String:
+        if dtypes.get("DPt Time") == pl.String:
             conversions.append(
                 pl.col("DPt Time")
                 .str.strip_chars()
@@ -0,0 +1,263 @@
+"""On-disk cache of harmonized raw frames.
+
+``from_raw`` on a single vendor file runs ``harmonize(parse())`` and then the
+loader to build the ``Data`` around it. Both read the vendor file, which is
+most of the time spent on a ``source="raw_only"`` batch re-run over files that
+have not changed. With ``config.reader.parse_cache_dir`` set, the result is
+kept as one parquet file per raw file, so the next load of the same file skips
+the vendor stage entirely.
+
+The key of an entry is a digest of
+
+- the identity of the raw file (``provenance.file_identity_hash``, which only
+  reads the start of the file) and its modification time (``st_mtime_ns``),
+  so an edit further into a large file is a miss as well,
+- the loader (class name and the cellpy version it ships with),
+- the loader configuration the declarations are derived from, and
+- the loader knobs handed to ``from_raw`` (``bad_steps``, ``data_points``, ...).
+
+The declarations themselves are not part of the key: some loaders only know
+them after parsing the file (see ``TxtLoader.declarations``), and they follow
+from the file and the configuration, which are.
+
+An entry holds the native raw frame as its table. What the loader put around
+it (the meta document and the raw-file lengths) travels in the schema metadata
+(key ``cellpy.shell``). Reading an entry touches it; when the entries together
+outgrow ``config.reader.parse_cache_max_size`` the least recently used ones are
+removed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import cellpy.config as config
+from cellpy._version import __version__
+from cellpy.readers import data_structures as ds
+from cellpy.readers import externals
+from cellpy.readers.cellpy_file import meta_archive
+from cellpy.readers.cellpy_file import translate as cellpy_file_translate
+from cellpy.readers.cellpy_file.atomic import atomic_write
+from cellpy.readers.provenance import file_identity_hash
+
+_module_logger = logging.getLogger(__name__)
+
+PathLike = Union[str, os.PathLike]
+
+CACHE_SUFFIX = ".parquet"
+SHELL_KEY = b"cellpy.shell"
+
+
+def _json_digest(obj: Any) -> str:
+    text = json.dumps(obj, sort_keys=True, default=meta_archive._json_default)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def configuration_digest(loader) -> str:
+    """Digest of the configuration ``loader`` derives its declarations from."""
+    config_params = getattr(loader, "config_params", None)
+    if dataclasses.is_dataclass(config_params):
+        config_params = dataclasses.asdict(config_params)
+    return _json_digest(
+        {
+            "model": getattr(loader, "model", None),
+            "config_params": config_params,
+        }
+    )
+
+
+def cache_key(source: PathLike, loader, **parse_kwargs) -> Optional[str]:
+    """The cache key for loading ``source`` with ``loader``, or None if unreadable."""
+    identity = file_identity_hash(source)
+    if identity is None:
+        return None
+    try:
+        modified = os.stat(source).st_mtime_ns
+    except OSError:
+        return None
+    loader_class = type(loader)
+    return _json_digest(
+        {
+            "identity": identity,
+            "modified": modified,
+            "loader": f"{loader_class.__module__}.{loader_class.__qualname__}",
+            "loader_version": __version__,
+            "configuration": configuration_digest(loader),
+            "parse_kwargs": parse_kwargs,
+        }
+    )
+
+
+class ParseCache:
+    """A directory of harmonized raw frames, evicted least recently used first.
+
+    Args:
+        directory: where the entries are kept (created on first write).
+        max_size: upper bound, in bytes, of the entries together (None: no bound).
+    """
+
+    def __init__(self, directory: PathLike, max_size: Optional[int] = None):
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def __repr__(self):
+        return f"ParseCache({str(self.directory)!r}, max_size={self.max_size})"
+
+    @classmethod
+    def from_config(cls) -> Optional["ParseCache"]:
+        """The cache configured in ``config.reader``, or None if it is off."""
+        directory = getattr(config.reader, "parse_cache_dir", None)
+        if not directory:
+            return None
+        return cls(
+            Path(directory).expanduser(),
+            getattr(config.reader, "parse_cache_max_size", None),
+        )
+
+    def entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{CACHE_SUFFIX}"
+
+    def entries(self) -> list[Path]:
+        """The entries, least recently used first."""
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for path in self.directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:  # removed by a concurrent eviction
+                continue
+        return [path for _, path in sorted(entries)]
+
+    def size(self) -> int:
+        """Bytes taken by the entries."""
+        total = 0
+        for path in self.entries():
+            try:
+                total += path.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def get(self, key: str, source: PathLike):
+        """The native raw frame and ``Data`` shell cached for ``key``.
+
+        Returns:
+            ``(raw, data)`` or None on a miss. ``data`` is the shell the loader
+            built for ``source``, with a legacy-named view of ``raw``.
+        """
+        import pyarrow.parquet as pq
+
+        path = self.entry_path(key)
+        try:
+            table = pq.read_table(path)
+            shell = json.loads(table.schema.metadata[SHELL_KEY].decode("utf-8"))
+            raw = table.to_pandas()
+            data = self._data_shell(shell, raw, source)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # noqa: BLE001 — an unusable entry is a miss
+            _module_logger.info("dropping unusable parse-cache entry %s (%s)", path, e)
+            path.unlink(missing_ok=True)
+            return None
+        _module_logger.debug("parse-cache hit for %s", source)
+        return raw, data
+
+    def put(self, key: str, raw, data: "ds.Data") -> bool:
+        """Cache ``raw`` (native) and the ``Data`` shell the loader built.
+
+        Shells that already carry steps or a summary are not cached; those
+        loaders do more than parse the raw data.
+
+        Returns:
+            True if the entry was written.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        for table in ("steps", "summary"):
+            frame = getattr(data, table, None)
+            if frame is not None and not frame.empty:
+                return False
+        start = data.meta_common.start_datetime
+        shell = {
+            "meta": meta_archive.build_meta_document(data),
+            # the meta document keeps timestamps as strings
+            "start_datetime": start.isoformat() if isinstance(start, datetime) else None,
+            "raw_data_files_length": list(data.raw_data_files_length or []),
+            "last_data_point": [
+                getattr(fid, "last_data_point", 0) for fid in data.raw_data_files or []
+            ],
+        }
+        shell_json = json.dumps(shell, default=meta_archive._json_default)
+        arrow_table = pa.Table.from_pandas(raw, preserve_index=False)
+        metadata = dict(arrow_table.schema.metadata or {})
+        metadata[SHELL_KEY] = shell_json.encode("utf-8")
+        arrow_table = arrow_table.replace_schema_metadata(metadata)
+
+        path = self.entry_path(key)
+        try:
+            with atomic_write(path) as staged:
+                pq.write_table(arrow_table, staged, compression="zstd")
+        except OSError as e:
+            _module_logger.info("could not write parse-cache entry %s (%s)", path, e)
+            return False
+        self.evict()
+        return True
+
+    def evict(self) -> list[Path]:
+        """Remove least recently used entries until the cache fits ``max_size``."""
+        if self.max_size is None:
+            return []
+        sized = []
+        for path in self.entries():
+            try:
+                sized.append((path, path.stat().st_size))
+            except OSError:
+                continue
+        total = sum(size for _, size in sized)
+        removed = []
+        for path, size in sized:
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed.append(path)
+        if removed:
+            _module_logger.debug("evicted %d parse-cache entries", len(removed))
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for path in self.entries():
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _data_shell(shell: dict, raw, source: PathLike) -> "ds.Data":
+        data = ds.Data()
+        cellpy_file_version = data.meta_common.cellpy_file_version
+        meta_archive.apply_meta_document(data, shell["meta"])
+        data.meta_common.cellpy_file_version = cellpy_file_version
+        if shell["start_datetime"] is not None:
+            start = externals.pandas.Timestamp(shell["start_datetime"])
+            data.meta_common.start_datetime = start
+        data.raw = cellpy_file_translate.raw_to_legacy(raw)
+        data.steps = externals.pandas.DataFrame()
+        data.summary = externals.pandas.DataFrame()
+        fids = []
+        for last_data_point in shell["last_data_point"]:
+            fid = ds.FileID(source)
+            fid.last_data_point = last_data_point
+            fids.append(fid)
+        data.raw_data_files = fids
+        data.raw_data_files_length = list(shell["raw_data_files_length"])
+        data.loaded_from = source
+        return data
@@ -0,0 +1,156 @@
+"""Cycle/step row-range index over the raw frame.
+
+Per-step selections (``_select_step``, ``sget_*``, ``get_cap``, ``get_ocv`` ...)
+used to build ``(raw[cycle] == c) & (raw[step] == s)`` masks over the whole raw
+frame for every (cycle, step) pair they touched, which is
+O(rows x cycles x steps) for a full ``get_cap``. The raw frame is stored in
+data-point order, so every (cycle, step) occupies one (or, for repeated steps,
+a few) contiguous *runs* of rows. ``RawIndex`` records those runs once, sorted
+on (cycle, step), and answers selections as positional slices.
+
+The index is owned by :class:`cellpy.readers.data_structures.Data` (see
+``Data.raw_index``): assigning ``Data.raw`` drops it, and a cheap fingerprint
+(frame identity, row count and the keys of the first and last run) catches
+most in-place edits of the key columns, so a stale index is rebuilt rather
+than trusted.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Indexer = Union[slice, np.ndarray]
+
+
+class RawIndex:
+    """Sorted (cycle, step) -> row-range index for one raw frame.
+
+    Args:
+        raw (pandas.DataFrame): the raw frame (in data-point order).
+        cycle_col (str): name of the cycle-number column.
+        step_col (str): name of the step-number column.
+    """
+
+    def __init__(self, raw, cycle_col: str, step_col: str):
+        self.cycle_col = cycle_col
+        self.step_col = step_col
+        self.n_rows = len(raw)
+        self._frame_id = id(raw)
+
+        cycles = raw[cycle_col].to_numpy()
+        steps = raw[step_col].to_numpy()
+
+        if self.n_rows == 0:
+            starts = np.zeros(0, dtype=np.int64)
+        else:
+            changed = (cycles[1:] != cycles[:-1]) | (steps[1:] != steps[:-1])
+            starts = np.concatenate(([0], np.flatnonzero(changed) + 1)).astype(np.int64)
+        stops = np.append(starts[1:], self.n_rows).astype(np.int64)
+
+        # run table in row order
+        self.starts = starts
+        self.stops = stops
+        self.run_cycles = cycles[starts]
+        self.run_steps = steps[starts]
+
+        # the same runs sorted on (cycle, step, start) for binary search
+        order = np.lexsort((starts, self.run_steps, self.run_cycles))
+        self._order = order
+        self._sorted_cycles = self.run_cycles[order]
+        self._sorted_steps = self.run_steps[order]
+
+        logger.debug(f"built raw index: {len(starts)} runs over {self.n_rows} rows")
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __repr__(self):
+        return f"<RawIndex runs={len(self)} rows={self.n_rows} ({self.cycle_col}, {self.step_col})>"
+
+    def is_current(self, raw, cycle_col: str, step_col: str) -> bool:
+        """Cheap check that the index still describes ``raw``."""
+        if (cycle_col, step_col) != (self.cycle_col, self.step_col):
+            return False
+        if id(raw) != self._frame_id or len(raw) != self.n_rows:
+            return False
+        if self.n_rows == 0:
+            return True
+        try:
+            c = raw[cycle_col]
+            s = raw[step_col]
+            return bool(
+                c.iat[0] == self.run_cycles[0]
+                and s.iat[0] == self.run_steps[0]
+                and c.iat[-1] == self.run_cycles[-1]
+                and s.iat[-1] == self.run_steps[-1]
+            )
+        except (KeyError, IndexError):
+            return False
+
+    def _cycle_bounds(self, cycle):
+        lo = np.searchsorted(self._sorted_cycles, cycle, side="left")
+        hi = np.searchsorted(self._sorted_cycles, cycle, side="right")
+        return lo, hi
+
+    def _runs_for_cycle(self, cycle, steps=None) -> np.ndarray:
+        lo, hi = self._cycle_bounds(cycle)
+        if lo == hi:
+            return np.zeros(0, dtype=np.int64)
+        if steps is None:
+            return self._order[lo:hi]
+        block = self._sorted_steps[lo:hi]
+        picked = []
+        for step in steps:
+            s_lo = np.searchsorted(block, step, side="left")
+            s_hi = np.searchsorted(block, step, side="right")
+            if s_lo < s_hi:
+                picked.append(self._order[lo + s_lo : lo + s_hi])
+        if not picked:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(picked)
+
+    def _indexer(self, runs: np.ndarray) -> Indexer:
+        """Positional indexer (in row order) covering the given runs."""
+        if len(runs) == 0:
+            return slice(0, 0)
+        runs = np.unique(runs)
+        if len(runs) == 1 or np.all(runs[1:] == runs[:-1] + 1):
+            return slice(int(self.starts[runs[0]]), int(self.stops[runs[-1]]))
+        return np.concatenate([np.arange(self.starts[r], self.stops[r]) for r in runs])
+
+    def rows(self, cycle, steps: Optional[Union[Iterable, int, float]] = None) -> Indexer:
+        """Rows for one cycle (optionally restricted to the given step number(s))."""
+        if steps is not None and np.isscalar(steps):
+            steps = [steps]
+        return self._indexer(self._runs_for_cycle(cycle, steps))
+
+    def rows_for_cycles(
+        self, cycles: Iterable, steps: Optional[Iterable] = None
+    ) -> Indexer:
+        """Rows whose cycle is in ``cycles`` (and step in ``steps`` if given).
+
+        Same row set, in the same order, as
+        ``raw[cycle].isin(cycles) & raw[step].isin(steps)``.
+        """
+        if steps is not None:
+            steps = list(steps)
+        runs = [self._runs_for_cycle(c, steps) for c in set(cycles)]
+        runs = [r for r in runs if len(r)]
+        if not runs:
+            return slice(0, 0)
+        return self._indexer(np.concatenate(runs))
+
+    def cycle_ranges(self) -> dict:
+        """``{cycle: (first_row, stop_row)}`` spanning each cycle's runs."""
+        ranges = {}
+        for c, start, stop in zip(self.run_cycles, self.starts, self.stops):
+            if c in ranges:
+                ranges[c] = (ranges[c][0], int(stop))
+            else:
+                ranges[c] = (int(start), int(stop))
+        return ranges
@@ -55,6 +55,7 @@ def _mod_raw_split_cycle(cell: "CellpyCell", data_point: int) -> None:
     c_cap, d_cap, c_energy, d_energy = initial_values[
         [hdr_c_cap, hdr_d_cap, hdr_c_energy, hdr_d_energy]
     ].values[0]
+    cell.data.invalidate_raw_index()
     cycle_mask = r[hdr_cycle] == cycle
     r.loc[cycle_mask, hdr_c_cap] = r.loc[cycle_mask, hdr_c_cap] - c_cap
     r.loc[cycle_mask, hdr_d_cap] = r.loc[cycle_mask, hdr_d_cap] - d_cap
@@ -214,7 +215,7 @@ def with_cycles(cell: "CellpyCell", cycles: Union[int, List[int]]) -> "CellpyCel
         summary = summary.reset_index(drop=False)
 
     new_steptable = steptable[steptable[h_step_cycle].isin(cycles)]
-    new_data = data[data[h_raw_index].isin(cycles)]
+    new_data = data.iloc[cell._raw_index().rows_for_cycles(cycles)]
     new_summary = summary[summary[h_summary_index].isin(cycles)]
 
     # Polars Phase A (#457): keys live in columns — no re-promotion.
@@ -89,6 +89,7 @@ EXPECTED_PRMS_INVENTORY: list[tuple[str, str, object]] = [
     ("CellInfo", "voltage_lim_low", 0.0),
     ("Reader", "auto_dirs", True),
     ("Reader", "capacity_interpolation_step", 2.0),
+    ("Reader", "compression_profile", None),
     ("Reader", "cycle_mode", "anode"),
     ("Reader", "diagnostics", False),
     ("Reader", "ensure_step_table", False),
@@ -99,7 +100,10 @@ EXPECTED_PRMS_INVENTORY: list[tuple[str, str, object]] = [
     ("Reader", "jupyter_executable", "jupyter"),
     ("Reader", "limit_loaded_cycles", None),
     ("Reader", "max_raw_files_to_merge", 20),
+    ("Reader", "parse_cache_dir", None),
+    ("Reader", "parse_cache_max_size", 2_000_000_000),
     ("Reader", "select_minimal", False),
+    ("Reader", "save_workers", None),
     ("Reader", "sep", ";"),
     ("Reader", "sorted_data", True),
     ("Reader", "time_interpolation_step", 10.0),
@@ -970,7 +970,7 @@ def test_persist_skips_rewrite_when_loaded_from_cellpy(tmp_path):
         def __init__(self):
             self.saved = False
 
-        def save(self, path, overwrite=True):
+        def save(self, path, overwrite=True, **kwargs):
             self.saved = True
             Path(path).write_bytes(b"rewritten")
 
@@ -1017,7 +1017,7 @@ def test_persist_rewrites_when_loaded_from_raw(tmp_path):
     batch.policy = LoadPolicy(source=SourcePreference.AUTO)
 
     class _Cell:
-        def save(self, path, overwrite=True):
+        def save(self, path, overwrite=True, **kwargs):
             Path(path).write_bytes(b"from-raw")
 
     cell = _Cell()
@@ -1037,6 +1037,49 @@ def test_persist_rewrites_when_loaded_from_raw(tmp_path):
     assert dest.read_bytes() == b"from-raw"
 
 
+def test_persist_after_recalc_skips_unchanged_cellpy_files(tmp_path, monkeypatch):
+    """recalc rewrites only the .cellpy files whose content digests changed."""
+    from pathlib import Path
+
+    import polars as pl
+
+    from cellpy.batch import Batch, LoadPolicy
+    from cellpy.batch import facade as facade_mod
+    from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
+    from tests.cellpy_file_support import load_cellpy_file
+
+    source = (
+        Path(__file__).resolve().parents[1]
+        / "testdata"
+        / "hdf5"
+        / "20160805_test001_45_cc_v8_with_fids.h5"
+    )
+    if not source.is_file():
+        pytest.skip(f"missing characterization fixture: {source}")
+    cell = load_cellpy_file(source)
+    batch = Batch.from_cells({"cell_a": cell}, policy=LoadPolicy(recalc=True))
+    dest = tmp_path / "cell_a.cellpy"
+    batch.journal.pages = batch.pages.with_columns(
+        pl.Series(hdr_journal["cellpy_file_name"], [str(dest)])
+    )
+    facade_mod._persist_cells(batch, tmp_path / "cellpy_batch_t.json")
+    assert dest.is_file()
+
+    writes = []
+    original_save = cellpy_file_v9.save
+    monkeypatch.setattr(
+        cellpy_file_v9,
+        "save",
+        lambda *args, **kwargs: writes.append(args) or original_save(*args, **kwargs),
+    )
+    facade_mod._persist_cells(batch, tmp_path / "cellpy_batch_t.json")
+    assert writes == []
+
+    cell.data.summary.iloc[0, 1] = cell.data.summary.iloc[0, 1] + 1
+    facade_mod._persist_cells(batch, tmp_path / "cellpy_batch_t.json")
+    assert len(writes) == 1
+
+
 def test_load_save_cellpy_writes_journal(parameters, batch_instance, tmp_path, monkeypatch):
     """save_cellpy=True writes journal JSON under journal_dir (cells may be empty)."""
     import polars as pl
@@ -1104,7 +1147,7 @@ def _stub_batch_with_cell(tmp_path, *, source="cellpy", dest=None):
     batch.policy = LoadPolicy(source=SourcePreference.AUTO)
 
     class _Cell:
-        def save(self, path, overwrite=True):
+        def save(self, path, overwrite=True, **kwargs):
             Path(path).parent.mkdir(parents=True, exist_ok=True)
             Path(path).write_bytes(b"exported")
 
@@ -279,7 +279,7 @@ def test_dispatch_lite_saves_raw_then_strips(tmp_path, monkeypatch):
     dest = tmp_path / "a.cellpy"
 
     class _Cell:
-        def save(self, path, overwrite=True):
+        def save(self, path, overwrite=True, **kwargs):
             Path(path).write_bytes(b"from-worker")
 
     monkeypatch.setattr("cellpy.batch.runner._cellpy_get", lambda **kwargs: _Cell())
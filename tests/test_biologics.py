@@ -30,3 +30,36 @@ def test_get_mpr(parameters):
 
     instrument = "biologics_mpr"
     cellpy.get(parameters.mpr_file_path, instrument=instrument)
+
+
+def test_mpr_module_headers_are_indexed_in_place(parameters):
+    import mmap
+
+    from cellpy.readers.instruments.biologics_mpr import _index_modules
+
+    with open(parameters.mpr_file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        modules = _index_modules(buffer)
+        size = len(buffer)
+
+    names = [m["shortname"].strip().decode() for m in modules]
+    assert {"VMP Set", "VMP data", "VMP LOG"} <= set(names)
+    assert all("data" not in m for m in modules)
+    assert modules[-1]["end"] == size
+
+
+def test_mpr_flags_are_unpacked_with_bit_masks():
+    import numpy as np
+
+    from cellpy.readers.instruments.biologics_mpr import _unpack_flags
+    from cellpy.readers.instruments.loader_specific_modules.biologic_file_format import bl_flags
+
+    flags = np.array([0b10100110, 0b00011001, 0], dtype=np.uint8)
+    unpacked = _unpack_flags(flags, dict(bl_flags[key] for key in (1, 2, 3, 21, 31, 65)))
+
+    assert unpacked["mode"].tolist() == [2, 1, 0]
+    assert unpacked["mode"].dtype == np.uint8
+    assert unpacked["ox_red"].tolist() == [1, 0, 0]
+    assert unpacked["error"].tolist() == [0, 1, 0]
+    assert unpacked["control_changes"].tolist() == [0, 1, 0]
+    assert unpacked["Ns_changes"].tolist() == [1, 0, 0]
+    assert unpacked["counter_inc"].tolist() == [1, 0, 0]
@@ -0,0 +1,106 @@
+"""Catalog index over a tree of cellpy-files (cellpy.catalog)."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from cellpy.catalog import Catalog
+from tests.cellpy_file_support import load_cellpy_file
+
+HDF5_DIR = Path(__file__).resolve().parents[1] / "testdata" / "hdf5"
+V8_WITH_FIDS = HDF5_DIR / "20160805_test001_45_cc_v8_with_fids.h5"
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    """A small tree with one v9 file, one v8 file and a file that is not a cellpy-file."""
+    if not V8_WITH_FIDS.is_file():
+        pytest.skip(f"missing characterization fixture: {V8_WITH_FIDS}")
+    root = tmp_path / "cells"
+    (root / "old").mkdir(parents=True)
+    cell = load_cellpy_file(V8_WITH_FIDS)
+    cell.save(root / "a.cellpy")
+    shutil.copy(V8_WITH_FIDS, root / "old" / "b.h5")
+    (root / "old" / "export.h5").write_text("not a cellpy-file")
+    return root, cell
+
+
+def test_refresh_builds_the_index(fleet, tmp_path):
+    root, cell = fleet
+    catalog = Catalog(tmp_path / "catalog")
+
+    report = catalog.refresh(root)
+
+    a, b = (root / "a.cellpy").resolve().as_posix(), (root / "old" / "b.h5").resolve().as_posix()
+    assert report.added == [a, b]
+    assert report.failed == [(root / "old" / "export.h5").resolve().as_posix()]
+
+    cells = catalog.cells.sort("path").collect()
+    assert cells["path"].to_list() == [a, b]
+    assert cells["cellpy_file_version"].to_list() == [9, 8]
+    assert cells["cycles"].to_list() == [len(cell.data.summary)] * 2
+    assert cells["mass"].to_list() == [cell.data.mass] * 2
+
+    summary = catalog.summary.filter(pl.col("path") == a).collect()
+    assert summary["cycle_num"].to_list() == cell.data.summary["cycle_num"].to_list()
+    assert catalog.fids.select(pl.col("path").unique().sort()).collect()["path"].to_list() == [a, b]
+
+
+def test_refresh_only_reads_changed_files(fleet, tmp_path, monkeypatch):
+    root, cell = fleet
+    catalog = Catalog(tmp_path / "catalog")
+    catalog.refresh(root)
+
+    from cellpy.catalog import index
+
+    read = []
+    original = index._index_file
+    monkeypatch.setattr(index, "_index_file", lambda path: read.append(path.name) or original(path))
+
+    report = catalog.refresh(root)
+    assert not report.changed
+    assert read == ["export.h5"]
+
+    cell.save(root / "c.cellpy")
+    os.remove(root / "old" / "b.h5")
+    read.clear()
+    report = catalog.refresh(root)
+
+    assert read == ["c.cellpy", "export.h5"]
+    assert [Path(p).name for p in report.added] == ["c.cellpy"]
+    assert [Path(p).name for p in report.removed] == ["b.h5"]
+    assert [Path(p).name for p in report.unchanged] == ["a.cellpy"]
+    paths = catalog.summary.select(pl.col("path").unique().sort()).collect()["path"]
+    assert [Path(p).name for p in paths] == ["a.cellpy", "c.cellpy"]
+
+
+@pytest.mark.parametrize("with_other_changes", [False, True])
+def test_refresh_keeps_the_rows_of_a_known_file_that_fails(fleet, tmp_path, with_other_changes):
+    root, cell = fleet
+    catalog = Catalog(tmp_path / "catalog")
+    catalog.refresh(root)
+    a = (root / "a.cellpy").resolve().as_posix()
+    before = catalog.summary.filter(pl.col("path") == a).collect()
+
+    (root / "a.cellpy").write_text("truncated by a crashed writer")
+    if with_other_changes:
+        cell.save(root / "c.cellpy")
+    report = catalog.refresh(root)
+
+    assert a in report.failed
+    assert report.changed is with_other_changes
+    assert catalog.cells.filter(pl.col("path") == a).collect().height == 1
+    assert catalog.summary.filter(pl.col("path") == a).collect().equals(before)
+    assert a in catalog.refresh(root).failed  # still retried, the stored mtime is the old one
+
+
+def test_scan_before_refresh_raises(tmp_path):
+    with pytest.raises(FileNotFoundError, match="refresh"):
+        Catalog(tmp_path).scan("summary")
+    with pytest.raises(ValueError, match="Unknown catalog table"):
+        Catalog(tmp_path).scan("raw")
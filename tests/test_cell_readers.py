@@ -832,6 +832,50 @@ def test_make_summary_exclude_step_types(rate_dataset):
     pd.testing.assert_frame_equal(base, base_again)
 
 
+def test_make_summary_create_copy_shares_raw(cell):
+    """create_copy=True copies steps/summary but not the raw frame (copy-on-write)."""
+    import numpy as np
+
+    col = cell.schema.raw.potential
+    summary_before = cell.data.summary.copy()
+
+    other = cell.make_summary(create_copy=True)
+
+    assert other is not cell
+    assert other.data is not cell.data
+    assert other.data.steps is not cell.data.steps
+    assert np.shares_memory(
+        other.data.raw[col].to_numpy(), cell.data.raw[col].to_numpy()
+    )
+
+    first_value = cell.data.raw[col].iloc[0]
+    other.data.raw.loc[other.data.raw.index[0], col] = first_value - 1.0
+    assert cell.data.raw[col].iloc[0] == first_value
+    assert cell.data.summary.equals(summary_before)
+
+
+@pytest.mark.parametrize("fraction", [0.3, 0.75])
+def test_make_summary_incremental_matches_full(cell, fraction):
+    import pandas as pd
+
+    full_raw = cell.data.raw
+    cell.make_step_table()
+    cell.make_summary(find_ir=True)
+    full_steps = cell.data.steps.copy()
+    full_summary = cell.data.summary.copy()
+
+    # process a truncated raw frame (cut in the middle of a cycle), then let
+    # the "new" data arrive and update incrementally
+    cell.data.raw = full_raw.iloc[: int(len(full_raw) * fraction)].copy()
+    cell.make_step_table()
+    cell.make_summary(find_ir=True)
+    cell.data.raw = full_raw
+    cell.make_summary(find_ir=True, incremental=True)
+
+    pd.testing.assert_frame_equal(cell.data.steps, full_steps)
+    pd.testing.assert_frame_equal(cell.data.summary, full_summary)
+
+
 @pytest.mark.essential
 def test_summary_from_cellpyfile(parameters):
     c_cellpy = cellpy.get(testing=True)
@@ -1138,6 +1182,47 @@ def test_get_arbin_res_mdbtools_short_cut(parameters):
     assert c.data.summary.shape == (18, 61)
 
 
+@pytest.mark.skipif(os.name != "posix", reason="fake mdb-export is a shell script")
+def test_arbin_res_export_tables_reads_mdb_export_stdout(tmp_path, monkeypatch):
+    """The tables are parsed from the stdout of mdb-export, no temp CSV files."""
+    import pyarrow as pa
+
+    from cellpy.readers.instruments import arbin_res
+
+    fake = tmp_path / "mdb-export"
+    fake.write_text(
+        "#!/bin/sh\n"
+        'case "$2" in\n'
+        "  Channel_Normal_Table) printf 'Test_ID,Data_Point,Cycle_Index,Current\\n"
+        "1,1,1,0\\n1,2,1,0.5\\n' ;;\n"
+        "  Global_Table) printf 'Test_ID,Comments\\n1,\"two\\nlines\"\\n' ;;\n"
+        "  Mixed_Table) printf 'x\\n1\\n2\\n2.5\\n' ;;\n"
+        "esac\n"
+    )
+    fake.chmod(0o755)
+    monkeypatch.setattr(arbin_res, "_sub_process_path", str(fake))
+    res_file = tmp_path / "cell.res"
+    res_file.write_bytes(b"")
+
+    loader = arbin_res.DataLoader()
+    tables = loader._export_tables(
+        ["Channel_Normal_Table", "Global_Table"],
+        res_file,
+        column_types=loader._normal_column_types(),
+    )
+
+    normal = tables["Channel_Normal_Table"]
+    assert list(normal["Data_Point"]) == [1, 2]
+    assert str(normal["Current"].dtype) == "float64"
+    assert str(normal["Cycle_Index"].dtype) == "int64"
+    assert tables["Global_Table"]["Comments"].iloc[0] == "two\nlines"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cell.res", "mdb-export"]
+
+    # a table pyarrow cannot read in one go falls back to pandas
+    mixed = arbin_res._export_table(res_file, "Mixed_Table", {"x": pa.int64()})
+    assert list(mixed["x"]) == [1.0, 2.0, 2.5]
+
+
 def test_get_empty():
     c_empty = cellpy.get(testing=True)
 
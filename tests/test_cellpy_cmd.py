@@ -568,6 +568,38 @@ def test_convert_cli_rejects_an_unknown_target(tmp_path):
     assert "unknown conversion target" in result.output
 
 
+def test_convert_cli_recursive(tmp_path):
+    """`cellpy convert -r DIR -j 2` converts the tree and writes a report."""
+    import json
+    import shutil
+    from pathlib import Path
+
+    source = (
+        Path(__file__).resolve().parents[1]
+        / "testdata"
+        / "hdf5"
+        / "20160805_test001_45_cc_v4.h5"
+    )
+    if not source.is_file():
+        pytest.skip(f"missing legacy fixture: {source}")
+
+    root = tmp_path / "archive"
+    (root / "sub").mkdir(parents=True)
+    shutil.copy(source, root / "one.h5")
+    shutil.copy(source, root / "sub" / "two.h5")
+
+    runner = CliRunner()
+    result = runner.invoke(cli.cli, ["convert", "--recursive", str(root), "-j", "2"])
+    assert result.exit_code == 0, result.output
+    assert (root / "one_v9.cellpy").is_file()
+    assert (root / "sub" / "two_v9.cellpy").is_file()
+    report = json.loads((root / "cellpy_convert_report.json").read_text())
+    assert report["converted"] == 2
+
+    result = runner.invoke(cli.cli, ["convert", str(root)])
+    assert result.exit_code == 2
+
+
 @pytest.mark.slowtest
 def test_cli_new_different_and_missing_default(tmp_path):
     logging.debug("\nSTARTING TEST")
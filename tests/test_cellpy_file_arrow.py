@@ -0,0 +1,97 @@
+"""Arrow IPC interchange for cells (cellpy_file.arrow)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from cellpy import cellreader
+from cellpy.exceptions import CorruptCellpyFile
+from cellpy.readers.cellpy_file import arrow as cellpy_file_arrow
+from tests.cellpy_file_support import (
+    assert_data_frames_equal,
+    assert_fid_lists_equal,
+    assert_meta_equal,
+    load_cellpy_file,
+    snapshot_cell_state,
+)
+
+HDF5_DIR = Path(__file__).resolve().parents[1] / "testdata" / "hdf5"
+V8_WITH_FIDS = HDF5_DIR / "20160805_test001_45_cc_v8_with_fids.h5"
+
+
+@pytest.fixture
+def cell():
+    if not V8_WITH_FIDS.is_file():
+        pytest.skip(f"missing characterization fixture: {V8_WITH_FIDS}")
+    return load_cellpy_file(V8_WITH_FIDS)
+
+
+def _assert_same_cell(reloaded, cell, expected):
+    assert_data_frames_equal(reloaded.data.raw, expected["raw"])
+    assert_data_frames_equal(reloaded.data.steps, expected["steps"])
+    assert_data_frames_equal(reloaded.data.summary, expected["summary"])
+    cell.data.meta_common.cellpy_file_version = reloaded.data.meta_common.cellpy_file_version
+    assert_meta_equal(cell, reloaded)
+    assert_fid_lists_equal(cell, reloaded)
+
+
+def test_to_arrow_tables_carry_the_meta_document(cell):
+    tables = cell.to_arrow()
+
+    assert set(tables) == {"raw", "steps", "summary", "fid"}
+    for name, table in tables.items():
+        assert isinstance(table, pa.Table)
+        assert table.schema.metadata[cellpy_file_arrow.TABLE_KEY] == name.encode()
+        meta_doc = json.loads(table.schema.metadata[cellpy_file_arrow.META_KEY])
+        assert meta_doc["cellpy_file_version"] == 9
+    assert cell.schema.raw.cycle_num in tables["raw"].column_names
+    assert tables["raw"].num_rows == len(cell.data.raw)
+
+
+def test_from_arrow_roundtrip(cell):
+    expected = snapshot_cell_state(cell)
+    reloaded = cellreader.CellpyCell.from_arrow(cell.to_arrow())
+
+    _assert_same_cell(reloaded, cell, expected)
+
+
+def test_save_and_load_arrow_directory(tmp_path, cell):
+    expected = snapshot_cell_state(cell)
+    outdir = tmp_path / "cell_arrow"
+    cell.save(outdir, cellpy_file_format="arrow")
+
+    assert cellpy_file_arrow.is_arrow(outdir)
+    for table in ("raw", "steps", "summary", "fid"):
+        assert (outdir / f"{table}.arrow").is_file()
+
+    _assert_same_cell(load_cellpy_file(outdir), cell, expected)
+
+    # other readers see the same tables
+    raw = pl.read_ipc(outdir / "raw.arrow")
+    assert raw.height == len(cell.data.raw)
+
+
+def test_load_arrow_directory_with_selector_and_columns(tmp_path, cell):
+    outdir = tmp_path / "cell_arrow"
+    cell.save(outdir, cellpy_file_format="arrow")
+    hn, hs = cell.schema.raw, cell.schema.summary
+
+    selected = load_cellpy_file(outdir, selector={"cycles": range(2, 4)}, columns=[hn.potential])
+
+    assert sorted(selected.data.summary[hs.cycle_num]) == [2, 3]
+    assert set(selected.data.raw[hn.cycle_num]) == {2, 3}
+    assert hn.potential in selected.data.raw.columns
+    assert hn.current not in selected.data.raw.columns
+
+
+def test_from_arrow_needs_the_meta_document(cell):
+    tables = cell.to_arrow()
+    tables["summary"] = tables["summary"].replace_schema_metadata(None)
+
+    with pytest.raises(CorruptCellpyFile):
+        cellreader.CellpyCell.from_arrow(tables)
@@ -0,0 +1,120 @@
+"""Partitioned parquet dataset store for many cells (cellpy_file.dataset)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from cellpy.readers.cellpy_file import dataset as cellpy_file_dataset
+from cellpy.readers.cellpy_file import read as cellpy_file_read
+from tests.cellpy_file_support import (
+    assert_data_frames_equal,
+    assert_fid_lists_equal,
+    assert_meta_equal,
+    load_cellpy_file,
+    snapshot_cell_state,
+)
+
+HDF5_DIR = Path(__file__).resolve().parents[1] / "testdata" / "hdf5"
+V8_WITH_FIDS = HDF5_DIR / "20160805_test001_45_cc_v8_with_fids.h5"
+
+
+@pytest.fixture
+def cell():
+    if not V8_WITH_FIDS.is_file():
+        pytest.skip(f"missing characterization fixture: {V8_WITH_FIDS}")
+    return load_cellpy_file(V8_WITH_FIDS)
+
+
+@pytest.fixture
+def store(tmp_path, cell):
+    root = tmp_path / "store"
+    cell.save(root, cellpy_file_format="dataset", label="a")
+    cell.save(root, cellpy_file_format="dataset", label="b")
+    return root
+
+
+def test_save_writes_hive_partitions(store, cell):
+    assert cellpy_file_dataset.is_dataset(store)
+    assert cellpy_file_dataset.labels(store) == ["a", "b"]
+    for table in ("raw", "steps", "summary", "fid"):
+        assert (store / f"table={table}" / "cell=a" / "part-0.parquet").is_file()
+    assert (store / "meta" / "a.meta.json").is_file()
+
+    # an existing store is recognised without passing the format again
+    cell.save(store, label="c")
+    assert cellpy_file_dataset.labels(store) == ["a", "b", "c"]
+
+
+def test_load_cell_from_store(store, cell):
+    expected = snapshot_cell_state(cell)
+    reloaded = load_cellpy_file(store, label="b")
+
+    assert_data_frames_equal(reloaded.data.raw, expected["raw"])
+    assert_data_frames_equal(reloaded.data.steps, expected["steps"])
+    assert_data_frames_equal(reloaded.data.summary, expected["summary"])
+    cell.data.meta_common.cellpy_file_version = reloaded.data.meta_common.cellpy_file_version
+    assert_meta_equal(cell, reloaded)
+    assert_fid_lists_equal(cell, reloaded)
+
+    import cellpy
+
+    via_get = cellpy.get(store, label="a")
+    assert_data_frames_equal(via_get.data.summary, expected["summary"])
+
+    with pytest.raises(ValueError, match="2 cells"):
+        cellpy_file_read.load(store)
+    with pytest.raises(IOError):
+        cellpy_file_read.load(store, label="missing")
+
+
+def test_load_from_store_with_selector_and_deferred_raw(store):
+    from_store = cellpy_file_read.load(store, label="a", selector={"max_cycle": 3})
+    from_v8 = cellpy_file_read.load(V8_WITH_FIDS, selector={"max_cycle": 3})
+    assert from_store.limit_data_points == from_v8.limit_data_points
+    assert_data_frames_equal(from_store.data.raw, from_v8.data.raw)
+
+    partial = load_cellpy_file(store, label="a", tables=("summary",))
+    assert "raw" in partial.data.deferred_tables
+    full = load_cellpy_file(store, label="a")
+    assert_data_frames_equal(partial.data.raw, full.data.raw)
+
+
+def test_scan_queries_across_cells(store, cell):
+    summary = cellpy_file_dataset.scan(store, "summary")
+    counts = summary.group_by("cell").agg(pl.len().alias("n")).sort("cell").collect()
+    assert counts["cell"].to_list() == ["a", "b"]
+    assert counts["n"].to_list() == [len(cell.data.summary)] * 2
+
+    raw = cellpy_file_dataset.scan(store, "raw", cells=["b"])
+    late = raw.filter(pl.col("cycle_num") > 2).select("cell", "cycle_num").collect()
+    assert set(late["cell"]) == {"b"}
+    assert late["cycle_num"].min() == 3
+
+
+def test_remove_and_bad_labels(store):
+    cellpy_file_dataset.remove(store, "a")
+    assert cellpy_file_dataset.labels(store) == ["b"]
+    assert not (store / "table=raw" / "cell=a").exists()
+    assert cellpy_file_read.load(store).data.loaded_from.endswith("b")
+    with pytest.raises(ValueError):
+        cellpy_file_dataset.meta_path(store, "x=1")
+
+
+def test_batch_export_dataset(tmp_path, cell):
+    from cellpy.batch import Batch
+    from cellpy.batch.journal import FILENAME, Journal
+
+    pages = pl.DataFrame({FILENAME: ["cell_a", "cell_b"], "group": [1, 2]})
+    batch = Batch(Journal(name="t", project="p", pages=pages))
+    batch._store = batch.cells.__class__.from_cells({"cell_a": cell, "cell_b": cell})
+
+    root = batch.export_dataset(tmp_path / "store")
+
+    assert cellpy_file_dataset.labels(root) == ["cell_a", "cell_b"]
+    last = (
+        cellpy_file_dataset.scan(root, "summary").group_by("cell").agg(pl.col("cycle_num").max()).sort("cell").collect()
+    )
+    assert last["cycle_num"].to_list() == [cell.data.summary["cycle_num"].max()] * 2
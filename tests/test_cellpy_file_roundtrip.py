@@ -126,6 +126,250 @@ def test_v8_load_selector_max_cycle_truncates_consistently():
     assert len(selected.data.steps) < len(full.data.steps)
 
 
+@pytest.mark.parametrize("file_format", ["v8", "v9"])
+def test_load_selector_cycle_window(tmp_path, file_format):
+    """``selector={'cycles': range(a, b)}`` reads exactly the rows of that window."""
+    source = _require_v8_with_fids()
+    if file_format == "v9":
+        outfile = tmp_path / "window.cellpy"
+        load_cellpy_file(source).save(outfile)
+        source = outfile
+
+    full = load_cellpy_file(source)
+    selected = load_cellpy_file(source, selector={"cycles": range(3, 6)})
+
+    hn, hs = full.schema.raw, full.schema.summary
+    assert selected.limit_loaded_cycles == 5
+    assert sorted(selected.data.summary[hs.cycle_num]) == [3, 4, 5]
+
+    in_window = full.data.raw[hn.cycle_num].between(3, 5)
+    assert_data_frames_equal(
+        selected.data.raw, full.data.raw.loc[in_window].reset_index(drop=True)
+    )
+    hst = full.schema.steps
+    assert set(selected.data.steps[hst.cycle_num]) == {3, 4, 5}
+    assert len(selected.data.steps) == full.data.steps[hst.cycle_num].between(3, 5).sum()
+
+
+@pytest.mark.parametrize("file_format", ["v8", "v9"])
+@pytest.mark.parametrize(
+    "selector", [{"min_cycle": 1000}, {"cycles": range(1000, 1005)}]
+)
+def test_load_selector_window_after_the_last_cycle(tmp_path, file_format, selector):
+    """A window past the stored cycles loads empty tables with the stored columns."""
+    source = _require_v8_with_fids()
+    if file_format == "v9":
+        outfile = tmp_path / "window.cellpy"
+        load_cellpy_file(source).save(outfile)
+        source = outfile
+
+    full = load_cellpy_file(source)
+    selected = load_cellpy_file(source, selector=selector)
+
+    assert selected.limit_data_points is None
+    for table in ("summary", "raw", "steps"):
+        frame = getattr(selected.data, table)
+        assert frame.empty
+        assert list(frame.columns) == list(getattr(full.data, table).columns)
+
+
+def test_v8_first_data_point_comes_from_the_summary():
+    """The v8 raw read starts one past the last data point of the preceding cycle."""
+    source = _require_v8_with_fids()
+    full = load_cellpy_file(source)
+    hs = full.schema.summary
+    end_of_cycle_2 = full.data.summary.loc[
+        full.data.summary[hs.cycle_num] == 2, hs.datapoint_num_last
+    ].iloc[0]
+
+    with pd.HDFStore(source, mode="r") as store:
+        first = cellpy_file_read._first_data_point(
+            store, prms._cellpyfile_root + prms._cellpyfile_summary, 3
+        )
+        assert first == end_of_cycle_2 + 1
+        assert (
+            cellpy_file_read._first_data_point(
+                store, prms._cellpyfile_root + prms._cellpyfile_summary, 1
+            )
+            is None
+        )
+
+
+@pytest.mark.parametrize("file_format", ["v8", "v9"])
+def test_load_columns_projects_raw(tmp_path, file_format):
+    """``columns=`` reads only the requested raw columns plus the key columns."""
+    source = _require_v8_with_fids()
+    if file_format == "v9":
+        outfile = tmp_path / "projected.cellpy"
+        load_cellpy_file(source).save(outfile)
+        source = outfile
+
+    full = load_cellpy_file(source)
+    hn = full.schema.raw
+    # one native and one legacy spelling, plus a column the file does not have
+    projected = load_cellpy_file(
+        source, columns=[hn.potential, "current", "no_such_column"]
+    )
+
+    keys = [hn.test_id, hn.datapoint_num, hn.cycle_num, hn.step_num]
+    expected = full.data.raw[
+        [c for c in full.data.raw.columns if c in {*keys, hn.potential, hn.current}]
+    ]
+    assert_data_frames_equal(projected.data.raw, expected)
+    assert_data_frames_equal(projected.data.summary, full.data.summary)
+
+
+@pytest.mark.parametrize("file_format", ["v8", "v9"])
+def test_a_projected_load_is_not_saved_by_accident(tmp_path, file_format):
+    """Saving a ``columns=`` load needs ``partial=True`` (it drops raw columns)."""
+    from cellpy.readers.cellpy_file import v9 as cellpy_file_v9
+
+    source = _require_v8_with_fids()
+    if file_format == "v9":
+        outfile = tmp_path / "projected.cellpy"
+        load_cellpy_file(source).save(outfile)
+        source = outfile
+    full_columns = list(load_cellpy_file(source).data.raw.columns)
+
+    projected = load_cellpy_file(source, columns=["potential"])
+    assert projected.data.loaded_columns == ("potential",)
+    target = tmp_path / "copy.cellpy"
+    with pytest.raises(ValueError, match="partial=True"):
+        projected.save(target)
+    with pytest.raises(ValueError, match="partial=True"):
+        cellpy_file_v9.save(projected.data, target)
+    if file_format == "v9":
+        before = source.read_bytes()
+        with pytest.raises(ValueError, match="partial=True"):
+            cellpy_file_v9.append(projected.data, source)
+        assert source.read_bytes() == before
+    assert not target.exists()
+
+    projected.save(target, partial=True)
+    saved = load_cellpy_file(target)
+    assert list(saved.data.raw.columns) == list(projected.data.raw.columns)
+    assert len(saved.data.raw.columns) < len(full_columns)
+    assert saved.data.loaded_columns is None
+
+
+@pytest.mark.parametrize("file_format", ["v8", "v9"])
+def test_load_summary_only_defers_raw_and_steps(tmp_path, file_format):
+    """``tables=("summary",)`` skips raw/steps and reads them on first access."""
+    source = _require_v8_with_fids()
+    if file_format == "v9":
+        outfile = tmp_path / "summary_only.cellpy"
+        load_cellpy_file(source).save(outfile)
+        source = outfile
+
+    full = load_cellpy_file(source, selector={"max_cycle": 3})
+    lazy = load_cellpy_file(source, selector={"max_cycle": 3}, tables=("summary",))
+
+    assert lazy.data.deferred_tables == ("raw", "steps")
+    assert lazy.data.has_data and lazy.data.has_steps
+    assert_data_frames_equal(lazy.data.summary, full.data.summary)
+    assert lazy.limit_data_points == full.limit_data_points
+
+    assert_data_frames_equal(lazy.data.steps, full.data.steps)
+    assert lazy.data.deferred_tables == ("raw",)
+    assert_data_frames_equal(lazy.data.raw, full.data.raw)
+    assert lazy.data.deferred_tables == ()
+
+
+@pytest.mark.parametrize("file_format", ["v8", "v9"])
+def test_deferred_raw_is_read_per_cycle(tmp_path, file_format):
+    """Per-cycle getters on a summary-only load read just the requested cycles."""
+    source = _require_v8_with_fids()
+    if file_format == "v9":
+        outfile = tmp_path / "per_cycle.cellpy"
+        load_cellpy_file(source).save(outfile)
+        source = outfile
+
+    full = load_cellpy_file(source)
+    lazy = load_cellpy_file(source, tables=("summary", "steps"))
+    windows = []
+    loader = lazy.data._deferred_tables["raw"]
+    lazy.data.defer("raw", _RecordingLoader(loader, windows))
+
+    step = int(full.data.steps[full.schema.steps.step_num].iloc[0])
+    # row labels are the ones of the full table
+    pd.testing.assert_frame_equal(
+        lazy.get_cap(cycle=[2, 3]), full.get_cap(cycle=[2, 3])
+    )
+    pd.testing.assert_frame_equal(lazy.get_voltage(cycle=2), full.get_voltage(cycle=2))
+    pd.testing.assert_series_equal(
+        lazy.sget_voltage(1, step), full.sget_voltage(1, step)
+    )
+    pd.testing.assert_frame_equal(lazy.get_dcap(cycle=3), full.get_dcap(cycle=3))
+    pd.testing.assert_frame_equal(
+        lazy.get_ccap(4, as_frame=True), full.get_ccap(4, as_frame=True)
+    )
+    pd.testing.assert_frame_equal(
+        lazy.get_ocv(cycles=[5], direction="both"),
+        full.get_ocv(cycles=[5], direction="both"),
+    )
+    assert list(lazy.get_cycle_numbers()) == list(full.get_cycle_numbers())
+
+    assert windows == [[2, 3], [2], [1], [3], [4], [5]]
+    assert lazy.data.deferred_tables == ("raw",)
+    assert lazy.data.raw.empty is False
+    assert lazy.data.deferred_tables == ()
+
+
+@pytest.mark.parametrize("file_format", ["v8", "v9"])
+def test_deferred_raw_is_not_re_read_for_the_same_cycles(tmp_path, file_format):
+    """Repeated windows come from memory; a full read ends the deferral."""
+    source = _require_v8_with_fids()
+    if file_format == "v9":
+        outfile = tmp_path / "repeated.cellpy"
+        load_cellpy_file(source).save(outfile)
+        source = outfile
+
+    full = load_cellpy_file(source)
+    lazy = load_cellpy_file(source, tables=("summary", "steps"))
+    windows = []
+    loader = lazy.data._deferred_tables["raw"]
+    lazy.data.defer("raw", _RecordingLoader(loader, windows))
+
+    step = int(full.data.steps[full.schema.steps.step_num].iloc[0])
+    for _ in range(2):
+        pd.testing.assert_series_equal(
+            lazy.sget_voltage(2, step), full.sget_voltage(2, step)
+        )
+        pd.testing.assert_series_equal(
+            lazy.sget_current(2, step), full.sget_current(2, step)
+        )
+        lazy.get_voltage(cycle=3)
+    assert windows == [[2], [3]]
+    assert lazy.data.deferred_tables == ("raw",)
+
+    for _ in range(2):
+        pd.testing.assert_frame_equal(
+            lazy.get_cap(),
+            full.get_cap(),
+        )
+    assert windows == [[2], [3], None]
+    assert lazy.data.deferred_tables == ()
+
+
+class _RecordingLoader:
+    def __init__(self, loader, windows):
+        self.loader = loader
+        self.windows = windows
+
+    def __call__(self):
+        self.windows.append(None)
+        return self.loader()
+
+    def for_cycles(self, cycles=None):
+        self.windows.append(sorted(int(c) for c in cycles))
+        return self.loader.for_cycles(cycles)
+
+
+def test_load_rejects_unknown_tables():
+    with pytest.raises(ValueError, match="Unknown cellpy-file table"):
+        load_cellpy_file(_require_v8_with_fids(), tables=("summary", "fid"))
+
+
 @pytest.mark.parametrize("label,filename,version", LEGACY_SUCCESS)
 def test_legacy_v4_v7_load_shapes_and_columns(label, filename, version):
     """Legacy v4–v7: load succeeds with expected shapes and renamed columns."""
@@ -14,6 +14,7 @@ from cellpycore.metadata.models import TestMeta
 
 from cellpy.exceptions import CorruptCellpyFile
 from cellpy.readers.cellpy_file import CELLPY_FILE_VERSION, v9 as cellpy_file_v9
+from cellpy.readers.cellpy_file import read as cellpy_file_read
 from cellpy.readers.cellpy_file.format import (
     META_JSON_NAME,
     V9_RAW_PARQUET,
@@ -145,6 +146,62 @@ def test_v9_parquet_members_use_zstd(tmp_path):
             assert _parquet_codec(zf.read(name)) == "ZSTD", name
 
 
+def _float_encodings(data: bytes) -> set:
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(io.BytesIO(data))
+    schema = pf.schema_arrow
+    row_group = pf.metadata.row_group(0)
+    return {
+        encoding
+        for i in range(row_group.num_columns)
+        if str(schema.field(row_group.column(i).path_in_schema).type).startswith("double")
+        for encoding in row_group.column(i).encodings
+    }
+
+
+@pytest.mark.parametrize(
+    "profile, codec",
+    [("fast", "LZ4"), ("balanced", "ZSTD"), ("archive", "ZSTD"), ("none", "UNCOMPRESSED")],
+)
+def test_v9_compression_profiles_roundtrip(tmp_path, profile, codec):
+    """Every compression profile writes its codec and reads back the same tables."""
+    original = load_cellpy_file(_require_v8_with_fids())
+    expected = snapshot_cell_state(original)
+
+    outfile = tmp_path / f"{profile}.cellpy"
+    original.save(outfile, compression=profile)
+
+    with zipfile.ZipFile(outfile) as zf:
+        for name in (V9_RAW_PARQUET, V9_STEPS_PARQUET, V9_SUMMARY_PARQUET):
+            assert _parquet_codec(zf.read(name)) == codec, name
+        float_encodings = _float_encodings(zf.read(V9_RAW_PARQUET))
+    assert ("BYTE_STREAM_SPLIT" in float_encodings) == (profile == "archive")
+
+    reloaded = load_cellpy_file(outfile)
+    assert_data_frames_equal(reloaded.data.raw, expected["raw"])
+    assert_data_frames_equal(reloaded.data.steps, expected["steps"])
+    assert_data_frames_equal(reloaded.data.summary, expected["summary"])
+
+
+def test_v9_compression_profile_from_config(tmp_path, monkeypatch):
+    import cellpy.config as config
+    from cellpy.readers.cellpy_file import compression
+
+    original = load_cellpy_file(_require_v8_with_fids())
+    monkeypatch.setattr(config.reader, "compression_profile", "fast")
+    assert compression.get_profile().name == "fast"
+
+    outfile = tmp_path / "configured.cellpy"
+    cellpy_file_v9.save(original.data, outfile)
+    with zipfile.ZipFile(outfile) as zf:
+        assert _parquet_codec(zf.read(V9_SUMMARY_PARQUET)) == "LZ4"
+
+    with pytest.raises(ValueError, match="Unknown compression profile"):
+        cellpy_file_v9.save(original.data, tmp_path / "bad.cellpy", compression="gzip9")
+    assert not (tmp_path / "bad.cellpy").exists()
+
+
 @pytest.mark.essential
 def test_v9_loads_snappy_parquet_members(tmp_path):
     """Pre-#912 snappy parquet members still load."""
@@ -216,11 +273,11 @@ def _break_summary_write(monkeypatch, boom: Exception) -> None:
     real = cellpy_file_v9._frame_to_parquet_bytes
     seen = {"n": 0}
 
-    def failing(frame):
+    def failing(frame, **kwargs):
         seen["n"] += 1
         if seen["n"] == 3:  # raw, steps, then summary
             raise boom
-        return real(frame)
+        return real(frame, **kwargs)
 
     monkeypatch.setattr(cellpy_file_v9, "_frame_to_parquet_bytes", failing)
 
@@ -310,3 +367,296 @@ def test_failed_hdf5_resave_keeps_the_old_file(tmp_path, monkeypatch):
 
     assert outfile.read_bytes() == good_bytes
     assert not _staged_leftovers(tmp_path)
+
+
+def test_v9_max_cycle_selector_matches_v8(tmp_path):
+    """max_cycle is pushed down to the parquet reads and trims like v8 does."""
+    source = _require_v8_with_fids()
+    outfile = tmp_path / "selected.cellpy"
+    load_cellpy_file(source).save(outfile)
+
+    selector = {"max_cycle": 3}
+    from_v8 = cellpy_file_read.load(source, selector=selector)
+    from_v9 = cellpy_file_v9.load(outfile, selector=selector)
+
+    assert from_v9.limit_loaded_cycles == from_v8.limit_loaded_cycles == 3
+    assert from_v9.limit_data_points == from_v8.limit_data_points
+    assert_data_frames_equal(from_v9.data.raw, from_v8.data.raw)
+    full = cellpy_file_v9.load(outfile).data
+    steps = full.steps[full.steps["cycle"] <= 3].reset_index(drop=True)
+    assert_data_frames_equal(from_v9.data.steps.reset_index(drop=True), steps)
+    summary = full.summary[full.summary["cycle_index"] <= 3]
+    assert_data_frames_equal(from_v9.data.summary, summary)
+
+
+def test_v9_cycle_window_selector(tmp_path):
+    source = _require_v8_with_fids()
+    outfile = tmp_path / "window.cellpy"
+    load_cellpy_file(source).save(outfile)
+
+    result = cellpy_file_v9.load(outfile, selector={"min_cycle": 2, "max_cycle": 4})
+    data = result.data
+
+    assert sorted(data.raw["cycle_index"].unique()) == [2, 3, 4]
+    assert sorted(data.steps["cycle"].unique()) == [2, 3, 4]
+    assert sorted(data.summary["cycle_index"]) == [2, 3, 4]
+
+
+def test_v9_raw_row_groups_are_cycle_aligned(tmp_path):
+    import pyarrow.parquet as pq
+
+    source = _require_v8_with_fids()
+    cell = load_cellpy_file(source)
+    outfile = tmp_path / "aligned.cellpy"
+    cellpy_file_v9.save(cell.data, outfile, raw_row_group_rows=1000)
+
+    with zipfile.ZipFile(outfile) as zf:
+        meta_doc = json.loads(zf.read(META_JSON_NAME).decode("utf-8"))
+        parquet = pq.ParquetFile(io.BytesIO(zf.read(V9_RAW_PARQUET)))
+    row_group_map = meta_doc[cellpy_file_v9.RAW_ROW_GROUPS_KEY]
+    groups = row_group_map["groups"]
+    assert parquet.num_row_groups == len(groups) > 1
+
+    column = parquet.schema_arrow.get_field_index(row_group_map["cycle_column"])
+    previous_last = None
+    for group in groups:
+        stats = parquet.metadata.row_group(group["row_group"]).column(column).statistics
+        assert (stats.min, stats.max) == (group["first_cycle"], group["last_cycle"])
+        if previous_last is not None:
+            assert group["first_cycle"] > previous_last
+        previous_last = group["last_cycle"]
+
+    full = cellpy_file_v9.load(outfile).data
+    window = cellpy_file_v9.load(outfile, selector={"min_cycle": 3, "max_cycle": 7})
+    cycles = full.raw["cycle_index"]
+    expected = full.raw[(cycles >= 3) & (cycles <= 7)].reset_index(drop=True)
+    assert_data_frames_equal(window.data.raw.reset_index(drop=True), expected)
+
+
+def test_v9_save_without_row_group_map(tmp_path):
+    source = _require_v8_with_fids()
+    outfile = tmp_path / "default.cellpy"
+    cellpy_file_v9.save(load_cellpy_file(source).data, outfile, raw_row_group_rows=None)
+
+    meta_doc = cellpy_file_v9.read_meta(outfile)
+    assert cellpy_file_v9.RAW_ROW_GROUPS_KEY not in meta_doc
+    result = cellpy_file_v9.load(outfile, selector={"max_cycle": 2})
+    assert set(result.data.raw["cycle_index"]) == {1, 2}
+
+
+def test_v9_stored_members_are_memory_mapped(tmp_path):
+    import pyarrow as pa
+
+    source = _require_v8_with_fids()
+    outfile = tmp_path / "mapped.cellpy"
+    load_cellpy_file(source).save(outfile)
+
+    with zipfile.ZipFile(outfile) as zf:
+        with cellpy_file_v9._open_member(zf, V9_RAW_PARQUET) as member:
+            assert isinstance(member, pa.BufferReader)
+            assert member.read() == zf.read(V9_RAW_PARQUET)
+
+
+def test_v9_load_deflated_members(tmp_path):
+    """Archives with compressed parquet members fall back to the zip handle."""
+    source = _require_v8_with_fids()
+    outfile = tmp_path / "stored.cellpy"
+    load_cellpy_file(source).save(outfile)
+    deflated = tmp_path / "deflated.cellpy"
+    with zipfile.ZipFile(outfile) as zin, zipfile.ZipFile(
+        deflated, "w", compression=zipfile.ZIP_DEFLATED
+    ) as zout:
+        for name in zin.namelist():
+            zout.writestr(name, zin.read(name))
+
+    expected = cellpy_file_v9.load(outfile, selector={"max_cycle": 4}).data
+    reloaded = cellpy_file_v9.load(deflated, selector={"max_cycle": 4}).data
+
+    assert_data_frames_equal(reloaded.raw, expected.raw)
+    assert_data_frames_equal(reloaded.steps, expected.steps)
+    assert_data_frames_equal(reloaded.summary, expected.summary)
+
+
+def test_v9_threaded_save_matches_serial(tmp_path):
+    source = _require_v8_with_fids()
+    data = load_cellpy_file(source).data
+    serial = tmp_path / "serial.cellpy"
+    threaded = tmp_path / "threaded.cellpy"
+    cellpy_file_v9.save(data, serial, workers=1)
+    cellpy_file_v9.save(data, threaded, workers=4)
+
+    with zipfile.ZipFile(serial) as zs, zipfile.ZipFile(threaded) as zt:
+        assert zs.namelist() == zt.namelist()
+        for name in zs.namelist():
+            if name != META_JSON_NAME:
+                assert zs.read(name) == zt.read(name), name
+
+
+def test_v9_unsorted_raw_is_streamed_in_fixed_chunks(tmp_path):
+    import pyarrow.parquet as pq
+
+    source = _require_v8_with_fids()
+    data = load_cellpy_file(source).data
+    data.raw = data.raw.iloc[::-1].reset_index(drop=True)
+    outfile = tmp_path / "unsorted.cellpy"
+    cellpy_file_v9.save(data, outfile, raw_row_group_rows=4000)
+
+    with zipfile.ZipFile(outfile) as zf:
+        meta_doc = json.loads(zf.read(META_JSON_NAME).decode("utf-8"))
+        parquet = pq.ParquetFile(io.BytesIO(zf.read(V9_RAW_PARQUET)))
+    assert cellpy_file_v9.RAW_ROW_GROUPS_KEY not in meta_doc
+    assert parquet.num_row_groups == -(-len(data.raw) // 4000)
+
+    reloaded = load_cellpy_file(outfile)
+    assert_data_frames_equal(reloaded.data.raw, data.raw)
+
+
+# --- append-only saves ------------------------------------------------------
+
+
+def _growing_cell(tmp_path, last_cycle):
+    """The v8 fixture saved with raw cut after ``last_cycle``, plus the full cell."""
+    full = load_cellpy_file(_require_v8_with_fids())
+    cell = load_cellpy_file(_require_v8_with_fids())
+    cycles = full.data.raw[full.schema.raw.cycle_num]
+    cell.data.raw = full.data.raw[cycles <= last_cycle].reset_index(drop=True)
+    outfile = tmp_path / "growing.cellpy"
+    cell.save(outfile)
+    return cell, full, outfile
+
+
+def test_v9_append_adds_raw_parts(tmp_path):
+    cell, full, outfile = _growing_cell(tmp_path, last_cycle=8)
+    cycles = full.data.raw[full.schema.raw.cycle_num]
+
+    cell.data.raw = full.data.raw[cycles <= 12].reset_index(drop=True)
+    assert cellpy_file_v9.append(cell.data, outfile)
+    cell.data.raw = full.data.raw
+    cell.data.summary = cell.data.summary.iloc[:-1]
+    assert cellpy_file_v9.append(cell.data, outfile)
+
+    with zipfile.ZipFile(outfile) as zf:
+        names = zf.namelist()
+        assert zf.testzip() is None
+    assert len(names) == len(set(names))
+    assert "raw_part_0001.parquet" in names and "raw_part_0002.parquet" in names
+
+    reloaded = load_cellpy_file(outfile)
+    assert_data_frames_equal(reloaded.data.raw, full.data.raw)
+    assert_data_frames_equal(reloaded.data.summary, cell.data.summary)
+
+    window = load_cellpy_file(outfile, selector={"min_cycle": 7, "max_cycle": 10})
+    raw_cycles = window.data.raw[window.schema.raw.cycle_num]
+    assert sorted(raw_cycles.unique()) == [7, 8, 9, 10]
+
+
+def test_v9_append_refuses_a_file_that_is_not_a_prefix(tmp_path):
+    cell, full, outfile = _growing_cell(tmp_path, last_cycle=8)
+    before = outfile.read_bytes()
+
+    cell.data.raw = cell.data.raw.iloc[:100]
+    assert not cellpy_file_v9.append(cell.data, outfile)
+    assert outfile.read_bytes() == before
+
+
+def test_v9_append_refuses_a_changed_stored_row(tmp_path):
+    cell, full, outfile = _growing_cell(tmp_path, last_cycle=8)
+    before = outfile.read_bytes()
+
+    raw = full.data.raw.copy()
+    potential = full.schema.raw.potential
+    raw.loc[10, potential] = raw.loc[10, potential] + 1.0
+    cell.data.raw = raw
+    # same row count and last data point, but not the stored rows
+    assert not cellpy_file_v9.append(cell.data, outfile)
+    assert outfile.read_bytes() == before
+
+
+def test_v9_failed_append_restores_the_file(tmp_path, monkeypatch):
+    cell, full, outfile = _growing_cell(tmp_path, last_cycle=8)
+    before = outfile.read_bytes()
+
+    def failing(frame, **kwargs):
+        raise RuntimeError("interrupted mid-append")
+
+    monkeypatch.setattr(cellpy_file_v9, "_frame_to_parquet_bytes", failing)
+    cell.data.raw = full.data.raw
+    with pytest.raises(RuntimeError):
+        cellpy_file_v9.append(cell.data, outfile)
+
+    assert outfile.read_bytes() == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["growing.cellpy"]
+
+
+def test_cell_save_append_falls_back_to_full_save(tmp_path):
+    cell, full, outfile = _growing_cell(tmp_path, last_cycle=8)
+
+    full.save(outfile, append=True)
+    with zipfile.ZipFile(outfile) as zf:
+        assert "raw_part_0001.parquet" in zf.namelist()
+
+    other = tmp_path / "fresh.cellpy"
+    full.save(other, append=True)
+    assert_data_frames_equal(load_cellpy_file(other).data.raw, full.data.raw)
+
+
+def test_cell_save_append_keeps_an_unrelated_file_without_overwrite(tmp_path):
+    cell, full, outfile = _growing_cell(tmp_path, last_cycle=8)
+    before = outfile.read_bytes()
+
+    # does not start with the stored raw data, so the append is refused
+    full.data.raw = full.data.raw.iloc[100:].reset_index(drop=True)
+    full.save(outfile, append=True, overwrite=False)
+    assert outfile.read_bytes() == before
+
+    h5file = tmp_path / "growing.h5"
+    cell.save(h5file)
+    before = h5file.read_bytes()
+    full.save(h5file, append=True, overwrite=False)
+    assert h5file.read_bytes() == before
+
+
+def test_v9_content_digests_tell_whether_a_rewrite_changes_anything(tmp_path):
+    source = _require_v8_with_fids()
+    cell = load_cellpy_file(source)
+    outfile = tmp_path / "digests.cellpy"
+    cellpy_file_v9.save(cell.data, outfile)
+
+    digests = cellpy_file_v9.read_meta(outfile)[cellpy_file_v9.CONTENT_DIGESTS_KEY]
+    assert set(digests) == {"raw", "steps", "summary", "fid", "meta"}
+    assert cellpy_file_v9.is_unchanged(cell.data, outfile)
+    # a cell loaded back from the file matches it too
+    assert cellpy_file_v9.is_unchanged(load_cellpy_file(outfile).data, outfile)
+
+    cell.data.summary.iloc[0, 1] = cell.data.summary.iloc[0, 1] + 1
+    assert not cellpy_file_v9.is_unchanged(cell.data, outfile)
+
+    other = load_cellpy_file(outfile)
+    other.data.mass = other.data.mass * 2
+    assert not cellpy_file_v9.is_unchanged(other.data, outfile)
+
+
+def test_save_skip_unchanged_leaves_the_file_alone(tmp_path, monkeypatch):
+    source = _require_v8_with_fids()
+    cell = load_cellpy_file(source)
+    outfile = tmp_path / "skip.cellpy"
+    cell.save(outfile)
+
+    writes = []
+    original_save = cellpy_file_v9.save
+    monkeypatch.setattr(
+        cellpy_file_v9,
+        "save",
+        lambda *args, **kwargs: writes.append(args) or original_save(*args, **kwargs),
+    )
+    cell.save(outfile, skip_unchanged=True)
+    assert writes == []
+
+    cell.data.summary.iloc[0, 1] = cell.data.summary.iloc[0, 1] + 1
+    cell.save(outfile, skip_unchanged=True)
+    assert len(writes) == 1
+    cell.save(outfile, skip_unchanged=True)
+    assert len(writes) == 1
+    # the digests do not tell the codec: an explicit profile is written
+    cell.save(outfile, skip_unchanged=True, compression="archive")
+    assert len(writes) == 2
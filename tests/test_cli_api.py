@@ -24,6 +24,7 @@ def test_every_extracted_command_is_importable():
     """Reachable from Python, which was the whole point."""
     for name in (
         "convert",
+        "convert_tree",
         "run_journal",
         "run_journals",
         "run_from_db",
@@ -288,6 +289,105 @@ def test_convert_really_upgrades_a_legacy_file(tmp_path, target):
     assert len(reloaded.data.raw) > 0
 
 
+@pytest.fixture
+def legacy_tree(tmp_path):
+    """A directory tree with two legacy cellpy-files and a broken one."""
+    import pathlib
+    import shutil
+
+    source = (
+        pathlib.Path(__file__).resolve().parents[1]
+        / "testdata"
+        / "hdf5"
+        / "20160805_test001_45_cc_v8_with_fids.h5"
+    )
+    if not source.is_file():
+        pytest.skip(f"missing legacy fixture {source}")
+    root = tmp_path / "archive"
+    (root / "sub").mkdir(parents=True)
+    shutil.copy(source, root / "a.h5")
+    shutil.copy(source, root / "sub" / "b.h5")
+    (root / "sub" / "broken.h5").write_bytes(b"not a cellpy-file")
+    return root
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_convert_tree_converts_verifies_and_reports(legacy_tree, jobs):
+    """Every file is converted beside its source, and the run is reported."""
+    import json
+
+    from cellpy import cellreader
+
+    report_path = legacy_tree / "report.json"
+    report = cli_api.convert_tree(legacy_tree, jobs=jobs, report=report_path)
+
+    assert [_file_name(r.destination) for r in report.converted] == [
+        "a_v9.cellpy",
+        "b_v9.cellpy",
+    ]
+    assert [_file_name(r.source) for r in report.failed] == ["broken.h5"]
+    assert all(r.file_version == 8 for r in report.converted)
+    reloaded = cellreader.CellpyCell().load(legacy_tree / "sub" / "b_v9.cellpy")
+    assert len(reloaded.data.raw) > 0
+
+    written = json.loads(report_path.read_text())
+    assert (written["converted"], written["skipped"], written["failed"]) == (2, 0, 1)
+    assert [r["status"] for r in written["records"]] == [
+        "converted",
+        "converted",
+        "failed",
+    ]
+
+
+def test_convert_tree_skips_files_already_converted(legacy_tree, tmp_path):
+    out = tmp_path / "converted"
+    cli_api.convert_tree(legacy_tree, out)
+    assert (out / "sub" / "b_v9.cellpy").is_file()
+
+    again = cli_api.convert_tree(legacy_tree, out)
+    assert len(again.skipped) == 2
+    assert not again.converted
+
+    # a destination with other fids is converted again
+    (out / "a_v9.cellpy").write_bytes(b"stale")
+    third = cli_api.convert_tree(legacy_tree, out)
+    assert [_file_name(r.source) for r in third.converted] == ["a.h5"]
+
+
+def test_convert_tree_converts_a_source_saved_again_since(legacy_tree, tmp_path):
+    import os
+
+    out = tmp_path / "converted"
+    cli_api.convert_tree(legacy_tree, out)
+
+    # re-processed and saved again: same raw-file ids, newer than its copy
+    written = (out / "a_v9.cellpy").stat().st_mtime_ns
+    os.utime(legacy_tree / "a.h5", ns=(written + 10**9, written + 10**9))
+    again = cli_api.convert_tree(legacy_tree, out)
+    assert [_file_name(r.source) for r in again.converted] == ["a.h5"]
+    assert [_file_name(r.source) for r in again.skipped] == ["b.h5"]
+
+
+def test_convert_verification_compares_the_key_raw_columns(legacy_tree):
+    from cellpy.parameters.internal_settings import get_headers_normal
+    from cellpy.readers.cellpy_file import load as cellpy_file_load
+
+    report = cli_api.convert_tree(legacy_tree, jobs=1)
+    destination = report.converted[0].destination
+    data = cellpy_file_load(legacy_tree / "a.h5").data
+    assert cli_api._verify_conversion(data, destination) == ""
+
+    cycle = get_headers_normal().cycle_index_txt
+    data.raw[cycle] = data.raw[cycle] + 1
+    assert cycle in cli_api._verify_conversion(data, destination)
+
+
+def _file_name(path: str) -> str:
+    import pathlib
+
+    return pathlib.Path(path).name
+
+
 # -- remaining commands (#651) ----------------------------------------------------
 
 
@@ -0,0 +1,97 @@
+"""CSV engines for the text loaders (instruments.csv_engines)."""
+
+from __future__ import annotations
+
+import warnings
+
+import pandas as pd
+import pytest
+
+from cellpy import cellreader
+from cellpy.readers.instruments import csv_engines
+from cellpy.readers.instruments.config_declarations import (
+    declarations_from_configuration,
+)
+from cellpy.readers.instruments.configurations import (
+    register_configuration_from_module,
+)
+
+MACCOR = "testdata/data/maccor_001.txt"
+MACCOR_FORMAT = dict(sep="\t", skiprows=3, header=0, encoding="ISO-8859-1")
+
+
+@pytest.fixture(scope="module")
+def maccor_declarations():
+    return declarations_from_configuration(register_configuration_from_module("one", "maccor_txt_one"))
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "polars"])
+def test_engines_read_what_pandas_reads(engine):
+    expected = csv_engines.read_csv(MACCOR, engine="pandas", **MACCOR_FORMAT)
+    frame = csv_engines.read_csv(MACCOR, engine=engine, **MACCOR_FORMAT)
+
+    # the duplicated " Units" headers are spelled the pandas way
+    assert list(frame.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(frame, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("engine", ["pandas", "pyarrow", "polars"])
+def test_declared_columns_and_dtype_hints(engine, maccor_declarations):
+    columns = csv_engines.declared_columns(maccor_declarations)
+    dtypes = csv_engines.dtype_hints(maccor_declarations)
+    assert dtypes["Volts"] == "float64"
+    assert "Rec#" in columns and "Aux #1" not in columns
+
+    frame = csv_engines.read_csv(MACCOR, engine=engine, columns=columns, dtypes=dtypes, **MACCOR_FORMAT)
+
+    assert set(frame.columns) == columns & set(frame.columns)
+    assert {"Rec#", "Volts", "Amps", "State", "DPt Time"} <= set(frame.columns)
+    assert frame["Volts"].dtype == "float64"
+
+
+def test_pandas_column_names():
+    names = csv_engines._pandas_column_names(["a", "", "a", "b", "a", "a.1"])
+    assert names == ["a", "Unnamed: 1", "a.2", "b", "a.3", "a.1"]
+
+
+def test_unreadable_files_fall_back_to_pandas(tmp_path):
+    source = tmp_path / "ragged.csv"
+    source.write_text("a;b;c\n1;2;3\n4;5\n", encoding="utf-8")
+
+    frame = csv_engines.read_csv(source, engine="pyarrow", sep=";")
+
+    pd.testing.assert_frame_equal(frame, pd.read_csv(source, sep=";"))
+
+
+def test_query_csv_works_for_loaders_without_column_hints():
+    from types import SimpleNamespace
+
+    from cellpy.readers.instruments.base import query_csv
+
+    loader = SimpleNamespace(csv_engine="pyarrow", decimal=".", thousands=None, **MACCOR_FORMAT)
+    frame = query_csv(loader, MACCOR)
+
+    expected = csv_engines.read_csv(MACCOR, engine="pyarrow", **MACCOR_FORMAT)
+    pd.testing.assert_frame_equal(frame, expected)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        csv_engines.check_engine("spark")
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "polars"])
+def test_txt_loader_with_engine_gives_the_same_cell(engine):
+    def load(**kwargs):
+        cell = cellreader.CellpyCell()
+        cell.set_instrument("maccor_txt", model="one", **kwargs)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cell.from_raw(MACCOR)
+        return cell
+
+    expected = load()
+    cell = load(csv_engine=engine, declared_columns_only=True)
+
+    assert cell.loader_class.csv_engine == engine
+    pd.testing.assert_frame_equal(cell.data.raw, expected.data.raw, check_dtype=False)
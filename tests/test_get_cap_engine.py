@@ -0,0 +1,51 @@
+"""Parity of the all-cycles get_cap engine with the cycle-by-cycle loop."""
+
+import pandas as pd
+import pytest
+
+from cellpy.readers import capacity_curves
+
+
+def _loop_only(monkeypatch):
+    monkeypatch.setattr(capacity_curves, "_get_cap_all_cycles", lambda *a, **k: None)
+
+
+@pytest.mark.parametrize("method", ["back-and-forth", "forth", "forth-and-forth"])
+@pytest.mark.parametrize("cycle_mode", ["cathode", "anode"])
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"insert_nan": True, "categorical_column": True, "label_cycle_number": True},
+        {"inter_cycle_shift": False, "capacity_then_voltage": True},
+        {"cycle": [3, 1, 2], "label_cycle_number": True},
+        {"cycle": [1, 2], "interpolated": True, "number_of_points": 50},
+        {"cycle": [1, 2], "interpolated": True, "interpolate_along_cap": True},
+        {"interpolated": True},
+        {"interpolated": True, "dx": 0.01, "insert_nan": True, "categorical_column": True},
+        {"interpolated": True, "interpolate_along_cap": True, "insert_nan": True, "label_cycle_number": True},
+        {"cycle": [3, 1, 9999], "interpolated": True, "number_of_points": 20, "label_cycle_number": True},
+    ],
+)
+def test_engine_matches_loop(cell, monkeypatch, method, cycle_mode, options):
+    kwargs = dict(method=method, cycle_mode=cycle_mode, mode="gravimetric", **options)
+    engine = cell.get_cap(**kwargs)
+    _loop_only(monkeypatch)
+    loop = cell.get_cap(**kwargs)
+    pd.testing.assert_frame_equal(engine, loop)
+
+
+def test_engine_skips_unknown_cycles(cell, monkeypatch):
+    engine = cell.get_cap(cycle=[1, 9999], label_cycle_number=True)
+    _loop_only(monkeypatch)
+    loop = cell.get_cap(cycle=[1, 9999], label_cycle_number=True)
+    pd.testing.assert_frame_equal(engine, loop)
+
+
+def test_engine_interpolates_without_the_loop(cell, monkeypatch):
+    def _no_loop(*args, **kwargs):
+        raise AssertionError("interpolated per curve")
+
+    monkeypatch.setattr(capacity_curves.ds, "interpolate_y_on_x_per_monotonic_segments", _no_loop)
+    curves = cell.get_cap(interpolated=True, number_of_points=20, label_cycle_number=True)
+    assert not curves.empty
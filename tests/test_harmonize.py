@@ -740,3 +740,103 @@ def test_no_datetime_kind_means_no_epoch_derivation():
     raw = harmonize(frame, _minimal_declarations(), test_id=1)
 
     assert raw[SCHEMA.epoch_time_utc].dtype == pl.Int64
+
+
+# -- lazy vendor frames ---------------------------------------------------------
+
+
+def _per_step_vendor_frame():
+    # Two cycles of two steps; the capacity resets at every step.
+    return _minimal_vendor_frame(
+        Rec=[1, 2, 3, 4, 5, 6, 7, 8],
+        Cyc=[0, 0, 0, 0, 1, 1, 1, 1],
+        Step=[1, 1, 2, 2, 1, 1, 2, 2],
+        T=["00:00:01", "00:00:02", "00:00:03", "00:00:04"] * 2,
+        Epoch=[1.6e9 + i for i in range(8)],
+        I=[0.1] * 8,
+        V=[3.0, 3.1, 3.2, 3.3, 3.0, 3.1, 3.2, 3.3],
+        QC=[0.1, 0.2, 0.1, 0.3, 0.2, 0.4, 0.1, 0.2],
+        QD=[0.0] * 8,
+        Junk=["x"] * 8,
+    )
+
+
+@pytest.mark.essential
+def test_a_lazy_vendor_frame_gives_the_same_raw_as_an_eager_one():
+    from cellpy.readers.instruments.hooks import cycle_number_not_zero
+
+    declarations = _minimal_declarations(
+        duration_columns=(SCHEMA.test_time,),
+        reset_granularity={
+            SCHEMA.cumulative_charge_capacity: ResetGranularity.PER_STEP,
+            SCHEMA.cumulative_discharge_capacity: ResetGranularity.PER_TEST,
+        },
+        post_hooks=(cycle_number_not_zero(cycle_column="Cyc"),),
+    )
+    frame = _per_step_vendor_frame()
+
+    eager = harmonize(frame, declarations, test_id=1)
+    for engine in (None, "in-memory"):
+        lazy = harmonize(frame.lazy(), declarations, test_id=1, engine=engine)
+        assert lazy.equals(eager), engine
+
+    assert eager[SCHEMA.cycle_num].to_list() == [1, 1, 1, 1, 2, 2, 2, 2]
+    assert eager[SCHEMA.cumulative_charge_capacity].to_list() == pytest.approx(
+        [0.1, 0.2, 0.3, 0.5, 0.2, 0.4, 0.5, 0.6]
+    )
+
+
+@pytest.mark.essential
+def test_undeclared_columns_are_not_read_from_a_lazy_scan(tmp_path):
+    """Only the declared columns reach the scan.
+
+    ``Junk`` is scanned as an integer but holds text, so the query could not
+    run if the column were read at all.
+    """
+    source = tmp_path / "vendor.csv"
+    frame = _minimal_vendor_frame(Junk=["not", "numbers"])
+    frame.write_csv(source)
+    scan = pl.scan_csv(source, schema_overrides={"Junk": pl.Int64})
+    with pytest.raises(pl.exceptions.ComputeError):
+        scan.collect()
+
+    raw = harmonize(scan, _minimal_declarations(dropped=("Junk",)), test_id=1)
+
+    assert raw.height == 2
+    assert "Junk" not in raw.columns
+
+
+@pytest.mark.essential
+def test_the_data_checks_run_on_a_lazy_vendor_frame():
+    frame = _minimal_vendor_frame(T=["not a duration", "00:01:00"])
+    declarations = _minimal_declarations(duration_columns=(SCHEMA.test_time,))
+    with pytest.raises(LoaderError, match="could not be parsed as an elapsed time"):
+        harmonize(frame.lazy(), declarations, test_id=1)
+
+    frame = _minimal_vendor_frame(T=["00:01:00", "00:02:00"])
+    with pytest.raises(LoaderError, match="emptied column"):
+        harmonize(frame.lazy(), _minimal_declarations(), test_id=1)
+
+    raw = harmonize(_minimal_vendor_frame().lazy(), _minimal_declarations(), test_id=1)
+    assert not [column for column in raw.columns if column.startswith("__")]
+
+
+@pytest.mark.essential
+def test_the_maccor_pilot_parses_lazily(tmp_path):
+    from cellpy.readers.instruments.maccor_txt_native import MaccorTxtLoader
+
+    header = "Rec#\tCyc#\tStep\tTestTime\tStepTime\tmAmp-hr\tmWatt-hr\tmAmps\tVolts\tState\tES\tDPt Time"
+    rows = [
+        "1\t0\t1\t  0d 00:00:01.00\t  0d 00:00:01.00\t0.5\t0\t100\t3000\tC\t0\t01/02/2020 01:00:01 PM",
+        "2\t0\t2\t  0d 00:00:02.00\t  0d 00:00:01.00\t0.25\t0\t-100\t2900\tD\t0\t01/02/2020 01:00:02 PM",
+    ]
+    source = tmp_path / "maccor_three.txt"
+    preamble = ["Today's Date\t01/02/2020", "Filename:\tmaccor_three", "Procedure:\tcycling", "Comment:"]
+    source.write_text("\n".join([*preamble, header, *rows]) + "\n", encoding="utf-8")
+    loader = MaccorTxtLoader()
+
+    assert isinstance(loader.parse(source), pl.LazyFrame)
+    raw = loader.load(source)[0].raw
+    assert raw[SCHEMA.test_time].to_list() == [1.0, 2.0]
+    assert raw[SCHEMA.cumulative_charge_capacity].to_list() == [0.5, 0.5]
+    assert raw[SCHEMA.cumulative_discharge_capacity].to_list() == [0.0, 0.25]
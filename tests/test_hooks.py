@@ -363,3 +363,40 @@ def test_forward_fill_skips_absent_columns():
     out = forward_fill(columns=("ir",))(frame)
 
     assert out.columns == ["other"]
+
+
+# -- lazy frames ---------------------------------------------------------------
+
+
+@pytest.mark.essential
+@pytest.mark.parametrize(
+    "hook, frame",
+    [
+        (
+            state_splitter(
+                base_column="Q",
+                charge_output="q_charge",
+                discharge_output="q_discharge",
+                **COMMON,
+            ),
+            _frame(["C", "R", "C", "D", "R"], [1.0, 0.0, 2.0, 0.5, 0.0]),
+        ),
+        (cycle_number_not_zero(cycle_column="Cyc"), _cycles([0, 0, 1, 2])),
+        (cycle_number_not_zero(cycle_column="Cyc"), _cycles([2, 3, 4])),
+        (
+            drop_last_row_if_worse(columns=("a", "b")),
+            _tail_frame([(1.0, 1.0, 1.0), (2.0, float("nan"), 2.0)]),
+        ),
+        (
+            drop_last_row_if_worse(columns=("a", "b")),
+            _tail_frame([(1.0, None, 1.0), (2.0, None, 2.0)]),
+        ),
+        (forward_fill(columns=("ir",)), pl.DataFrame({"ir": [None, 1.0, None]})),
+    ],
+)
+def test_a_lazy_frame_is_hooked_like_an_eager_one(hook, frame):
+    """``harmonize()`` hands hooks a ``LazyFrame`` when ``parse()`` returns one."""
+    out = hook(frame.lazy())
+
+    assert isinstance(out, pl.LazyFrame)
+    assert out.collect().equals(hook(frame))
@@ -0,0 +1,113 @@
+"""The on-disk cache of harmonized raw frames (``config.reader.parse_cache_dir``)."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import warnings
+
+import pandas as pd
+import pytest
+
+import cellpy.config as config
+from cellpy import cellreader
+from cellpy.readers import data_structures as ds
+from cellpy.readers.parse_cache import ParseCache, cache_key
+
+SOURCE = "testdata/data/neware_uio.csv"
+
+
+@pytest.fixture
+def parse_cache_dir(tmp_path):
+    previous = getattr(config.reader, "parse_cache_dir", None)
+    config.reader.parse_cache_dir = str(tmp_path / "parse_cache")
+    try:
+        yield tmp_path / "parse_cache"
+    finally:
+        config.reader.parse_cache_dir = previous
+
+
+def _from_raw(source=SOURCE, **kwargs):
+    cell = cellreader.CellpyCell()
+    cell.set_instrument("neware_txt")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        cell.from_raw(source, **kwargs)
+    return cell
+
+
+def _refuse_parsing(cell):
+    def refuse(*args, **kwargs):
+        raise AssertionError("the vendor file was parsed")
+
+    cell.loader_class.parse = refuse
+    cell.loader = refuse
+
+
+def test_second_load_comes_from_the_cache(parse_cache_dir):
+    first = _from_raw()
+    assert len(ParseCache(parse_cache_dir).entries()) == 1
+
+    second = cellreader.CellpyCell()
+    second.set_instrument("neware_txt")
+    _refuse_parsing(second)
+    second.from_raw(SOURCE)
+
+    pd.testing.assert_frame_equal(second.data.raw, first.data.raw)
+    assert vars(second.data.meta_test_dependent) == vars(first.data.meta_test_dependent)
+    assert second.data.start_datetime == first.data.start_datetime
+    assert second.data.raw_data_files_length == first.data.raw_data_files_length
+    assert second.data.raw_data_files[0].last_data_point == len(first.data.raw)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        first.make_summary()
+        second.make_summary()
+    pd.testing.assert_frame_equal(second.data.summary, first.data.summary)
+
+
+def test_a_changed_file_or_loader_knob_is_a_miss(parse_cache_dir, tmp_path):
+    source = tmp_path / "neware.csv"
+    shutil.copy(SOURCE, source)
+    _from_raw(source)
+    _from_raw(source, data_points=(1, 100))
+    assert len(ParseCache(parse_cache_dir).entries()) == 2
+
+    with open(source, "a", encoding="ascii") as handle:
+        handle.write("\n")
+    _from_raw(source)
+    assert len(ParseCache(parse_cache_dir).entries()) == 3
+
+
+def test_an_edit_past_the_hashed_head_is_a_miss(tmp_path):
+    source = tmp_path / "large.csv"
+    source.write_bytes(b"0" * (2 * 1024 * 1024))
+    os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+    before = cache_key(source, object())
+
+    with open(source, "r+b") as handle:
+        handle.seek(-1, os.SEEK_END)
+        handle.write(b"1")
+    os.utime(source, ns=(2_000_000_000, 2_000_000_000))
+
+    assert cache_key(source, object()) != before
+
+
+def test_no_cache_without_a_cache_dir(tmp_path):
+    assert getattr(config.reader, "parse_cache_dir", None) is None
+    assert ParseCache.from_config() is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    raw = pd.DataFrame({"datapoint_num": range(1000), "potential": 1.0})
+    cache = ParseCache(tmp_path, max_size=None)
+    for age, key in enumerate(("old", "used", "new")):
+        cache.put(key, raw, ds.Data())
+        os.utime(cache.entry_path(key), (age, age))
+    assert cache.get("used", SOURCE) is not None  # touched: now the newest
+
+    cache.max_size = cache.size() - 1
+    evicted = cache.evict()
+
+    assert evicted == [cache.entry_path("old")]
+    assert [path.stem for path in cache.entries()] == ["new", "used"]
@@ -0,0 +1,82 @@
+"""Tests for the cycle/step row-range index over the raw frame."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cellpy.readers import data_structures as ds
+from cellpy.readers.raw_index import RawIndex
+
+
+def _raw():
+    # cycle 1: steps 1, 2, 1 (step 1 repeated in a second run); cycle 2: 1, 3
+    return pd.DataFrame(
+        {
+            "cycle_num": [1, 1, 1, 1, 1, 1, 2, 2, 2],
+            "step_num": [1, 1, 2, 2, 1, 1, 1, 3, 3],
+            "potential": np.arange(9, dtype=float),
+        }
+    )
+
+
+def _mask(raw, cycles, steps=None):
+    m = raw["cycle_num"].isin(cycles)
+    if steps is not None:
+        m &= raw["step_num"].isin(steps)
+    return raw[m]
+
+
+def test_runs_are_recorded_in_row_order():
+    index = RawIndex(_raw(), "cycle_num", "step_num")
+    assert list(index.starts) == [0, 2, 4, 6, 7]
+    assert list(index.stops) == [2, 4, 6, 7, 9]
+    assert index.cycle_ranges() == {1: (0, 6), 2: (6, 9)}
+
+
+@pytest.mark.parametrize(
+    "cycles, steps",
+    [([1], [1]), ([1], [2]), ([1], [1, 2]), ([2], None), ([1, 2], [1]), ([3], None), ([2], [2])],
+)
+def test_selection_matches_boolean_mask(cycles, steps):
+    raw = _raw()
+    index = RawIndex(raw, "cycle_num", "step_num")
+    selected = raw.iloc[index.rows_for_cycles(cycles, steps)]
+    pd.testing.assert_frame_equal(selected, _mask(raw, cycles, steps))
+
+
+def test_single_run_is_a_slice():
+    index = RawIndex(_raw(), "cycle_num", "step_num")
+    assert index.rows(1, 2) == slice(2, 4)
+
+
+def test_data_drops_the_index_when_raw_is_replaced():
+    data = ds.Data()
+    data.raw = _raw()
+    first = data.raw_index("cycle_num", "step_num")
+    assert data.raw_index("cycle_num", "step_num") is first
+    data.raw = _raw()
+    assert data.raw_index("cycle_num", "step_num") is not first
+
+
+def test_data_rebuilds_the_index_after_in_place_edits():
+    data = ds.Data()
+    data.raw = _raw()
+    first = data.raw_index("cycle_num", "step_num")
+    data.raw.loc[data.raw.index[-2:], "cycle_num"] = 3
+    index = data.raw_index("cycle_num", "step_num")
+    assert index is not first
+    assert index.rows(3) == slice(7, 9)
+
+
+def test_select_step_matches_boolean_mask(dataset):
+    raw = dataset.data.raw
+    c_hdr = dataset.schema.raw.cycle_num
+    s_hdr = dataset.schema.raw.step_num
+    for cycle, steps in dataset.get_step_numbers().items():
+        for step in steps:
+            expected = raw[(raw[c_hdr] == cycle) & (raw[s_hdr] == step)]
+            selected = dataset._select_step(cycle, step)
+            if expected.empty:
+                assert selected is None
+            else:
+                pd.testing.assert_frame_equal(selected, expected)